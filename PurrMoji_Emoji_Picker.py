@@ -99,8 +99,9 @@ def check_and_extract_packages(app):
     
     # Check if any package needs extraction
     packages_needed = []
+    manifest = extractor.load_manifest()
     for package_name in extractor.PACKAGE_CONFIG.keys():
-        if not extractor.is_package_extracted(package_name):
+        if extractor.needs_extraction(package_name, manifest):
             packages_needed.append(package_name)
     
     # If all packages are already extracted, return success
@@ -108,7 +109,7 @@ def check_and_extract_packages(app):
         return True
     
     # Show extraction dialog
-    dialog = ExtractionDialog()
+    dialog = ExtractionDialog(extractor=extractor)
     dialog.show()
     app.processEvents()
     
@@ -11,6 +11,7 @@ Provides modular components for path management, data persistence, caching, and
 from .path_manager import PathManager
 from .data_manager import DataManager
 from .cache_manager import CacheManager
+from .disk_cache_manager import DiskCacheManager
 from .emoji_manager import EmojiManager
 from .package_manager import PackageManager
 from .package_initializer import PackageInitializer
@@ -21,6 +22,7 @@ __all__ = [
     'PathManager',
     'DataManager',
     'CacheManager',
+    'DiskCacheManager',
     'EmojiManager',
     'PackageManager',
     'PackageInitializer',
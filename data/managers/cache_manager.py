@@ -19,6 +19,12 @@ class CacheManager:
         """
         self.icon_cache = {}
         self.max_size = max_size
+        # Category tab icons, kept apart from the emoji icons so their keys need
+        # no prefix: (emoji_code, size, folder or package, color mode, inverted) -> QIcon.
+        # There are only a few dozen of them, so no size management is needed
+        self.category_icon_cache = {}
+        # EmojiTwo component category icons by source file ((path, size) -> QIcon)
+        self.component_icon_cache = {}
     
     def get(self, key):
         """Get an item from the cache
@@ -62,6 +68,8 @@ class CacheManager:
         else:
             # Clear everything
             self.icon_cache.clear()
+            self.category_icon_cache.clear()
+            self.component_icon_cache.clear()
     
     def size(self):
         """Get current cache size
@@ -9,6 +9,15 @@ DataManager - Centralized JSON data management for PurrMoji
 
 import json
 
+# Use orjson for parsing when it is installed (much faster on the large
+# emoji_data.json), falling back to the standard library.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # Emoji category names
 EMOJI_CATEGORIES = [
@@ -78,8 +87,8 @@ class DataManager:
             bool: True if loading succeeded, False otherwise
         """
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = _json_loads(f.read())
                 
                 # Load core data
                 self.emoji_data = data.get('categories', {})
@@ -156,8 +165,8 @@ class DataManager:
         
         try:
             # Load existing data
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                data = _json_loads(f.read())
             
             # Update data
             data[key] = value
@@ -195,6 +204,21 @@ class DataManager:
         """
         return self.saved_settings.get(key, default)
     
+    def get_restored_setting(self, preference_key, default, setting_key=None):
+        """Get a saved setting only if its save preference is enabled
+        
+        Args:
+            preference_key: The save preference key
+            default: Value returned when the preference is disabled or the setting is missing
+            setting_key: The setting key (defaults to preference_key)
+        
+        Returns:
+            The saved setting value or default
+        """
+        if not self.save_preferences.get(preference_key):
+            return default
+        return self.saved_settings.get(setting_key or preference_key, default)
+    
     def update_emoji_usage(self, emoji):
         """Update the usage count for an emoji and refresh frequently used list
         
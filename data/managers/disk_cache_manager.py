@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-FileCopyrightText: Copyright (C) 2025 xan2622
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+DiskCacheManager - Persistent byte cache for rendered emoji icons
+"""
+
+import os
+import sys
+import hashlib
+
+
+# Bump when the rendering or the key layout changes: entries of older
+# versions live in another directory and are never read again
+CACHE_VERSION = 1
+
+
+class DiskCacheManager:
+    """Stores rendered icons as PNG bytes on disk so they survive restarts"""
+    
+    def __init__(self, cache_dir, max_bytes=64 * 1024 * 1024):
+        """Initialize disk cache manager
+        
+        Args:
+            cache_dir: Base cache directory of the application
+            max_bytes: Size the cache is pruned back to (see prune)
+        """
+        self.cache_dir = os.path.join(cache_dir, f"icons-v{CACHE_VERSION}")
+        self.max_bytes = max_bytes
+        self._dir_ready = False
+        # Writes stop after the first failure (read-only or full cache directory)
+        self.writable = True
+        # Entries whose modification time was already refreshed this session
+        self._touched = set()
+    
+    def _path_for(self, key):
+        """Get the file path storing a cache key
+        
+        Args:
+            key: Cache key (tuple of str/int/bool values)
+        
+        Returns:
+            str: Path of the PNG file for the key
+        """
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".png")
+    
+    def get(self, key):
+        """Get the bytes stored for a key
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            bytes or None if not cached
+        """
+        path = self._path_for(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        # Refresh the modification time so prune() evicts least recently used
+        # entries; once per entry and session is enough for that ordering
+        if path not in self._touched:
+            self._touched.add(path)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return data
+    
+    def set(self, key, data):
+        """Store bytes for a key
+        
+        Args:
+            key: Cache key
+            data: PNG bytes to store
+        
+        Note:
+            Written to a temporary file then renamed, so a crash never
+            leaves a truncated entry behind. The first failure is reported
+            and disables further writes: the cache is only an optimization.
+        """
+        if not self.writable:
+            return
+        path = self._path_for(key)
+        tmp_path = path + ".tmp"
+        try:
+            if not self._dir_ready:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self._dir_ready = True
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._touched.add(path)
+        except OSError as e:
+            self.writable = False
+            print(f"[ERROR] Failed to write icon cache entry, disk cache disabled: {e}", file=sys.stderr)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def prune(self):
+        """Delete the least recently used entries until the cache fits in max_bytes
+        
+        Note:
+            Uses modification times (refreshed by get) rather than access times,
+            which are not updated on most systems (noatime/relatime mounts).
+        """
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        except OSError:
+            return
+        
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
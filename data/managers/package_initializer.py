@@ -52,7 +52,8 @@ class PackageStrategy:
     
     def initialize_emoji_data(self, picker):
         """Initialize emoji folder and mapping"""
-        picker.update_emoji_folder()
+        # The grid is populated once by finalize(), after the categories are set up
+        picker.update_emoji_folder(refresh=False)
         picker.emoji_to_filename, picker.compound_emoji_variations = \
             picker.emoji_manager.create_emoji_mapping(picker.emoji_folder)
         picker.update_category_button_icons()
@@ -93,6 +94,9 @@ class CustomPackageStrategy(PackageStrategy):
         picker.update_search_filter_ui_state(True)
         picker.variation_filter_combo.setEnabled(False)
         
+        # Rescan the custom folder, the user may have added files since it was listed
+        picker.forget_folder_listing(picker.emoji_folder)
+        
         # Create emoji mapping for custom files
         picker.emoji_to_filename, picker.compound_emoji_variations = \
             picker.emoji_manager.create_emoji_mapping(picker.emoji_folder)
@@ -10,6 +10,7 @@ PathManager - Centralized path management for emoji packages
 import os
 import sys
 import platform
+from types import MappingProxyType
 
 
 class PathManager:
@@ -38,6 +39,12 @@ class PathManager:
         
         # Source packages directory (for non-ZIP packages like Noto and Custom)
         self.source_packages_dir = os.path.join(self.base_dir, "emoji_packages")
+        
+        # Cache of resolved misc files (filename -> path, or None if missing)
+        self._resolved_misc_files = {}
+        
+        # Table of all emoji folder paths, built on first use (see build_all_paths)
+        self._all_paths = None
     
     def get_user_packages_dir(self):
         """Get the user directory where packages are extracted
@@ -65,6 +72,30 @@ class PathManager:
         os.makedirs(packages_dir, exist_ok=True)
         return packages_dir
     
+    def get_user_cache_dir(self):
+        """Get the user directory for disposable caches (rendered icons)
+        
+        Returns:
+            str: Path to the user cache directory (created on first write)
+        """
+        system = platform.system()
+        
+        if system == "Windows":
+            # %LOCALAPPDATA%/PurrMoji/cache/
+            base_dir = os.environ.get('LOCALAPPDATA')
+            if not base_dir:
+                base_dir = os.path.expanduser('~\\AppData\\Local')
+            return os.path.join(base_dir, 'PurrMoji', 'cache')
+        elif system == "Darwin":  # macOS
+            # ~/Library/Caches/PurrMoji/
+            return os.path.join(os.path.expanduser('~/Library/Caches'), 'PurrMoji')
+        else:  # Linux and others
+            # ~/.cache/PurrMoji/
+            base_dir = os.environ.get('XDG_CACHE_HOME')
+            if not base_dir:
+                base_dir = os.path.expanduser('~/.cache')
+            return os.path.join(base_dir, 'PurrMoji')
+    
     def join(self, *parts):
         """Helper to join paths from packages directory"""
         return os.path.join(self.packages_dir, *parts)
@@ -178,6 +209,23 @@ class PathManager:
         """
         return os.path.join(self.base_dir, "misc", filename)
     
+    def resolve_misc_file(self, filename):
+        """Get misc file path if the file exists, caching the result
+        
+        Args:
+            filename: Name of the file in misc folder
+        
+        Returns:
+            str: Path to the misc file, or None if it does not exist
+        """
+        try:
+            return self._resolved_misc_files[filename]
+        except KeyError:
+            path = self.get_misc_file(filename)
+            resolved = path if os.path.exists(path) else None
+            self._resolved_misc_files[filename] = resolved
+            return resolved
+    
     # Unified path getter
     def get_package_path(self, package_name, color_mode, format_type, size=None):
         """Unified method to get package path for any emoji package
@@ -208,6 +256,20 @@ class PathManager:
     def build_all_paths(self):
         """Build complete emoji_folders dictionary for backward compatibility
         
+        Returns:
+            MappingProxyType: Read-only mapping of all emoji folder paths
+        
+        Note:
+            The paths only depend on the install location, so the table is built
+            once per PathManager and shared by every caller (including get_path)
+        """
+        if self._all_paths is None:
+            self._all_paths = MappingProxyType(self._build_paths_table())
+        return self._all_paths
+    
+    def _build_paths_table(self):
+        """Compute the dictionary of all emoji folder paths
+        
         Returns:
             dict: Complete dictionary of all emoji folder paths
         """
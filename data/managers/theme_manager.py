@@ -8,6 +8,8 @@ Theme Manager for PurrMoji Emoji Picker
 Provides theme styles (Light/Dark) for the application and all dialogs.
 """
 
+import functools
+
 
 class ThemeManager:
     """Manages application themes (Light/Dark)"""
@@ -20,6 +22,9 @@ class ThemeManager:
     # Available themes
     AVAILABLE_THEMES = [THEME_LIGHT, THEME_MEDIUM, THEME_DARK]
     
+    # Themes with a dark background (white icons, dark title bar)
+    DARK_THEMES = frozenset((THEME_DARK, THEME_MEDIUM))
+    
     # Dark theme color palette
     class DarkColors:
         BG_PRIMARY = "#202020"
@@ -209,7 +214,7 @@ class ThemeManager:
             Light theme uses native Windows 11 style with custom colors.
             Medium and Dark themes apply modern themed styles.
         """
-        if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM]:
+        if theme in ThemeManager.DARK_THEMES:
             dc = ThemeManager.get_colors(theme)
             # Calculate optimal text color for custom background color
             selection_text_color = ThemeManager.get_text_color_for_background(category_subcategory_color)
@@ -359,7 +364,7 @@ class ThemeManager:
             Light theme uses native Windows 11 style with custom colors.
             Medium and Dark themes apply modern themed styles.
         """
-        if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM]:
+        if theme in ThemeManager.DARK_THEMES:
             dc = ThemeManager.get_colors(theme)
             # Calculate optimal text color for custom background color
             selection_text_color = ThemeManager.get_text_color_for_background(category_subcategory_color)
@@ -537,7 +542,12 @@ class ThemeManager:
                 }}
             """
     
+    # The per-button stylesheet getters below are memoized: they are pure
+    # functions of (theme, color) and are called once per button on every
+    # restyle, so identical calls return the same cached string
+    
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_emoji_button_stylesheet(theme, background_color='#ffffff'):
         """Get stylesheet for emoji buttons in grid
         
@@ -552,7 +562,7 @@ class ThemeManager:
             Uses Windows 11 style with subtle borders and hover effects
             In dark/medium themes, if background is white, use theme container color
         """
-        if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM]:
+        if theme in ThemeManager.DARK_THEMES:
             dc = ThemeManager.get_colors(theme)
             display_bg = dc.BG_SECONDARY if background_color in ['#ffffff', '#fff', 'white'] else background_color
             return ThemeManager.create_button_style(
@@ -571,6 +581,7 @@ class ThemeManager:
             )
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_emoji_button_selected_stylesheet(theme, selection_color='#3699e7'):
         """Get stylesheet for selected emoji button
         
@@ -584,6 +595,7 @@ class ThemeManager:
         return ThemeManager.create_solid_button_style(selection_color, border_width="2px", padding="0px")
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_active_button_stylesheet(theme, active_color='#3699e7'):
         """Get stylesheet for active subcategory/category buttons
         
@@ -597,6 +609,7 @@ class ThemeManager:
         return ThemeManager.create_solid_button_style(active_color, padding="5px")
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_inactive_button_stylesheet(theme):
         """Get stylesheet for inactive subcategory buttons
         
@@ -609,7 +622,7 @@ class ThemeManager:
         Note:
             Uses Windows 11 style with subtle borders and hover effects
         """
-        if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM]:
+        if theme in ThemeManager.DARK_THEMES:
             dc = ThemeManager.get_colors(theme)
             return ThemeManager.create_button_style(
                 dc.BG_SECONDARY, dc.TEXT_PRIMARY, dc.BORDER_PRIMARY,
@@ -626,6 +639,7 @@ class ThemeManager:
             )
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_active_category_stylesheet(theme, active_color='#3699e7'):
         """Get stylesheet for active category buttons
         
@@ -639,6 +653,7 @@ class ThemeManager:
         return ThemeManager.create_solid_button_style(active_color, border_width="2px", border_radius="5px", padding="0px")
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_inactive_category_stylesheet(theme):
         """Get stylesheet for inactive category buttons
         
@@ -651,7 +666,7 @@ class ThemeManager:
         Note:
             Uses Windows 11 style with subtle borders and hover effects
         """
-        if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM]:
+        if theme in ThemeManager.DARK_THEMES:
             dc = ThemeManager.get_colors(theme)
             return ThemeManager.create_button_style(
                 dc.BG_SECONDARY, dc.TEXT_PRIMARY, dc.BORDER_PRIMARY,
@@ -669,6 +684,7 @@ class ThemeManager:
             )
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def get_disabled_radio_stylesheet(theme):
         """Get stylesheet for disabled radio buttons
         
@@ -681,7 +697,7 @@ class ThemeManager:
         Note:
             Uses Windows 11 Fluent Design style for disabled state
         """
-        if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM]:
+        if theme in ThemeManager.DARK_THEMES:
             dc = ThemeManager.get_colors(theme)
             return f"""
                 QRadioButton:disabled {{
@@ -705,11 +721,13 @@ class ThemeManager:
             """
     
     @staticmethod
-    def get_search_edit_stylesheet(theme):
+    def get_search_edit_stylesheet(theme, selector="QLineEdit"):
         """Get stylesheet for search input field
         
         Args:
             theme: Theme name (Light, Medium, or Dark)
+            selector: Widget selector the rules apply to (e.g. "QLineEdit#SearchEdit"
+                to include them in a parent stylesheet)
         
         Returns:
             str: Stylesheet string for QLineEdit (search field)
@@ -720,7 +738,7 @@ class ThemeManager:
         """
         dc = ThemeManager.get_colors(theme)
         return f"""
-            QLineEdit {{
+            {selector} {{
                 background-color: {dc.BG_SECONDARY};
                 color: {dc.TEXT_PRIMARY};
                 border: 1px solid {dc.BORDER_PRIMARY};
@@ -729,20 +747,22 @@ class ThemeManager:
                 min-height: 20px;
                 height: 30px;
             }}
-            QLineEdit:hover {{
+            {selector}:hover {{
                 border: 1px solid {dc.BORDER_HOVER};
             }}
-            QLineEdit:focus {{
+            {selector}:focus {{
                 border: 1px solid {dc.ACCENT_PURPLE};
             }}
         """
     
     @staticmethod
-    def get_size_input_stylesheet(theme):
+    def get_size_input_stylesheet(theme, selector="QLineEdit"):
         """Get stylesheet for size input field
         
         Args:
             theme: Theme name (Light, Medium, or Dark)
+            selector: Widget selector the rules apply to (e.g. "QLineEdit#SizeInput"
+                to include them in a parent stylesheet)
         
         Returns:
             str: Stylesheet string for QLineEdit (size input field)
@@ -754,7 +774,7 @@ class ThemeManager:
         """
         dc = ThemeManager.get_colors(theme)
         return f"""
-            QLineEdit {{
+            {selector} {{
                 background-color: {dc.BG_SECONDARY};
                 color: {dc.TEXT_PRIMARY};
                 border: 1px solid {dc.BORDER_PRIMARY};
@@ -763,10 +783,10 @@ class ThemeManager:
                 min-height: 5px;
                 height: 15px;
             }}
-            QLineEdit:hover {{
+            {selector}:hover {{
                 border: 1px solid {dc.BORDER_HOVER};
             }}
-            QLineEdit:focus {{
+            {selector}:focus {{
                 border: 1px solid {dc.ACCENT_PURPLE};
             }}
         """
@@ -9,13 +9,45 @@ ZipExtractor - Manages extraction of emoji packages from ZIP archives
 
 import os
 import sys
+import json
+import shutil
 import zipfile
 import platform
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+
+# os.copy_file_range is only available on Linux (kernel 4.5+, Python 3.8+)
+_HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+# Size of the fixed part of a ZIP local file header
+_LOCAL_HEADER_SIZE = 30
+
+# os.posix_fallocate is only available on Unix
+_HAS_POSIX_FALLOCATE = hasattr(os, "posix_fallocate")
+
+# Members smaller than this are written without preallocation: the extra
+# syscall costs more than it saves for typical few-KB emoji files
+_PREALLOCATE_MIN_SIZE = 64 * 1024
 
 
 class ZipExtractor:
     """Manages extraction of emoji package ZIP archives to user directory"""
     
+    # Buffer size for reading ZIP archives and writing extracted files (1 MiB)
+    BUFFER_SIZE = 1 << 20
+    
+    # Marker files written in each package directory: the in-progress marker
+    # flags an interrupted extraction, the OK marker a completed one
+    EXTRACTING_MARKER = ".extracting"
+    EXTRACTED_MARKER = ".extracted-ok"
+    
+    # Manifest recording the (size, mtime) of the ZIP archives each package
+    # was extracted from, stored in the user packages directory
+    MANIFEST_NAME = "extracted.json"
+    
     # Allowed file extensions for extraction (only emoji files)
     ALLOWED_EXTENSIONS = {'.png', '.svg', '.ttf', '.otf', '.woff', '.woff2'}
     
@@ -51,10 +83,18 @@ class ZipExtractor:
         }
     }
     
-    def __init__(self):
-        """Initialize ZipExtractor with source and target directories"""
+    def __init__(self, buffer_size=None, verify_stored_crc=False):
+        """Initialize ZipExtractor with source and target directories
+        
+        Args:
+            buffer_size: Optional I/O buffer size in bytes (defaults to BUFFER_SIZE)
+            verify_stored_crc: Read back members copied with os.copy_file_range
+                to check their CRC (off by default: it reads every byte again)
+        """
         self.source_packages_dir = self.get_source_packages_dir()
         self.user_packages_dir = self.calculate_user_packages_dir()
+        self.buffer_size = buffer_size or self.BUFFER_SIZE
+        self.verify_stored_crc = verify_stored_crc
     
     def should_extract_file(self, file_path):
         """Check if a file should be extracted based on its extension
@@ -83,6 +123,135 @@ class ZipExtractor:
         # Check if extension is allowed for emoji files
         return file_ext in self.ALLOWED_EXTENSIONS
     
+    def extract_member(self, zip_ref, member_name, target_dir, created_dirs=None):
+        """Extract a single archive member using large buffered reads/writes
+        
+        Args:
+            zip_ref: Open ZipFile
+            member_name: Name of the member in the archive
+            target_dir: Directory to extract into
+            created_dirs: Optional set of directories already created (avoids repeated makedirs)
+        
+        Returns:
+            str: Path of the extracted file
+        """
+        # Sanitize the member path like ZipFile.extract does (no drive, no '..')
+        arcname = os.path.splitdrive(member_name.replace('\\', '/'))[1]
+        parts = [part for part in arcname.split('/') if part not in ('', '.', '..')]
+        target_path = os.path.join(target_dir, *parts)
+        
+        parent_dir = os.path.dirname(target_path)
+        if created_dirs is None or parent_dir not in created_dirs:
+            os.makedirs(parent_dir, exist_ok=True)
+            if created_dirs is not None:
+                created_dirs.add(parent_dir)
+        
+        # Uncompressed (STORED) members can be copied by the kernel straight
+        # from the archive to the output file on Linux
+        info = zip_ref.getinfo(member_name)
+        if (_HAS_COPY_FILE_RANGE and info.compress_type == zipfile.ZIP_STORED
+                and not info.flag_bits & 0x1
+                and self.copy_stored_member(zip_ref, info, target_path)):
+            return target_path
+        
+        with zip_ref.open(info) as src, open(target_path, 'wb', buffering=self.buffer_size) as dst:
+            self.preallocate(dst, info.file_size)
+            shutil.copyfileobj(src, dst, self.buffer_size)
+        
+        return target_path
+    
+    def copy_stored_member(self, zip_ref, info, target_path):
+        """Copy an uncompressed member with os.copy_file_range (zero-copy)
+        
+        Args:
+            zip_ref: Open ZipFile
+            info: ZipInfo of a STORED, unencrypted member
+            target_path: Output file path
+        
+        Returns:
+            bool: True if copied (and, with verify_stored_crc, the CRC matches),
+                False if the caller should fall back to a regular copy
+        
+        Note:
+            Unlike ZipFile.open(), the CRC is only verified when verify_stored_crc
+            is set, since that means reading the copied data back in Python
+        """
+        try:
+            src_fd = zip_ref.fp.fileno()
+            # Local file header: 30 fixed bytes, then file name and extra field
+            header = os.pread(src_fd, _LOCAL_HEADER_SIZE, info.header_offset)
+            if len(header) != _LOCAL_HEADER_SIZE or header[:4] != b"PK\x03\x04":
+                return False
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            data_start = info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+            
+            with open(target_path, 'w+b') as dst:
+                self.preallocate(dst, info.file_size)
+                dst_fd = dst.fileno()
+                remaining = info.file_size
+                offset = data_start
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+                    remaining -= copied
+                if remaining != 0:
+                    return False
+                if not self.verify_stored_crc:
+                    return True
+                
+                # copy_file_range bypasses ZipFile's CRC check: read the copy back
+                crc = 0
+                position = 0
+                while position < info.file_size:
+                    chunk = os.pread(dst_fd, min(self.buffer_size, info.file_size - position), position)
+                    if not chunk:
+                        return False
+                    crc = zlib.crc32(chunk, crc)
+                    position += len(chunk)
+            return crc == info.CRC
+        except (OSError, AttributeError, ValueError):
+            # ENOSYS/EXDEV/unsupported file object: use the buffered copy instead
+            return False
+    
+    def preallocate(self, dst, size):
+        """Reserve disk space for an output file before writing it
+        
+        Allocating the final size up front lets the filesystem use contiguous
+        extents instead of growing the file chunk by chunk.
+        
+        Args:
+            dst: Output file object, opened for writing and still empty
+            size: Final (uncompressed) size of the file
+        """
+        if size < _PREALLOCATE_MIN_SIZE:
+            return
+        try:
+            if _HAS_POSIX_FALLOCATE:
+                os.posix_fallocate(dst.fileno(), 0, size)
+            else:
+                dst.truncate(size)
+        except OSError:
+            # Not supported by the filesystem: just let the file grow
+            pass
+    
+    def open_zip(self, zip_path):
+        """Open a ZIP archive through a large read buffer
+        
+        Args:
+            zip_path: Path to the ZIP file
+        
+        Returns:
+            tuple: (file object, ZipFile) - both must be closed by the caller
+        """
+        zip_file = open(zip_path, 'rb', buffering=self.buffer_size)
+        try:
+            return zip_file, zipfile.ZipFile(zip_file, 'r')
+        except Exception:
+            zip_file.close()
+            raise
+    
     def get_source_packages_dir(self):
         """Get the source emoji_packages directory (where ZIP files are stored)"""
         if getattr(sys, 'frozen', False):
@@ -136,6 +305,15 @@ class ZipExtractor:
         
         config = self.PACKAGE_CONFIG[package_name]
         
+        # Completion markers: a single stat answers in the common case, and an
+        # interrupted extraction is retried even if its folders already exist
+        package_root = os.path.join(self.user_packages_dir, package_name)
+        if os.path.exists(os.path.join(package_root, self.EXTRACTED_MARKER)):
+            return True
+        if os.path.exists(os.path.join(package_root, self.EXTRACTING_MARKER)):
+            return False
+        
+        # No marker (extracted by an older version): verify the folder structure
         # Handle multi_zip type (multiple ZIP archives to extract)
         if config.get("type") == "multi_zip":
             package_dir = os.path.join(self.user_packages_dir, package_name)
@@ -188,12 +366,69 @@ class ZipExtractor:
         
         config = self.PACKAGE_CONFIG[package_name]
         
+        package_root = os.path.join(self.user_packages_dir, package_name)
+        os.makedirs(package_root, exist_ok=True)
+        self.remove_marker(package_root, self.EXTRACTED_MARKER)
+        self.write_marker(package_root, self.EXTRACTING_MARKER)
+        
         # Handle multi_zip type (multiple ZIP archives to extract)
         if config.get("type") == "multi_zip":
-            return self.extract_multi_zip(package_name, config, progress_callback)
+            success = self.extract_multi_zip(package_name, config, progress_callback)
+        else:
+            # Handle ZIP extraction type
+            success = self.extract_zip(package_name, config, progress_callback)
         
-        # Handle ZIP extraction type
-        return self.extract_zip(package_name, config, progress_callback)
+        if success:
+            self.mark_package_extracted(package_root)
+        return success
+    
+    def write_marker(self, package_root, marker_name):
+        """Atomically create a marker file in a package directory
+        
+        Args:
+            package_root: Package directory
+            marker_name: Name of the marker file
+        """
+        marker_path = os.path.join(package_root, marker_name)
+        tmp_path = marker_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("ok\n")
+        os.replace(tmp_path, marker_path)
+    
+    def remove_marker(self, package_root, marker_name):
+        """Remove a marker file from a package directory if present
+        
+        Args:
+            package_root: Package directory
+            marker_name: Name of the marker file
+        """
+        try:
+            os.remove(os.path.join(package_root, marker_name))
+        except FileNotFoundError:
+            pass
+    
+    def mark_package_extracted(self, package_root):
+        """Flush the package directory once and record the extraction as complete
+        
+        Extracted files are not synced individually; a single directory fsync
+        (skipped on Windows, where directories cannot be opened for syncing)
+        precedes the atomic swap of the in-progress marker for the OK marker.
+        
+        Args:
+            package_root: Package directory
+        """
+        if platform.system() != "Windows":
+            try:
+                dir_fd = os.open(package_root, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except OSError:
+                pass
+        
+        self.write_marker(package_root, self.EXTRACTED_MARKER)
+        self.remove_marker(package_root, self.EXTRACTING_MARKER)
     
     def extract_multi_zip(self, package_name, config, progress_callback=None):
         """Extract multiple ZIP archives for a package to user directory
@@ -234,16 +469,18 @@ class ZipExtractor:
                     if result is False:
                         return False
                 
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_file, zip_ref = self.open_zip(zip_path)
+                with zip_file, zip_ref:
                     # Get list of files to extract
                     all_files = zip_ref.namelist()
                     
                     # Filter files to extract only emoji files
                     files_to_extract = [f for f in all_files if self.should_extract_file(f)]
+                    created_dirs = set()
                     
                     # Extract only filtered files
                     for file_index, file in enumerate(files_to_extract):
-                        zip_ref.extract(file, target_dir)
+                        self.extract_member(zip_ref, file, target_dir, created_dirs)
                         
                         # Check for cancellation periodically (every 50 files)
                         if progress_callback and file_index % 50 == 0:
@@ -293,13 +530,15 @@ class ZipExtractor:
         os.makedirs(target_dir, exist_ok=True)
         
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_file, zip_ref = self.open_zip(zip_path)
+            with zip_file, zip_ref:
                 # Get list of all files in archive
                 all_files = zip_ref.namelist()
                 
                 # Filter files to extract only emoji files
                 files_to_extract = [f for f in all_files if self.should_extract_file(f)]
                 total_files = len(files_to_extract)
+                created_dirs = set()
                 
                 if progress_callback:
                     result = progress_callback(0, total_files, f"Extracting {package_name} ({total_files} emoji files)...")
@@ -308,7 +547,7 @@ class ZipExtractor:
                 
                 # Extract only filtered files
                 for index, file in enumerate(files_to_extract):
-                    zip_ref.extract(file, target_dir)
+                    self.extract_member(zip_ref, file, target_dir, created_dirs)
                     
                     if progress_callback and index % 100 == 0:
                         result = progress_callback(
@@ -333,55 +572,192 @@ class ZipExtractor:
                 progress_callback(0, 100, f"ERROR extracting {package_name}: {e}")
             return False
     
-    def extract_all_packages(self, progress_callback=None):
+    def extract_all_packages(self, progress_callback=None, max_workers=None):
         """Extract all packages that are not yet extracted
         
         Args:
             progress_callback: Optional callback function(current, total, message)
+            max_workers: Optional number of packages to extract in parallel
         
         Returns:
             dict: {package_name: success_bool}
         """
         results = {}
         packages_to_extract = []
+        manifest = self.load_manifest()
+        manifest_changed = False
         
         # Check which packages need extraction
         for package_name in self.PACKAGE_CONFIG.keys():
-            if not self.is_package_extracted(package_name):
+            if self.needs_extraction(package_name, manifest):
                 packages_to_extract.append(package_name)
+            elif package_name not in manifest:
+                # Extracted before the manifest existed: record its archives now
+                zip_stats = self.get_zip_stats(package_name)
+                if zip_stats is not None:
+                    manifest[package_name] = zip_stats
+                    manifest_changed = True
         
         if not packages_to_extract:
+            if manifest_changed:
+                self.save_manifest(manifest)
             if progress_callback:
                 progress_callback(100, 100, "All packages already extracted")
             return {pkg: True for pkg in self.PACKAGE_CONFIG.keys()}
         
-        # Extract each package
+        # Extract packages concurrently: zlib releases the GIL while inflating,
+        # and each package is written to its own target directory
         total_packages = len(packages_to_extract)
-        for index, package_name in enumerate(packages_to_extract):
-            if progress_callback:
-                result = progress_callback(
-                    index,
-                    total_packages,
-                    f"Extracting package {index + 1}/{total_packages}: {package_name}"
-                )
-                if result is False:
-                    # Cancellation requested, mark remaining packages as failed
-                    for remaining_pkg in packages_to_extract[index:]:
-                        results[remaining_pkg] = False
-                    return results
-            
-            success = self.extract_package(package_name, progress_callback)
-            results[package_name] = success
-            
-            # If extraction failed and it might be due to cancellation, stop
-            if not success:
-                # Mark remaining packages as not attempted
-                for remaining_pkg in packages_to_extract[index + 1:]:
-                    results[remaining_pkg] = False
-                break
+        
+        # Per-package completion (0.0 to 1.0), aggregated into a single
+        # monotonic (current, total) progress for the callback
+        progress_lock = threading.Lock()
+        package_progress = {package_name: 0.0 for package_name in packages_to_extract}
+        
+        def make_package_callback(package_name):
+            def package_callback(current, total, message):
+                if not progress_callback:
+                    return True
+                with progress_lock:
+                    if total > 0:
+                        fraction = min(current / total, 1.0)
+                        if fraction > package_progress[package_name]:
+                            package_progress[package_name] = fraction
+                    aggregate = int(sum(package_progress.values()) * 100)
+                    return progress_callback(aggregate, total_packages * 100, message)
+            return package_callback
+        
+        def extract_one(index, package_name):
+            package_callback = make_package_callback(package_name)
+            result = package_callback(
+                0,
+                1,
+                f"Extracting package {index + 1}/{total_packages}: {package_name}"
+            )
+            if result is False:
+                # Cancellation requested before this package started
+                return False
+            return self.extract_package(package_name, package_callback)
+        
+        with ThreadPoolExecutor(max_workers=self.get_max_workers(total_packages, max_workers)) as executor:
+            futures = {
+                package_name: executor.submit(extract_one, index, package_name)
+                for index, package_name in enumerate(packages_to_extract)
+            }
+            for package_name, future in futures.items():
+                try:
+                    results[package_name] = future.result()
+                except Exception as e:
+                    print(f"[ERROR] Failed to extract {package_name}: {e}", file=sys.stderr)
+                    results[package_name] = False
+        
+        # Remember which archives the successfully extracted packages came from
+        for package_name, success in results.items():
+            if success:
+                zip_stats = self.get_zip_stats(package_name)
+                if zip_stats is not None:
+                    manifest[package_name] = zip_stats
+                    manifest_changed = True
+        if manifest_changed:
+            self.save_manifest(manifest)
         
         return results
     
+    def get_zip_stats(self, package_name):
+        """Get the (size, mtime_ns) of each source ZIP archive of a package
+        
+        Args:
+            package_name: Name of the package
+        
+        Returns:
+            list: [[size, mtime_ns], ...] per archive, or None if an archive is missing
+        """
+        config = self.PACKAGE_CONFIG[package_name]
+        zip_configs = config["zip_files"] if config.get("type") == "multi_zip" else [config]
+        zip_stats = []
+        for zip_config in zip_configs:
+            zip_path = os.path.join(self.source_packages_dir, package_name, zip_config["zip_name"])
+            try:
+                st = os.stat(zip_path)
+            except OSError:
+                return None
+            zip_stats.append([st.st_size, st.st_mtime_ns])
+        return zip_stats
+    
+    def load_manifest(self):
+        """Load the extraction manifest
+        
+        Returns:
+            dict: {package_name: zip_stats}, empty if missing or unreadable
+        """
+        manifest_path = os.path.join(self.user_packages_dir, self.MANIFEST_NAME)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def save_manifest(self, manifest):
+        """Atomically write the extraction manifest
+        
+        Args:
+            manifest: {package_name: zip_stats}
+        """
+        manifest_path = os.path.join(self.user_packages_dir, self.MANIFEST_NAME)
+        tmp_path = manifest_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, manifest_path)
+        except OSError as e:
+            print(f"[ERROR] Failed to write extraction manifest: {e}", file=sys.stderr)
+    
+    def needs_extraction(self, package_name, manifest=None):
+        """Check if a package must be (re-)extracted
+        
+        A package needs extraction if it is not extracted yet, or if its source
+        ZIP archives changed (size or mtime) since it was extracted.
+        
+        Args:
+            package_name: Name of the package
+            manifest: Optional already loaded manifest (loaded if None)
+        
+        Returns:
+            bool: True if the package must be extracted
+        """
+        if not self.is_package_extracted(package_name):
+            return True
+        if manifest is None:
+            manifest = self.load_manifest()
+        recorded = manifest.get(package_name)
+        if recorded is None:
+            return False
+        zip_stats = self.get_zip_stats(package_name)
+        # Missing archives cannot be re-extracted, keep the existing files
+        return zip_stats is not None and zip_stats != recorded
+    
+    def get_max_workers(self, package_count, max_workers=None):
+        """Get the number of packages to extract in parallel
+        
+        Defaults to min(4, CPU count); the PURRMOJI_EXTRACT_WORKERS environment
+        variable can lower it (e.g. to 1 or 2 on slow hard drives).
+        
+        Args:
+            package_count: Number of packages to extract
+            max_workers: Optional caller-provided default (e.g. Qt's ideal thread count)
+        
+        Returns:
+            int: Number of worker threads to use
+        """
+        if not max_workers:
+            max_workers = min(4, os.cpu_count() or 1)
+        try:
+            max_workers = int(os.environ.get('PURRMOJI_EXTRACT_WORKERS', max_workers))
+        except ValueError:
+            pass
+        return max(1, min(max_workers, package_count))
+    
     def get_user_packages_dir(self):
         """Get the user packages directory path
         
@@ -402,7 +778,6 @@ class ZipExtractor:
         if package_name not in self.PACKAGE_CONFIG:
             return False
         
-        import shutil
         package_dir = os.path.join(self.user_packages_dir, package_name)
         
         try:
@@ -418,7 +793,6 @@ class ZipExtractor:
         Returns:
             bool: True if all removals succeeded, False otherwise
         """
-        import shutil
         try:
             if os.path.exists(self.user_packages_dir):
                 shutil.rmtree(self.user_packages_dir)
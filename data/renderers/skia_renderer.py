@@ -9,7 +9,7 @@ Universal renderer for all emoji formats (PNG, SVG, TTF).
 """
 
 import os
-from PyQt5.QtGui import QPixmap, QIcon
+from PyQt5.QtGui import QPixmap, QIcon, QImage
 
 # Check if skia-python is available
 SKIA_AVAILABLE = False
@@ -34,6 +34,14 @@ class SkiaRenderer:
             import skia  # type: ignore
             self.skia = skia
             
+            # Objects reused across emoji renders, so a grid page only loads
+            # each font file once (all rendering happens on the GUI thread):
+            # font_path -> Typeface, (font_path, font_size) -> Font,
+            # size -> RGBA raster Surface
+            self._typefaces = {}
+            self._fonts = {}
+            self._surfaces = {}
+            
             self.initialized = True
         except Exception:
             self.initialized = False
@@ -75,6 +83,79 @@ class SkiaRenderer:
         
         return pixmap
     
+    def get_font(self, font_path, font_size):
+        """Get the Skia font for a font file and size, loading the typeface once
+        
+        Args:
+            font_path: Path to the font file
+            font_size: Font size in points
+        
+        Returns:
+            skia.Font or None if the font file could not be loaded
+        """
+        font = self._fonts.get((font_path, font_size))
+        if font is not None:
+            return font
+        
+        typeface = self._typefaces.get(font_path)
+        if typeface is None:
+            typeface = self.skia.Typeface.MakeFromFile(font_path)
+            if not typeface:
+                print(f"[ERROR] Failed to load font file: {font_path}")
+                return None
+            self._typefaces[font_path] = typeface
+        
+        font = self.skia.Font(typeface, font_size)
+        font.setEdging(self.skia.Font.Edging.kAntiAlias)
+        font.setSubpixel(True)
+        self._fonts[(font_path, font_size)] = font
+        return font
+    
+    def get_surface(self, size):
+        """Get the reusable RGBA raster surface for a size
+        
+        Args:
+            size: Width and height of the surface
+        
+        Returns:
+            skia.Surface (callers clear it before drawing)
+        """
+        surface = self._surfaces.get(size)
+        if surface is None:
+            info = self.skia.ImageInfo.Make(
+                size, size, self.skia.kRGBA_8888_ColorType, self.skia.kPremul_AlphaType
+            )
+            surface = self.skia.Surface.MakeRaster(info)
+            self._surfaces[size] = surface
+        return surface
+    
+    def create_pixmap_from_surface(self, surface, size, invert=False):
+        """Helper to create QPixmap from the raw pixels of a surface
+        
+        Args:
+            surface: Skia RGBA premultiplied surface
+            size: Width and height of the surface
+            invert: If True, invert the RGB channels (alpha untouched) on the way
+        
+        Returns:
+            QPixmap or None if creation failed
+        
+        Note:
+            Skips the PNG encode/decode round-trip of create_pixmap_from_data().
+            QPixmap.fromImage() copies the pixels, so the surface can be reused.
+            Inverting here avoids a later QIcon -> QPixmap -> QImage round-trip.
+        """
+        pixels = surface.makeImageSnapshot().tobytes()
+        image = QImage(pixels, size, size, size * 4, QImage.Format_RGBA8888_Premultiplied)
+        if invert:
+            image.invertPixels(QImage.InvertRgb)
+        pixmap = QPixmap.fromImage(image)
+        
+        if pixmap.isNull():
+            return None
+        
+        return pixmap
+    
     def render_image_file(self, image_path, size):
         """Render PNG/JPEG/WEBP image file using Skia"""
         if not self.initialized:
@@ -169,7 +250,8 @@ class SkiaRenderer:
         except Exception:
             return None
     
-    def render_emoji_to_pixmap(self, emoji, font_path, size, is_monochrome=False, monochrome_color=(0, 0, 0, 255)):
+    def render_emoji_to_pixmap(self, emoji, font_path, size, is_monochrome=False, monochrome_color=(0, 0, 0, 255),
+                               invert=False):
         """Render emoji using Skia directly in memory (supports both COLR and monochrome TTF)
         
         Args:
@@ -178,6 +260,7 @@ class SkiaRenderer:
             size: Size of the output image
             is_monochrome: If True, render with a solid color (for monochrome TTF fonts)
             monochrome_color: RGBA tuple for monochrome rendering (default: black)
+            invert: If True, invert the colors of the result (Contrast mode)
         """
         if not self.initialized:
             return None
@@ -187,20 +270,14 @@ class SkiaRenderer:
             return None
         
         try:
-            # Load the font
-            typeface = self.skia.Typeface.MakeFromFile(font_path)
-            if not typeface:
-                print(f"[ERROR] Failed to load font file: {font_path}")
-                return None
-            
-            # Create a font with the desired size (slightly larger for better rendering)
+            # Get the font with the desired size (slightly larger for better rendering)
             font_size = int(size * 0.9)
-            font = self.skia.Font(typeface, font_size)
-            font.setEdging(self.skia.Font.Edging.kAntiAlias)
-            font.setSubpixel(True)
+            font = self.get_font(font_path, font_size)
+            if font is None:
+                return None
             
-            # Create a surface for rendering
-            surface = self.skia.Surface(size, size)
+            # Get the surface for rendering
+            surface = self.get_surface(size)
             canvas = surface.getCanvas()
             
             # Clear with transparent background
@@ -235,10 +312,8 @@ class SkiaRenderer:
             # Draw the text
             canvas.drawSimpleText(emoji, x, y, font, paint)
             
-            # Get the image from surface and convert to QPixmap
-            image = surface.makeImageSnapshot()
-            png_data = image.encodeToData()
-            pixmap = self.create_pixmap_from_data(png_data)
+            # Convert the surface pixels to QPixmap
+            pixmap = self.create_pixmap_from_surface(surface, size, invert)
             
             if not pixmap:
                 return None
@@ -8,13 +8,63 @@ About Dialog for PurrMoji Emoji Picker
 Displays information about the application, emoji packages, credits, and licenses.
 """
 
-import os
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QScrollArea, 
                              QWidget, QLabel, QApplication)
-from PyQt5.QtCore import Qt, QUrl
-from PyQt5.QtGui import QIcon, QFont, QPixmap, QDesktopServices
+from PyQt5.QtCore import Qt, QUrl, QSize
+from PyQt5.QtGui import QFont, QDesktopServices
 from managers import ThemeManager, PathManager
-from ui.base_dialog import ThemedDialogMixin
+from ui.base_dialog import ThemedDialogMixin, get_misc_icon
+
+
+# Emoji package credits shown in the About dialog: (package name, ((label, url or text), ...))
+_PACKAGES = (
+    ("Emojitwo (2.2.5)", (
+        ("Preview", "https://emojipedia.org/joypixels/2.2.5"),
+        ("Official page", "https://emojitwo.github.io/"),
+        ("License", "https://emojitwo.github.io/#emojione-2x-artwork-license")
+    )),
+    ("Google Noto Color Emoji (17.0)", (
+        ("Preview", "https://emojipedia.org/google/17.0"),
+        ("Colored emojis", "https://fonts.google.com/noto/specimen/Noto+Color+Emoji"),
+        ("Monochrome emojis", "https://fonts.google.com/noto/specimen/Noto+Emoji"),
+        ("Github page", "https://github.com/googlefonts/noto-emoji"),
+        ("License", "https://github.com/googlefonts/noto-emoji?tab=OFL-1.1-1-ov-file")
+    )),
+    ("Microsoft Segoe UI Emoji (1.33)", (
+        ("Preview", "https://emojipedia.org/microsoft"),
+        ("Official page", "https://learn.microsoft.com/en-us//typography/font-list/segoe-ui-emoji"),
+        ("Font redistribution FAQ", "https://learn.microsoft.com/en-us/typography/fonts/font-faq"),
+        ("Note", "Segoe UI Emoji is not bundled with this software.")
+    )),
+    ("OpenMoji (16.0)", (
+        ("Preview", "https://emojipedia.org/openmoji"),
+        ("Official page", "https://openmoji.org/"),
+        ("Github page", "https://github.com/hfg-gmuend/openmoji"),
+        ("License", "https://github.com/hfg-gmuend/openmoji?tab=CC-BY-SA-4.0-1-ov-file#readme")
+    )),
+    ("Twemoji (14.0)", (
+        ("Preview", "https://emojipedia.org/twitter/twemoji-14.0"),
+        ("Github page", "https://github.com/twitter/twemoji"),
+        ("License", "https://github.com/twitter/twemoji/blob/master/LICENSE-GRAPHICS")
+    )),
+    ("Custom", (
+        ("Description", "The \"Custom\" folder allows you to add your own PNG/SVG/TTF icons or emojis. "
+                        "The test icons provided in \"Custom\" are from the following websites. "
+                        "You can remove them from the \"Custom\" folder and add your own ones."),
+        ("SVG Icons", "https://www.svgrepo.com/"),
+        ("SVGrepo License", "https://www.svgrepo.com/page/licensing/"),
+        ("PNG Icons", "https://3dicons.co/"),
+        ("3dicons License", "https://3dicons.co/about")
+    )),
+    ("Sleeping Kitty SVG Icon", (
+        ("Source page", "https://freesvg.org/sleeping-kitty"),
+        ("License", "Public Domain")
+    )),
+    ("Mono Contrast SVG Icon", (
+        ("Source page", "https://freesvg.org/mono-contrast"),
+        ("License", "Public Domain")
+    )),
+)
 
 
 class AboutDialog(ThemedDialogMixin, QDialog):
@@ -32,9 +82,9 @@ class AboutDialog(ThemedDialogMixin, QDialog):
             self.path_manager = PathManager()
         
         # Set window icon
-        icon_path = self.path_manager.get_misc_file("Kitty-Head.svg")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        window_icon = get_misc_icon(self.path_manager, "Kitty-Head.svg")
+        if window_icon is not None:
+            self.setWindowIcon(window_icon)
         
         # Remove question mark button from title bar
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
@@ -45,12 +95,12 @@ class AboutDialog(ThemedDialogMixin, QDialog):
             self.current_theme = parent.data_manager.theme
         
         # Get custom color for category/subcategory
-        category_subcategory_color = '#5555ff'
+        self.category_subcategory_color = '#5555ff'
         if parent and hasattr(parent, 'category_subcategory_color'):
-            category_subcategory_color = parent.category_subcategory_color
+            self.category_subcategory_color = parent.category_subcategory_color
         
         # Apply theme to this dialog
-        self.setStyleSheet(ThemeManager.get_dialog_stylesheet(self.current_theme, category_subcategory_color))
+        self.setStyleSheet(ThemeManager.get_dialog_stylesheet(self.current_theme, self.category_subcategory_color))
         
         # Set Windows titlebar theme with custom colors
         self.set_windows_titlebar_theme(self.current_theme)
@@ -87,12 +137,13 @@ class AboutDialog(ThemedDialogMixin, QDialog):
         title_row_layout.addWidget(title_label)
         
         # Load and display icon positioned at top right of title
-        icon_path = self.path_manager.get_misc_file("Sleeping-Kitty.svg")
-        if os.path.exists(icon_path):
+        kitty_icon = get_misc_icon(self.path_manager, "Sleeping-Kitty.svg")
+        if kitty_icon is not None:
             icon_label = QLabel()
-            icon_pixmap = QPixmap(icon_path)
+            # Render through the cached QIcon at the target size instead of
+            # loading the SVG into a QPixmap and scaling it down
+            icon_pixmap = kitty_icon.pixmap(QSize(96, 96))
             if not icon_pixmap.isNull():
-                icon_pixmap = icon_pixmap.scaled(96, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                 icon_label.setPixmap(icon_pixmap)
                 icon_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
             title_row_layout.addWidget(icon_label, 0, Qt.AlignLeft | Qt.AlignTop)
@@ -150,56 +201,7 @@ class AboutDialog(ThemedDialogMixin, QDialog):
         content_layout.addWidget(packages_title)
         
         # Package entries
-        packages = [
-            ("Emojitwo (2.2.5)", [
-                ("Preview", "https://emojipedia.org/joypixels/2.2.5"),
-                ("Official page", "https://emojitwo.github.io/"),
-                ("License", "https://emojitwo.github.io/#emojione-2x-artwork-license")
-            ]),
-            ("Google Noto Color Emoji (17.0)", [
-                ("Preview", "https://emojipedia.org/google/17.0"),
-                ("Colored emojis", "https://fonts.google.com/noto/specimen/Noto+Color+Emoji"),
-                ("Monochrome emojis", "https://fonts.google.com/noto/specimen/Noto+Emoji"),
-                ("Github page", "https://github.com/googlefonts/noto-emoji"),
-                ("License", "https://github.com/googlefonts/noto-emoji?tab=OFL-1.1-1-ov-file")
-            ]),
-            ("Microsoft Segoe UI Emoji (1.33)", [
-                ("Preview", "https://emojipedia.org/microsoft"),
-                ("Official page", "https://learn.microsoft.com/en-us//typography/font-list/segoe-ui-emoji"),
-                ("Font redistribution FAQ", "https://learn.microsoft.com/en-us/typography/fonts/font-faq"),
-                ("Note", "Segoe UI Emoji is not bundled with this software.")
-            ]),
-            ("OpenMoji (16.0)", [
-                ("Preview", "https://emojipedia.org/openmoji"),
-                ("Official page", "https://openmoji.org/"),
-                ("Github page", "https://github.com/hfg-gmuend/openmoji"),
-                ("License", "https://github.com/hfg-gmuend/openmoji?tab=CC-BY-SA-4.0-1-ov-file#readme")
-            ]),
-            ("Twemoji (14.0)", [
-                ("Preview", "https://emojipedia.org/twitter/twemoji-14.0"),
-                ("Github page", "https://github.com/twitter/twemoji"),
-                ("License", "https://github.com/twitter/twemoji/blob/master/LICENSE-GRAPHICS")
-            ]),
-            ("Custom", [
-                ("Description", "The \"Custom\" folder allows you to add your own PNG/SVG/TTF icons or emojis. "
-                              "The test icons provided in \"Custom\" are from the following websites. "
-                              "You can remove them from the \"Custom\" folder and add your own ones."),
-                ("SVG Icons", "https://www.svgrepo.com/"),
-                ("SVGrepo License", "https://www.svgrepo.com/page/licensing/"),
-                ("PNG Icons", "https://3dicons.co/"),
-                ("3dicons License", "https://3dicons.co/about")
-            ]),
-            ("Sleeping Kitty SVG Icon", [
-                ("Source page", "https://freesvg.org/sleeping-kitty"),
-                ("License", "Public Domain")
-            ]),
-            ("Mono Contrast SVG Icon", [
-                ("Source page", "https://freesvg.org/mono-contrast"),
-                ("License", "Public Domain")
-            ])
-        ]
-        
-        for package_name, links in packages:
+        for package_name, links in _PACKAGES:
             package_label = QLabel(package_name)
             package_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
             content_layout.addWidget(package_label)
@@ -258,4 +260,8 @@ class AboutDialog(ThemedDialogMixin, QDialog):
         
         self.setLayout(layout)
     
+    def closeEvent(self, event):
+        """Hide instead of closing so the dialog can be reopened without rebuilding it"""
+        event.ignore()
+        self.hide()
 
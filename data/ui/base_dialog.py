@@ -7,16 +7,119 @@
 Base Dialog Class - Provides themed title bar functionality for all dialogs
 """
 
+import sys
 import platform
-import ctypes
 from PyQt5.QtWidgets import QDialog, QColorDialog, QApplication
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon
 from managers import ThemeManager
 
 
+def _is_windows_11():
+    """Check whether the running system is Windows 11 (build 22000+)"""
+    if platform.system() != 'Windows':
+        return False
+    try:
+        return int(platform.version().split('.')[-1]) >= 22000
+    except ValueError:
+        return False
+
+
+# Custom titlebar colors (DWMWA_CAPTION_COLOR / DWMWA_TEXT_COLOR) need Windows 11
+_IS_WIN11 = _is_windows_11()
+
+
+def _bind_dwm_api():
+    """Resolve DwmSetWindowAttribute, declare its prototype and allocate the value buffer
+    
+    Returns:
+        tuple: (function, c_int buffer, buffer pointer, buffer size), or None
+            when not running on Windows (or dwmapi is missing)
+    
+    Note:
+        ctypes is only imported here, so other platforms never load it.
+        With an HRESULT return type ctypes raises OSError for failing calls,
+        so unsupported attributes can be detected by the callers.
+    """
+    if sys.platform != 'win32':
+        return None
+    try:
+        import ctypes
+        from ctypes import wintypes
+        func = ctypes.windll.dwmapi.DwmSetWindowAttribute
+    except (OSError, AttributeError, ImportError):
+        return None
+    func.argtypes = (wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD)
+    func.restype = ctypes.HRESULT
+    # Reusable value buffer: DWM calls only happen on the GUI thread
+    value = ctypes.c_int()
+    return func, value, ctypes.pointer(value), ctypes.sizeof(value)
+
+
+# DWM API bound once at import (None when unavailable)
+_DWM_API = _bind_dwm_api()
+
+
+def set_dwm_attribute(hwnd, attr, value):
+    """Apply a single integer DWM window attribute
+    
+    Args:
+        hwnd: Native window handle
+        attr: DWMWA_* attribute identifier
+        value: Integer value to apply
+    
+    Raises:
+        OSError: If DWM is not available or rejects the attribute
+    """
+    if _DWM_API is None:
+        raise OSError("DwmSetWindowAttribute is not available")
+    func, buffer, buffer_ptr, buffer_size = _DWM_API
+    buffer.value = value
+    func(hwnd, attr, buffer_ptr, buffer_size)
+
+
+# QIcon instances of the misc files (absolute path -> QIcon); QIcon keeps its
+# own per-size pixmap cache, so sharing one instance per file between the main
+# window and the dialogs avoids re-parsing the SVG on every construction
+_MISC_ICONS = {}
+
+
+def get_misc_icon(path_manager, filename):
+    """Get the shared QIcon of a file in the misc folder, created on first use
+    
+    Args:
+        path_manager: PathManager locating the misc folder
+        filename: Name of the file in the misc folder
+    
+    Returns:
+        QIcon: Shared icon instance, or None if the file does not exist
+    """
+    path = path_manager.resolve_misc_file(filename)
+    if path is None:
+        return None
+    icon = _MISC_ICONS.get(path)
+    if icon is None:
+        icon = _MISC_ICONS[path] = QIcon(path)
+    return icon
+
+
 class ThemedDialogMixin:
     """Mixin class that adds themed title bar support to dialogs"""
     
+    # Windows titlebar (caption color, text color) per (theme, has_focus), in
+    # DWM's 0x00BBGGRR format; unknown themes use the Light colors
+    TITLEBAR_COLORS = {
+        # Dark: #2B2B2B / #202020 (same as main window), white text
+        (ThemeManager.THEME_DARK, True): (0x002B2B2B, 0x00FFFFFF),
+        (ThemeManager.THEME_DARK, False): (0x00202020, 0x00FFFFFF),
+        # Medium: #6e6e6e / #5a5a5a (matches BG_PRIMARY), white text
+        (ThemeManager.THEME_MEDIUM, True): (0x006e6e6e, 0x00FFFFFF),
+        (ThemeManager.THEME_MEDIUM, False): (0x005a5a5a, 0x00FFFFFF),
+        # Light: white / light gray, black text
+        (ThemeManager.THEME_LIGHT, True): (0x00FFFFFF, 0x00000000),
+        (ThemeManager.THEME_LIGHT, False): (0x00F3F3F3, 0x00000000),
+    }
+    
     def set_windows_titlebar_theme(self, theme, has_focus=True):
         """Set Windows title bar to dark or light mode with custom colors
         
@@ -44,72 +147,47 @@ class ThemedDialogMixin:
             DWMWA_CAPTION_COLOR = 35
             DWMWA_TEXT_COLOR = 36
             
+            # Per-window memo of the last value applied for each attribute,
+            # reset when Qt recreates the native window
+            if getattr(self, '_dwm_hwnd', None) != hwnd:
+                self._dwm_hwnd = hwnd
+                self._dwm_cache = {}
+            cache = self._dwm_cache
+            
             # Set to dark mode if theme is Dark or Medium, light mode for Light
-            use_dark_mode = 1 if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM] else 0
+            use_dark_mode = 1 if theme in ThemeManager.DARK_THEMES else 0
+            
+            # Try the newer attribute first (Windows 10 20H1+), then fall back
+            # to the older attribute (Windows 10 1809-2004)
+            dark_mode_attrs = (DWMWA_USE_IMMERSIVE_DARK_MODE, DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20H1)
+            if all(cache.get(attr) != use_dark_mode for attr in dark_mode_attrs):
+                for attr in dark_mode_attrs:
+                    try:
+                        set_dwm_attribute(hwnd, attr, use_dark_mode)
+                    except (OSError, AttributeError):
+                        continue
+                    cache[attr] = use_dark_mode
+                    break
             
-            # Try the newer attribute first (Windows 10 20H1+)
-            try:
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd,
-                    DWMWA_USE_IMMERSIVE_DARK_MODE,
-                    ctypes.byref(ctypes.c_int(use_dark_mode)),
-                    ctypes.sizeof(ctypes.c_int)
-                )
-            except (OSError, AttributeError):
-                # Fall back to the older attribute (Windows 10 1809-2004)
+            # Custom titlebar colors are only supported on Windows 11
+            if not _IS_WIN11:
+                return
+            
+            titlebar_color, text_color = self.TITLEBAR_COLORS.get(
+                (theme, has_focus), self.TITLEBAR_COLORS[(ThemeManager.THEME_LIGHT, has_focus)]
+            )
+            
+            # Only issue the calls whose value changed since the last invocation,
+            # so rapid focus flipping does not hit DWM for identical colors
+            for attr, value in ((DWMWA_CAPTION_COLOR, titlebar_color), (DWMWA_TEXT_COLOR, text_color)):
+                if cache.get(attr) == value:
+                    continue
                 try:
-                    ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                        hwnd,
-                        DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20H1,
-                        ctypes.byref(ctypes.c_int(use_dark_mode)),
-                        ctypes.sizeof(ctypes.c_int)
-                    )
+                    set_dwm_attribute(hwnd, attr, value)
                 except (OSError, AttributeError):
-                    pass
-            
-            # Set custom titlebar colors for Windows 11
-            try:
-                # Color format: 0x00BBGGRR (BGR order, not RGB)
-                if theme == ThemeManager.THEME_DARK:
-                    # Dark theme colors (same as defined in main window)
-                    if has_focus:
-                        titlebar_color = 0x002B2B2B  # #2B2B2B in BGR when focused
-                    else:
-                        titlebar_color = 0x00202020  # #202020 in BGR when not focused
-                    text_color = 0x00FFFFFF  # White text
-                elif theme == ThemeManager.THEME_MEDIUM:
-                    # Medium theme colors
-                    if has_focus:
-                        titlebar_color = 0x006e6e6e  # #6e6e6e in BGR when focused
-                    else:
-                        titlebar_color = 0x005a5a5a  # #5a5a5a in BGR when not focused (matches BG_PRIMARY)
-                    text_color = 0x00FFFFFF  # White text
-                else:
-                    # Light theme colors
-                    if has_focus:
-                        titlebar_color = 0x00FFFFFF  # White when focused
-                    else:
-                        titlebar_color = 0x00F3F3F3  # Light gray when not focused
-                    
-                    # Use default black text color in light mode (no need to set explicitly)
-                    text_color = 0x00000000  # Black in BGR format
-                
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd,
-                    DWMWA_CAPTION_COLOR,
-                    ctypes.byref(ctypes.c_int(titlebar_color)),
-                    ctypes.sizeof(ctypes.c_int)
-                )
-                
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd,
-                    DWMWA_TEXT_COLOR,
-                    ctypes.byref(ctypes.c_int(text_color)),
-                    ctypes.sizeof(ctypes.c_int)
-                )
-            except (OSError, AttributeError):
-                # Windows 11 API not available (Windows 10 or older)
-                pass
+                    # Windows 11 API not available (Windows 10 or older)
+                    break
+                cache[attr] = value
         except (OSError, AttributeError):
             # Silently fail if the API is not available
             pass
@@ -117,9 +195,12 @@ class ThemedDialogMixin:
     def changeEvent(self, event):
         """Handle window state changes (focus gain/loss)"""
         if event.type() == event.ActivationChange:
-            # Update titlebar color based on focus state (for both Dark and Light themes)
-            if hasattr(self, 'current_theme'):
-                self.set_windows_titlebar_theme(self.current_theme, self.isActiveWindow())
+            # Update titlebar color based on focus state (for both Dark and Light themes),
+            # skipping repeated events reporting the same active state
+            active = self.isActiveWindow()
+            if hasattr(self, 'current_theme') and active != getattr(self, '_last_active', None):
+                self._last_active = active
+                self.set_windows_titlebar_theme(self.current_theme, active)
         super().changeEvent(event)
     
     def center_on_screen(self):
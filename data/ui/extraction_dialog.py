@@ -14,38 +14,72 @@ import platform
 import time
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QApplication, 
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, 
     QPushButton, QMessageBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QMutex, QWaitCondition, pyqtSignal
 from PyQt5.QtGui import QFont
 
 from managers import ZipExtractor
 
 
+def _open_folder_detached(command, path):
+    """Launch a file manager command without waiting for it to exit"""
+    subprocess.Popen([command, path], stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
+
+
+# Folder opener for the current OS, resolved once at import time
+if platform.system() == "Windows":
+    _FOLDER_OPENER = os.startfile
+elif platform.system() == "Darwin":  # macOS
+    _FOLDER_OPENER = lambda path: _open_folder_detached("open", path)
+else:  # Linux and others
+    _FOLDER_OPENER = lambda path: _open_folder_detached("xdg-open", path)
+
+
 class ExtractionWorker(QThread):
     """Worker thread for package extraction"""
     
     progress_updated = pyqtSignal(int, int, str)  # current, total, message
     extraction_completed = pyqtSignal(bool, str)  # success, message
     
-    def __init__(self):
+    def __init__(self, extractor=None):
+        """Initialize the worker
+        
+        Args:
+            extractor: ZipExtractor to use (a new one is created if None)
+        """
         super().__init__()
-        self.extractor = ZipExtractor()
+        self.extractor = extractor if extractor is not None else ZipExtractor()
         self.cancelled = False
         self.paused = False
+        # Guards cancelled/paused and lets a paused worker sleep until woken
+        self._mutex = QMutex()
+        self._cond = QWaitCondition()
+        # Progress emission throttling (last emitted percentage and timestamp)
+        self._last_emit_ts = 0.0
+        self._last_pct = -1
     
     def cancel(self):
         """Request cancellation of extraction"""
+        self._mutex.lock()
         self.cancelled = True
+        self._cond.wakeAll()
+        self._mutex.unlock()
     
     def pause(self):
         """Request pause of extraction"""
+        self._mutex.lock()
         self.paused = True
+        self._mutex.unlock()
     
     def resume(self):
         """Request resume of extraction"""
+        self._mutex.lock()
         self.paused = False
+        self._cond.wakeAll()
+        self._mutex.unlock()
     
     def is_cancelled(self):
         """Check if extraction is cancelled"""
@@ -59,35 +93,51 @@ class ExtractionWorker(QThread):
         """Extract all packages in background thread"""
         try:
             def progress_callback(current, total, message):
-                # Check for pause
-                while self.paused and not self.cancelled:
-                    time.sleep(0.1)
+                # Check for pause (block until resumed or cancelled). The
+                # unlocked read keeps the common not-paused path lock-free;
+                # the flag is re-checked under the mutex before waiting.
+                if self.paused:
+                    self._mutex.lock()
+                    while self.paused and not self.cancelled:
+                        self._cond.wait(self._mutex)
+                    self._mutex.unlock()
                 
                 # Check for cancellation
                 if self.cancelled:
                     return False
                 
-                self.progress_updated.emit(current, total, message)
+                # Only emit routine per-file updates on a percentage change or
+                # every 50 ms to avoid flooding the GUI thread with one queued
+                # signal per file; errors and the final update always go through
+                pct = current * 100 // max(total, 1)
+                now = time.monotonic()
+                if (message.startswith("ERROR") or current >= total
+                        or pct != self._last_pct or now - self._last_emit_ts > 0.05):
+                    self._last_pct = pct
+                    self._last_emit_ts = now
+                    self.progress_updated.emit(current, total, message)
                 return True
             
-            results = self.extractor.extract_all_packages(progress_callback)
+            # This thread only coordinates: packages are extracted in parallel by
+            # the extractor's pool, sized like QThreadPool (idealThreadCount, max 4)
+            results = self.extractor.extract_all_packages(
+                progress_callback,
+                max_workers=min(4, QThread.idealThreadCount())
+            )
             
             # Check if cancelled
             if self.cancelled:
                 self.extraction_completed.emit(False, "Extraction cancelled by user")
                 return
             
-            # Check if all extractions succeeded
-            all_success = all(results.values())
+            # Check if all extractions succeeded (single pass over the results,
+            # an empty list of failed packages means success)
+            failed = ", ".join(pkg for pkg, success in results.items() if not success)
             
-            if all_success:
+            if not failed:
                 self.extraction_completed.emit(True, "All packages extracted successfully!")
             else:
-                failed = [pkg for pkg, success in results.items() if not success]
-                self.extraction_completed.emit(
-                    False,
-                    f"Failed to extract: {', '.join(failed)}"
-                )
+                self.extraction_completed.emit(False, f"Failed to extract: {failed}")
         except Exception as e:
             self.extraction_completed.emit(False, f"Extraction error: {e}")
 
@@ -95,14 +145,15 @@ class ExtractionWorker(QThread):
 class ExtractionDialog(QDialog):
     """Dialog showing emoji package extraction progress"""
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, extractor=None):
         super().__init__(parent)
         self.setWindowTitle("PurrMoji Emoji Picker")
         self.setWindowFlags(Qt.Dialog | Qt.WindowTitleHint | Qt.CustomizeWindowHint | Qt.WindowCloseButtonHint)
         self.setModal(True)
         self.setFixedSize(500, 320)
         
-        self.extractor = ZipExtractor()
+        # Shared with the worker thread (and the caller, if it passed one in)
+        self.extractor = extractor if extractor is not None else ZipExtractor()
         self.setup_ui()
         self.worker = None
         self.extraction_started = False
@@ -130,10 +181,16 @@ class ExtractionDialog(QDialog):
         
         # Progress bar
         self.progress_bar = QProgressBar()
+        # The bar paints its whole rect itself: skip erasing/compositing the
+        # background on every progress repaint
+        self.progress_bar.setAttribute(Qt.WA_OpaquePaintEvent)
         self.progress_bar.setMinimum(0)
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("%p%")
         self.progress_bar.setTextVisible(True)
+        # Last percentage shown, so repeated values do not trigger a repaint
+        self._last_pct = 0
         layout.addWidget(self.progress_bar)
         
         # Info label
@@ -177,9 +234,10 @@ class ExtractionDialog(QDialog):
     def start_extraction(self):
         """Start the extraction process"""
         self.extraction_started = True
-        self.worker = ExtractionWorker()
-        self.worker.progress_updated.connect(self.on_progress_updated)
-        self.worker.extraction_completed.connect(self.on_extraction_completed)
+        self.worker = ExtractionWorker(self.extractor)
+        # Signals come from the worker thread: queue them to the GUI event loop
+        self.worker.progress_updated.connect(self.on_progress_updated, Qt.QueuedConnection)
+        self.worker.extraction_completed.connect(self.on_extraction_completed, Qt.QueuedConnection)
         self.worker.start()
     
     def toggle_pause_resume(self):
@@ -224,14 +282,12 @@ class ExtractionDialog(QDialog):
         
         if total > 0:
             progress_percent = int((current / total) * 100)
-            self.progress_bar.setValue(progress_percent)
-            self.progress_bar.setFormat(f"{progress_percent}%")
         else:
-            self.progress_bar.setValue(100)
-            self.progress_bar.setFormat("100%")
+            progress_percent = 100
         
-        # Process events to keep UI responsive
-        QApplication.processEvents()
+        if progress_percent != self._last_pct:
+            self.progress_bar.setValue(progress_percent)
+            self._last_pct = progress_percent
     
     def on_extraction_completed(self, success, message):
         """Handle extraction completion"""
@@ -260,16 +316,8 @@ class ExtractionDialog(QDialog):
         # Ensure directory exists
         os.makedirs(packages_dir, exist_ok=True)
         
-        # Open folder in file explorer based on OS
-        system = platform.system()
-        
         try:
-            if system == "Windows":
-                os.startfile(packages_dir)
-            elif system == "Darwin":  # macOS
-                subprocess.run(["open", packages_dir])
-            else:  # Linux and others
-                subprocess.run(["xdg-open", packages_dir])
+            _FOLDER_OPENER(packages_dir)
         except Exception as e:
             print(f"[ERROR] Failed to open packages folder: {e}", file=sys.stderr)
     
@@ -8,12 +8,44 @@ Hotkeys Dialog for PurrMoji Emoji Picker
 Displays keyboard shortcuts available in the application.
 """
 
-import os
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QApplication
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QPushButton, QLabel, QApplication
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QFont, QFontMetrics
+from PyQt5.QtGui import QFont
 from managers import ThemeManager, PathManager
-from ui.base_dialog import ThemedDialogMixin
+from ui.base_dialog import ThemedDialogMixin, get_misc_icon
+
+
+# Keyboard shortcuts listed in the dialog: (key combination, description)
+_SHORTCUTS = (
+    ("Double-click on emoji", "Copy emoji to clipboard"),
+    ("Shift + Left Click on emoji", "Add/Remove emoji to/from favorites"),
+    ("Ctrl + Wheel Up/Down", "Increase/Decrease emoji size in grid"),
+    ("Numpad +", "Increase emoji size in grid"),
+    ("Numpad -", "Decrease emoji size in grid"),
+    ("Page Up", "Navigate to previous package in the dropdown"),
+    ("Page Down", "Navigate to next package in the dropdown"),
+    ("T", "Cycle through themes (Light → Medium → Dark)"),
+)
+
+# Fonts shared by every HotkeysDialog instance (created lazily, once a
+# QApplication exists): title, bold shortcut keys, regular descriptions
+_FONTS = None
+
+
+def _get_fonts():
+    """Get the cached (title, bold, regular) fonts used by the dialog
+    
+    Returns:
+        tuple: (title_font, bold_font, regular_font)
+    """
+    global _FONTS
+    if _FONTS is None:
+        _FONTS = (
+            QFont("Segoe UI", 12, QFont.Bold),
+            QFont("Segoe UI", 10, QFont.Bold),
+            QFont("Segoe UI", 10),
+        )
+    return _FONTS
 
 
 class HotkeysDialog(ThemedDialogMixin, QDialog):
@@ -30,10 +62,10 @@ class HotkeysDialog(ThemedDialogMixin, QDialog):
         else:
             self.path_manager = PathManager()
         
-        # Set window icon
-        icon_path = self.path_manager.get_misc_file("Kitty-Head.svg")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # Set window icon (the SVG is only parsed once, then reused)
+        window_icon = get_misc_icon(self.path_manager, "Kitty-Head.svg")
+        if window_icon is not None:
+            self.setWindowIcon(window_icon)
         
         # Remove the "?" help button from the title bar
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
@@ -44,12 +76,12 @@ class HotkeysDialog(ThemedDialogMixin, QDialog):
             self.current_theme = parent.data_manager.theme
         
         # Get custom color for category/subcategory
-        category_subcategory_color = '#5555ff'
+        self.category_subcategory_color = '#5555ff'
         if parent and hasattr(parent, 'category_subcategory_color'):
-            category_subcategory_color = parent.category_subcategory_color
+            self.category_subcategory_color = parent.category_subcategory_color
         
         # Apply theme to this dialog
-        self.setStyleSheet(ThemeManager.get_dialog_stylesheet(self.current_theme, category_subcategory_color))
+        self.setStyleSheet(ThemeManager.get_dialog_stylesheet(self.current_theme, self.category_subcategory_color))
         
         # Set Windows titlebar theme with custom colors
         self.set_windows_titlebar_theme(self.current_theme)
@@ -60,57 +92,35 @@ class HotkeysDialog(ThemedDialogMixin, QDialog):
         # Get optimal link color based on theme for readability
         link_color = ThemeManager.get_link_color(self.current_theme)
         
+        title_font, bold_font, regular_font = _get_fonts()
+        
         layout = QVBoxLayout()
         
         # Title
         title_label = QLabel("Keyboard Shortcuts")
-        title_font = QFont("Segoe UI", 12, QFont.Bold)
         title_label.setFont(title_font)
         title_label.setStyleSheet(f"color: {link_color}; margin-bottom: 10px;")
         layout.addWidget(title_label)
         
-        # Shortcuts list
-        shortcuts = [
-            ("Double-click on emoji", "Copy emoji to clipboard"),
-            ("Shift + Left Click on emoji", "Add/Remove emoji to/from favorites"),
-            ("Ctrl + Wheel Up/Down", "Increase/Decrease emoji size in grid"),
-            ("Numpad +", "Increase emoji size in grid"),
-            ("Numpad -", "Decrease emoji size in grid"),
-            ("Page Up", "Navigate to previous package in the dropdown"),
-            ("Page Down", "Navigate to next package in the dropdown"),
-            ("T", "Cycle through themes (Light → Medium → Dark)")
-        ]
-        
-        # Calculate maximum width needed for shortcuts column to align all colons
-        font = QFont("Segoe UI", 10, QFont.Bold)
-        font_metrics = QFontMetrics(font)
-        max_shortcut_width = 0
-        for key_combo, _ in shortcuts:
-            # Measure text width without HTML tags (bold doesn't change width)
-            width = font_metrics.horizontalAdvance(key_combo)
-            if width > max_shortcut_width:
-                max_shortcut_width = width
-        
-        # Add some padding for the colon and spacing
-        shortcut_column_width = max_shortcut_width + 20
-        
-        for key_combo, description in shortcuts:
-            shortcut_layout = QHBoxLayout()
-            shortcut_layout.setSpacing(0)
-            
+        # Shortcuts grid: the key column sizes itself to its widest entry,
+        # which keeps all colons aligned without measuring text manually
+        shortcuts_grid = QGridLayout()
+        shortcuts_grid.setHorizontalSpacing(0)
+        shortcuts_grid.setContentsMargins(20, 0, 0, 0)  # Same padding as the former fixed-width column
+        
+        for row, (key_combo, description) in enumerate(_SHORTCUTS):
             key_label = QLabel(f"<b>{key_combo}</b>")
-            key_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            key_label.setFixedWidth(shortcut_column_width)
-            key_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            shortcut_layout.addWidget(key_label)
+            key_label.setFont(bold_font)
+            shortcuts_grid.addWidget(key_label, row, 0, Qt.AlignRight | Qt.AlignVCenter)
             
             desc_label = QLabel(f" : {description}")  # Extra space after colon
-            desc_label.setFont(QFont("Segoe UI", 10))
-            shortcut_layout.addWidget(desc_label)
-            
-            shortcut_layout.addStretch()
-            
-            layout.addLayout(shortcut_layout)
+            desc_label.setFont(regular_font)
+            shortcuts_grid.addWidget(desc_label, row, 1)
+        
+        # Keep the two columns packed to the left
+        shortcuts_grid.setColumnStretch(2, 1)
+        
+        layout.addLayout(shortcuts_grid)
         
         layout.addStretch()
         
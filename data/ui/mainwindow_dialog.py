@@ -14,7 +14,9 @@ import json
 import unicodedata
 import io
 import platform
-import ctypes
+import functools
+import weakref
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -22,21 +24,21 @@ from PyQt5.QtWidgets import (
     QMenu, QAction, QMessageBox, QComboBox, QDialog, QCheckBox, QSizePolicy,
     QShortcut
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize, QIODevice
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize, QIODevice, QEvent, QBuffer, QByteArray
 from PyQt5.QtGui import (
     QFont, QPixmap, QPainter, QIcon, QFontMetrics, QFontDatabase, QColor,
-    QPalette, QKeySequence
+    QPalette, QKeySequence, QImage, QPixmapCache
 )
 from PyQt5.QtSvg import QSvgRenderer
 
 # Import managers for modular architecture
 from managers import (
-    PathManager, DataManager, CacheManager, EmojiManager, PackageManager,
-    PackageInitializer, ThemeManager
+    PathManager, DataManager, CacheManager, DiskCacheManager, EmojiManager,
+    PackageManager, PackageInitializer, ThemeManager
 )
 
 # Import UI components
-from ui.base_dialog import ThemedColorDialog
+from ui.base_dialog import ThemedColorDialog, get_misc_icon, set_dwm_attribute, _IS_WIN11
 
 # Import renderers
 from renderers import SKIA_AVAILABLE, get_skia_renderer
@@ -52,6 +54,143 @@ from .event_handlers import DoubleClickButton, EmojiScrollArea
 # Get global Skia renderer instance
 skia_renderer = get_skia_renderer()
 
+# Emoji Unicode codes for category buttons (used for dynamic icon loading)
+_CATEGORY_EMOJI_CODES = MappingProxyType({
+    "activities": "26BD",  # Soccer Ball
+    "animals-nature": "1F436",  # Dog Face
+    "component": "1F3FD",  # Medium skin tone
+    "flags": "1F6A9",  # Triangular Flag On Post
+    "food-drink": "1F34E",  # Red Apple
+    "objects": "1F4F1",  # Mobile Phone
+    "people-body": "1F464",  # Bust in silhouette
+    "smileys-emotion": "1F603",  # Smiling Face With Open Mouth
+    "symbols": "267B",  # Black Universal Recycling Symbol
+    "travel-places": "2708"  # Airplane
+})
+
+
+# Standard category tabs, in display order, with their tooltips
+_STANDARD_CATEGORY_NAMES = MappingProxyType({
+    "Recent & Favorites": "Recent & Favorites",
+    "activities": "Activities",
+    "animals-nature": "Animals & Nature",
+    "component": "Component",
+    "flags": "Flags",
+    "food-drink": "Food & Drink",
+    "objects": "Objects",
+    "people-body": "People & Body",
+    "smileys-emotion": "Smileys & Emotion",
+    "symbols": "Symbols",
+    "travel-places": "Travel & Places",
+    "extras-openmoji": "Extras OpenMoji",
+    "extras-unicode": "Extras Unicode"
+})
+
+# Misc folder SVG icons of the special category tabs (the others use an emoji)
+_CATEGORY_SVG_FILES = MappingProxyType({
+    "Recent & Favorites": "Recent_Favorites.svg",
+    "extras-openmoji": "extras_OpenMoji.svg",
+    "extras-unicode": "extras_Unicode.svg"
+})
+
+# Kaomoji category tabs, in display order: (key, tooltip, emoji drawn as icon),
+# Recent & Favorites uses the same SVG icon as in the other packages
+_KAOMOJI_CATEGORIES = (
+    ("recent_favorites", "Recent & Favorites", None),
+    ("happy", "Happy", "😊"),
+    ("sad", "Sad", "😢"),
+    ("angry", "Angry", "😠"),
+    ("surprised", "Surprised", "😲"),
+    ("confused", "Confused", "😕"),
+    ("sleepy", "Sleepy", "😴"),
+    ("greetings", "Greetings", "👋"),
+    ("animals", "Animals", "🐾"),
+    ("actions", "Actions", "🏃"),
+    ("objects", "Misc", "🎵"),
+    ("special", "Special", "⭐")
+)
+
+# Order of the packages in the package dropdown (other packages follow)
+_PREFERRED_PACKAGE_ORDER = ("EmojiTwo", "Noto", "OpenMoji", "Segoe UI Emoji", "Twemoji", "Kaomoji", "Custom")
+_PREFERRED_PACKAGE_SET = frozenset(_PREFERRED_PACKAGE_ORDER)
+
+# Rows of emoji buttons created below the visible part of the grid, so that
+# slow scrolling never shows a row before its buttons exist
+_GRID_OVERSCAN_ROWS = 2
+
+# Rows of emoji buttons created ahead of the viewport while the application is
+# idle, one row per event loop iteration, so scrolling rarely has to render
+_GRID_PREFETCH_ROWS = 24
+
+
+@functools.lru_cache(maxsize=256)
+def _darken_color(hex_color, factor):
+    """Darken a hex color by a factor (cached, see EmojiPicker.darken_color)
+    
+    Args:
+        hex_color: Hex color string (e.g., "#3699e7")
+        factor: Darkening factor (0.0 = no change, 1.0 = black)
+    
+    Returns:
+        Darkened hex color string
+    """
+    # Decode all channels at once, then scale them with integer arithmetic
+    value = int(hex_color.lstrip('#'), 16)
+    scale = max(0, round((1 - factor) * 1000))
+    r = ((value >> 16) & 0xff) * scale // 1000
+    g = ((value >> 8) & 0xff) * scale // 1000
+    b = (value & 0xff) * scale // 1000
+    return "#%06x" % ((r << 16) | (g << 8) | b)
+
+
+def _apply_stylesheet(widget, stylesheet):
+    """Set a widget stylesheet, skipping the call when it is already applied
+    
+    Args:
+        widget: Widget to style
+        stylesheet: Stylesheet string
+    
+    Note:
+        setStyleSheet() reparses the stylesheet and repolishes the widget even
+        for an identical string. The last applied string is remembered on the
+        widget, so buttons must be styled through this helper to keep it accurate.
+    """
+    if getattr(widget, '_current_style', None) != stylesheet:
+        widget.setStyleSheet(stylesheet)
+        widget._current_style = stylesheet
+
+
+@functools.lru_cache(maxsize=128)
+def _generate_active_stylesheet(base_color, border_width, border_radius, padding, text_color):
+    """Generate stylesheet for active/selected elements (cached, see
+    EmojiPicker.generate_active_stylesheet)
+    
+    Note:
+        The stylesheet only depends on the arguments, so identical calls share
+        the same string object and nothing has to be invalidated on color changes
+    """
+    hover_color = _darken_color(base_color, 0.1)
+    pressed_color = _darken_color(base_color, 0.2)
+    
+    color_property = f"color: {text_color};" if text_color else ""
+    
+    return f"""
+        QPushButton {{
+            border: {border_width}px solid {base_color};
+            border-radius: {border_radius}px;
+            background-color: {base_color};
+            {color_property}
+            padding: {padding};
+        }}
+        QPushButton:hover {{
+            background-color: {hover_color};
+            border: {border_width}px solid {hover_color};
+        }}
+        QPushButton:pressed {{
+            background-color: {pressed_color};
+        }}
+        """
+
 
 class EmojiPicker(QMainWindow):
     """Main Emoji Picker application class"""
@@ -62,7 +201,8 @@ class EmojiPicker(QMainWindow):
     # - enabled: boolean, whether button should be enabled
     # - checked: boolean or None (None = keep current state)
     # - style: "" (normal) or "disabled" stylesheet
-    PACKAGE_BUTTON_CONFIG = {
+    # (read-only mapping proxy, shared by all instances)
+    PACKAGE_BUTTON_CONFIG = MappingProxyType({
         "custom": {
             "color": (False, False, None, "disabled"),
             "black": (False, False, None, "disabled"),
@@ -105,6 +245,46 @@ class EmojiPicker(QMainWindow):
             "open_folder": (False, False, None, ""),
             "refresh": (False, False, None, ""),
         },
+    })
+    
+    # Stylesheet applied for the "disabled" style of the table above, built
+    # once per theme so package switches only do a dict lookup
+    DISABLED_RADIO_STYLESHEETS = {
+        theme: ThemeManager.get_disabled_radio_stylesheet(theme)
+        for theme in ThemeManager.AVAILABLE_THEMES
+    }
+    
+    # Theme cycle order used by the T shortcut: Light -> Medium -> Dark -> Light
+    NEXT_THEME = {
+        ThemeManager.THEME_LIGHT: ThemeManager.THEME_MEDIUM,
+        ThemeManager.THEME_MEDIUM: ThemeManager.THEME_DARK,
+        ThemeManager.THEME_DARK: ThemeManager.THEME_LIGHT,
+    }
+    
+    # Keys handled by the global shortcuts, blocked on the filtered child widgets
+    SHORTCUT_KEYS = frozenset((Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Plus, Qt.Key_Minus))
+    
+    # Windows titlebar (caption color, text color) per (theme, has_focus), in
+    # DWM's 0x00BBGGRR format. Focused titlebars are lighter, unfocused ones
+    # match the interface background; unknown themes use the Light colors
+    TITLEBAR_COLORS = {
+        # Dark: #3c3c3c / #202020, white text
+        (ThemeManager.THEME_DARK, True): (0x003c3c3c, 0x00FFFFFF),
+        (ThemeManager.THEME_DARK, False): (0x00202020, 0x00FFFFFF),
+        # Medium: #707070 / #5a5a5a, white text
+        (ThemeManager.THEME_MEDIUM, True): (0x00707070, 0x00FFFFFF),
+        (ThemeManager.THEME_MEDIUM, False): (0x005a5a5a, 0x00FFFFFF),
+        # Light: Windows 11 official #FFFFFF / #F3F3F3, black text
+        (ThemeManager.THEME_LIGHT, True): (0x00FFFFFF, 0x00000000),
+        (ThemeManager.THEME_LIGHT, False): (0x00F3F3F3, 0x00000000),
+    }
+    
+    # DataManager attribute holding the emoji background color of each theme
+    # (read on access, so colors edited in Settings are picked up directly)
+    BACKGROUND_COLOR_ATTRS = {
+        ThemeManager.THEME_LIGHT: 'emoji_background_color_light',
+        ThemeManager.THEME_MEDIUM: 'emoji_background_color_medium',
+        ThemeManager.THEME_DARK: 'emoji_background_color_dark',
     }
     
     def __init__(self):
@@ -114,6 +294,12 @@ class EmojiPicker(QMainWindow):
         self.path_manager = PathManager()
         self.data_manager = DataManager(self.path_manager.get_emoji_data_file())
         self.cache_manager = CacheManager(max_size=1000)
+        # Rendered icons persisted across sessions (second tier behind cache_manager)
+        self.disk_cache_manager = DiskCacheManager(self.path_manager.get_user_cache_dir())
+        # Rendered icon pixmaps are also kept in Qt's process-wide pixmap cache
+        # (bounded in KB, least recently used evicted), so icons dropped by
+        # cache_manager are found again without decoding the disk cache PNG
+        QPixmapCache.setCacheLimit(64 * 1024)
         self.emoji_manager = EmojiManager()
         self.package_manager = PackageManager(self.path_manager)
         self.package_initializer = PackageInitializer(self)
@@ -121,19 +307,13 @@ class EmojiPicker(QMainWindow):
         # Build emoji folders dictionary (for backward compatibility)
         self.emoji_folders = self.path_manager.build_all_paths()
         
-        # Emoji Unicode codes for category buttons (used for dynamic icon loading)
-        self.category_emoji_codes = {
-            "activities": "26BD",  # Soccer Ball
-            "animals-nature": "1F436",  # Dog Face
-            "component": "1F3FD",  # Medium skin tone
-            "flags": "1F6A9",  # Triangular Flag On Post
-            "food-drink": "1F34E",  # Red Apple
-            "objects": "1F4F1",  # Mobile Phone
-            "people-body": "1F464",  # Bust in silhouette
-            "smileys-emotion": "1F603",  # Smiling Face With Open Mouth
-            "symbols": "267B",  # Black Universal Recycling Symbol
-            "travel-places": "2708"  # Airplane
-        }
+        # Emoji Unicode codes for category buttons (used for dynamic icon loading),
+        # shared read-only table
+        self.category_emoji_codes = _CATEGORY_EMOJI_CODES
+        # Emoji characters of the category codes, converted on first use (code -> emoji)
+        self._category_emojis = {}
+        # Kaomoji category tab icons (emoji -> QIcon), see _get_kaomoji_tab_icon()
+        self._kaomoji_tab_icons = {}
         
         # Get emoji packages configuration from PackageManager
         self.emoji_packages = self.package_manager.packages
@@ -148,31 +328,25 @@ class EmojiPicker(QMainWindow):
         self.emoji_data_file = self.data_manager.data_file
         
         # Initialize UI state variables
+        data_manager = self.data_manager
+        
         # Only restore last selected package if preference is enabled
-        if self.data_manager.get_preference('last_selected_package'):
-            self.current_emoji_package = self.data_manager.preferred_emoji_package
+        if data_manager.get_preference('last_selected_package'):
+            self.current_emoji_package = data_manager.preferred_emoji_package
         else:
             self.current_emoji_package = "EmojiTwo"  # Default package
         
-        # Default to EmojiTwo color 72px PNG
+        # Default to EmojiTwo color 72px PNG (also sets _emoji_folder_prefix)
         self.emoji_folder = self.path_manager.get_path("emojitwo_color_72_png")
         
         # Only restore category if preference is enabled
-        if self.data_manager.get_preference('category_button'):
-            self.current_category = self.data_manager.get_saved_setting(
-                'category_button', 'Recent & Favorites'
-            )
-        else:
-            self.current_category = 'Recent & Favorites'
+        self.current_category = data_manager.get_restored_setting('category_button', 'Recent & Favorites')
         
-        # Only restore subcategory if preference is enabled
-        if self.data_manager.get_preference('subcategory_tab'):
-            self.current_subcategory = self.data_manager.get_saved_setting(
-                'subcategory_tab', self.get_recent_favorites_tab_to_display()
-            )
-        else:
-            # Use user's preferred default tab for Recent & Favorites
-            self.current_subcategory = self.get_recent_favorites_tab_to_display()
+        # Only restore subcategory if preference is enabled, otherwise use
+        # user's preferred default tab for Recent & Favorites
+        self.current_subcategory = data_manager.get_restored_setting(
+            'subcategory_tab', self.get_recent_favorites_tab_to_display()
+        )
         
         self.current_emojis = []
         
@@ -181,72 +355,112 @@ class EmojiPicker(QMainWindow):
         self.kaomoji_tab_buttons = {}  # Stores tab buttons for kaomoji subcategories
         
         # Only restore emoji size if preference is enabled
-        if self.data_manager.get_preference('emoji_size'):
-            self.emoji_size = self.data_manager.get_saved_setting('emoji_size', 48)
-        else:
-            self.emoji_size = 48
+        self.emoji_size = data_manager.get_restored_setting('emoji_size', 48)
         
         self.emojis_per_row = 13  # Default emojis per row (calculated dynamically)
         
         # Only restore variation filter if preference is enabled
-        if self.data_manager.get_preference('emoji_variation_filter'):
-            self.variation_filter = self.data_manager.get_saved_setting('variation_filter', 'all')
-        else:
-            self.variation_filter = 'all'
+        self.variation_filter = data_manager.get_restored_setting(
+            'emoji_variation_filter', 'all', 'variation_filter'
+        )
         self.selected_emoji_button = None  # Track currently selected emoji button
         self.selected_emoji = None  # Track currently selected emoji character
         
         # Load custom selection colors
-        if self.data_manager.get_preference('emoji_selection_color'):
-            self.emoji_selection_color = self.data_manager.emoji_selection_color
+        if data_manager.get_preference('emoji_selection_color'):
+            self.emoji_selection_color = data_manager.emoji_selection_color
         else:
             self.emoji_selection_color = '#3699e7'  # Default blue
         
-        if self.data_manager.get_preference('category_subcategory_color'):
-            self.category_subcategory_color = self.data_manager.category_subcategory_color
+        if data_manager.get_preference('category_subcategory_color'):
+            self.category_subcategory_color = data_manager.category_subcategory_color
         else:
             self.category_subcategory_color = '#5555ff'  # Default blue
         
         # Store current theme
-        self.current_theme = self.data_manager.theme
+        self.current_theme = data_manager.theme
         
         # Contrast mode state (inverts emoji colors in Black + Dark theme)
         self.contrast_enabled = False
         
         # Copy save preferences from DataManager
-        self.save_preferences = self.data_manager.save_preferences
+        save_preferences = self.save_preferences = data_manager.save_preferences
         
         # Copy emoji data from DataManager
-        self.emoji_data = self.data_manager.emoji_data
-        self.emoji_names = self.data_manager.emoji_names
-        self.emoji_subcategories = self.data_manager.emoji_subcategories
-        self.recent_emojis = self.data_manager.recent_emojis
-        self.favorite_emojis = self.data_manager.favorite_emojis
-        self.frequently_used_emojis = self.data_manager.frequently_used_emojis
+        self.emoji_data = data_manager.emoji_data
+        self.emoji_names = data_manager.emoji_names
+        self.emoji_subcategories = data_manager.emoji_subcategories
+        self.recent_emojis = data_manager.recent_emojis
+        self.favorite_emojis = data_manager.favorite_emojis
+        self.frequently_used_emojis = data_manager.frequently_used_emojis
         
         # Store saved settings as attributes for apply_saved_ui_settings()
-        if self.save_preferences.get('color_black', False):
-            self.saved_color_mode = self.data_manager.get_saved_setting('color_mode', 'color')
+        if save_preferences.get('color_black', False):
+            self.saved_color_mode = data_manager.get_saved_setting('color_mode', 'color')
         
-        if self.save_preferences.get('format_selection', False):
-            self.saved_format = self.data_manager.get_saved_setting('format', 'png')
+        if save_preferences.get('format_selection', False):
+            self.saved_format = data_manager.get_saved_setting('format', 'png')
         
-        if self.save_preferences.get('package_size', False):
-            self.saved_package_size = self.data_manager.get_saved_setting('package_size', '72')
+        if save_preferences.get('package_size', False):
+            self.saved_package_size = data_manager.get_saved_setting('package_size', '72')
         
         # Predefined emoji sizes for +/- buttons
         self.predefined_sizes = [16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512]
         
-        # Cache for OpenMoji TTF font names (key: "color" or "black")
-        self.openmoji_ttf_fonts = {}
+        # Current Color/Black mode ("color" or "black"), mirrored from the radio
+        # buttons by _refresh_color_mode() so rendering code does not query them
+        self._color_mode = "color"
         
-        # Cache for Noto TTF font names (key: "color" or "black")
-        self.google_noto_ttf_fonts = {}
+        # OpenMoji and Noto TTF font names and paths for the current color mode
+        # (None = not found), set by _recompute_font_props()
+        self._font_name_openmoji = None
+        self._font_path_openmoji = None
+        self._font_name_noto = None
+        self._font_path_noto = None
         
         # Cache for registered font families (font_path -> font_family_name)
         # Only used for Noto Black (Qt native rendering)
         self.registered_font_families = {}
         
+        # Cache for theme-adapted SVG icons ((svg_path, theme, size) -> QIcon)
+        self._svg_icon_cache = {}
+        # Scratch images the SVG icons are rasterized into (size -> QImage)
+        self._svg_render_images = {}
+        # Scratch pixmaps the Qt fallback of create_emoji_icon renders into (size -> QPixmap)
+        self._scratch_pixmaps = {}
+        # Second-level emoji icon cache keyed by the image file itself
+        # ((path, mtime_ns, size, inverted) -> QIcon). Entries only live while the
+        # main icon cache holds the icon, so packages and folders resolving to the
+        # same file share the rendered icon without extra memory
+        self._file_icon_cache = weakref.WeakValueDictionary()
+        # Emoji buttons of the current grid that are not created yet, as
+        # (row, build method, build arguments) in row order, and the index of the
+        # first one still pending (see _materialize_visible_rows)
+        self._pending_emoji_buttons = []
+        self._pending_emoji_index = 0
+        # Zero-interval timer creating pending rows ahead of the viewport between
+        # user events (see _prefetch_emoji_row)
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setInterval(0)
+        self._prefetch_timer.timeout.connect(self._prefetch_emoji_row)
+        
+        # Entry names of the emoji folders looked up by get_emoji_image_path
+        # (folder path -> frozenset), so file checks need no stat() per emoji
+        self._folder_index = {}
+        # Their file names grouped by lowercase extension, built from the entries
+        # on first use (folder path -> {".png": sorted tuple of names, ...})
+        self._folder_extension_index = {}
+        # TTF font file of each font package and color mode
+        # ((package, color_mode) -> path or None), and modification time of each
+        # found file (path -> st_mtime_ns), see _scan_all_font_paths(). Missing
+        # fonts stay recorded as None until refresh_fonts()
+        self._package_font_index = {}
+        self._font_mtimes = {}
+        
+        # Rendering decisions of create_emoji_icon for the current package/settings,
+        # see _build_render_context() (None = rebuild on next use)
+        self._render_context = None
+        
         # Custom emoji formats available in the custom folder
         self.custom_emoji_formats_available = {"png": False, "svg": False, "ttf": False}
         
@@ -254,19 +468,62 @@ class EmojiPicker(QMainWindow):
         self.emoji_to_filename = {}
         self.compound_emoji_variations = {}
         
+        # Hotkeys and About dialogs are built on first open and reused afterwards
+        # (the Settings dialog edits preferences, so it is built for each open)
+        self._hotkeys_dialog = None
+        self._about_dialog = None
+        
+        # Last titlebar state applied through DWM ((hwnd, dark mode, caption color,
+        # text color)) and whether a deferred focus update is already scheduled
+        self._dwm_state = None
+        self._dwm_pending = False
+        # Active state seen by the last activation change (None = none seen yet)
+        self._last_active = None
+        
+        # Widgets created by init_ui, declared here so theme/style updates can
+        # test them directly instead of going through hasattr()
+        self.search_edit = None
+        self.contrast_button = None
+        self.category_buttons = {}
+        self.subcategory_buttons = {}
+        # All Color/Black, format and size radio buttons
+        self._all_radios = ()
+        
+        # Locate the package TTF fonts once, so Color/Black toggles only look them up
+        self._scan_all_font_paths()
         
         # Setup UI first (creates radio buttons and other UI elements)
         self.init_ui()
         
+        # Apply saved UI settings (color/black, format, package size, variation filter)
+        # before the first paint, so the controls never show their defaults
+        self.apply_saved_ui_settings()
+        self._recompute_font_props()
+        
         # Apply theme
         self.apply_theme(self.data_manager.theme)
         
-        # Apply saved UI settings (color/black, format, package size, variation filter)
-        self.apply_saved_ui_settings()
+        # Setup keyboard shortcuts
+        self.setup_keyboard_shortcuts()
+        
+        # Populate the window once the event loop is running, so the first paint
+        # of the (themed) window is not held back by package initialization;
+        # the source label reports the pending load until then
+        self.displayed_emoji_source_label.setText("Displayed emojis: Loading...")
+        QTimer.singleShot(0, self._finish_init)
+    
+    def _finish_init(self):
+        """Second startup phase, run from the event loop right after the window is shown
         
+        Registers fonts and initializes the current package (loads and renders
+        its emojis).
+        """
         # Register external TTF fonts (Noto Black only) for fast Qt rendering
         self.register_external_fonts()
         
+        # The Noto Black font name depends on the registered fonts
+        self._recompute_font_props()
+        
         # Apply package-specific initialization using PackageInitializer
         # Special pre-initialization for Custom package (detect formats)
         if self.current_emoji_package == "Custom":
@@ -278,71 +535,75 @@ class EmojiPicker(QMainWindow):
         # Update displayed emoji source label (for all packages)
         self.update_displayed_emoji_source_label()
         
-        # Force UI update to ensure proper rendering at startup
-        QApplication.processEvents()
-        
         # Re-adjust grid height after UI is fully rendered (fixes startup layout issue)
         if self.current_emoji_package != "Custom":
             num_rows = self.get_current_subcategory_rows_count()
             self.adjust_grid_height_for_subcategories(num_rows)
-        
-        # Setup keyboard shortcuts
-        self.setup_keyboard_shortcuts()
     
     @property
     def emoji_background_color(self):
         """Get the current emoji background color based on active theme"""
-        if self.current_theme == ThemeManager.THEME_LIGHT:
-            return self.data_manager.emoji_background_color_light
-        elif self.current_theme == ThemeManager.THEME_MEDIUM:
-            return self.data_manager.emoji_background_color_medium
-        else:
-            return self.data_manager.emoji_background_color_dark
+        return getattr(
+            self.data_manager,
+            self.BACKGROUND_COLOR_ATTRS.get(self.current_theme, 'emoji_background_color_dark')
+        )
+    
+    @property
+    def emoji_folder(self):
+        """Get the folder the emoji images of the current package are loaded from"""
+        return self._emoji_folder
+    
+    @emoji_folder.setter
+    def emoji_folder(self, folder):
+        """Set the emoji folder and the prefix per-emoji paths are built from
+        
+        Args:
+            folder: Folder path
+        """
+        self._emoji_folder = folder
+        # Folder with a trailing separator, so per-emoji paths are built with a
+        # plain concatenation
+        self._emoji_folder_prefix = os.path.join(folder, '')
     
     def setup_keyboard_shortcuts(self):
         """Setup global keyboard shortcuts"""
-        # Page Up: Navigate to previous package
-        shortcut_page_up = QShortcut(QKeySequence(Qt.Key_PageUp), self)
-        shortcut_page_up.activated.connect(self.navigate_to_previous_package)
-        shortcut_page_up.setContext(Qt.ApplicationShortcut)
-        
-        # Page Down: Navigate to next package
-        shortcut_page_down = QShortcut(QKeySequence(Qt.Key_PageDown), self)
-        shortcut_page_down.activated.connect(self.navigate_to_next_package)
-        shortcut_page_down.setContext(Qt.ApplicationShortcut)
-        
-        # Numpad Minus: Decrease emoji size
-        shortcut_numpad_minus = QShortcut(QKeySequence(Qt.Key_Minus), self)
-        shortcut_numpad_minus.activated.connect(self.on_decrease_size)
-        shortcut_numpad_minus.setContext(Qt.ApplicationShortcut)
-        
-        # Numpad Plus: Increase emoji size
-        shortcut_numpad_plus = QShortcut(QKeySequence(Qt.Key_Plus), self)
-        shortcut_numpad_plus.activated.connect(self.on_increase_size)
-        shortcut_numpad_plus.setContext(Qt.ApplicationShortcut)
-        
-        # T: Cycle through themes (Light -> Medium -> Dark -> Light)
-        shortcut_theme_toggle = QShortcut(QKeySequence(Qt.Key_T), self)
-        shortcut_theme_toggle.activated.connect(self.cycle_theme)
-        shortcut_theme_toggle.setContext(Qt.WindowShortcut)
+        # (key, slot, context) for each shortcut
+        shortcuts = (
+            # Page Up: Navigate to previous package
+            (Qt.Key_PageUp, self.navigate_to_previous_package, Qt.ApplicationShortcut),
+            # Page Down: Navigate to next package
+            (Qt.Key_PageDown, self.navigate_to_next_package, Qt.ApplicationShortcut),
+            # Numpad Minus: Decrease emoji size
+            (Qt.Key_Minus, self.on_decrease_size, Qt.ApplicationShortcut),
+            # Numpad Plus: Increase emoji size
+            (Qt.Key_Plus, self.on_increase_size, Qt.ApplicationShortcut),
+            # T: Cycle through themes (Light -> Medium -> Dark -> Light)
+            (Qt.Key_T, self.cycle_theme, Qt.WindowShortcut),
+        )
+        for key, slot, context in shortcuts:
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(slot)
+            shortcut.setContext(context)
         
         # Install event filter on widgets to prevent them from handling Page Up/Down
-        self.emoji_package_combo.installEventFilter(self)
-        self.emoji_scroll_area.installEventFilter(self)
-        self.search_edit.installEventFilter(self)
+        filtered_widgets = (self.emoji_package_combo, self.emoji_scroll_area, self.search_edit)
+        for widget in filtered_widgets:
+            widget.installEventFilter(self)
+        # Identities of the filtered widgets, for a set lookup in eventFilter
+        self._filtered_widget_ids = frozenset(map(id, filtered_widgets))
     
     def eventFilter(self, obj, event):
         """Event filter to intercept keyboard shortcuts on various widgets"""
-        from PyQt5.QtCore import QEvent
+        # Most events routed here are not key presses: bail out after a single
+        # integer comparison
+        if event.type() != QEvent.KeyPress:
+            return super().eventFilter(obj, event)
         
         # Block Page Up/Down and +/- from being processed by child widgets
         # so our global shortcuts can handle them
-        if event.type() == QEvent.KeyPress:
-            if event.key() in (Qt.Key_PageUp, Qt.Key_PageDown, Qt.Key_Plus, Qt.Key_Minus):
-                # Check if it's from one of our filtered widgets
-                if obj in (self.emoji_package_combo, self.emoji_scroll_area, self.search_edit):
-                    # Let our shortcuts handle it instead
-                    return True  # Event is handled, don't propagate to widget
+        if event.key() in self.SHORTCUT_KEYS and id(obj) in self._filtered_widget_ids:
+            # Let our shortcuts handle it instead
+            return True  # Event is handled, don't propagate to widget
         
         # Let other events pass through
         return super().eventFilter(obj, event)
@@ -375,15 +636,17 @@ class EmojiPicker(QMainWindow):
         This method checks if system fonts like 'Segoe UI Emoji' are available
         and removes them from the packages dictionary if not found.
         """
-        font_database = QFontDatabase()
         packages_to_remove = []
+        # Installed font families, queried once (and only if needed) as a set
+        available_families = None
         
         for package_name, package_config in self.emoji_packages.items():
             if package_config.get("type") == "system_font":
                 font_name = package_config.get("font_name")
                 if font_name:
                     # Check if font is available on the system
-                    available_families = font_database.families()
+                    if available_families is None:
+                        available_families = frozenset(QFontDatabase().families())
                     if font_name not in available_families:
                         packages_to_remove.append(package_name)
                         # If current package is unavailable, switch to default
@@ -411,6 +674,8 @@ class EmojiPicker(QMainWindow):
                 families = QFontDatabase.applicationFontFamilies(font_id)
                 if families:
                     self.registered_font_families[noto_black_font] = families[0]
+                    # The Noto Black font name is resolved from the registered families
+                    self._invalidate_render_context()
     
     def generate_active_stylesheet(
         self, base_color, border_width=1, border_radius=3, padding='5px', text_color='white'
@@ -427,28 +692,8 @@ class EmojiPicker(QMainWindow):
         Returns:
             Complete stylesheet string
         """
-        hover_color = self.darken_color(base_color, 0.1)
-        pressed_color = self.darken_color(base_color, 0.2)
-        
-        color_property = f"color: {text_color};" if text_color else ""
-        
-        return f"""
-        QPushButton {{
-            border: {border_width}px solid {base_color};
-            border-radius: {border_radius}px;
-            background-color: {base_color};
-            {color_property}
-            padding: {padding};
-        }}
-        QPushButton:hover {{
-            background-color: {hover_color};
-            border: {border_width}px solid {hover_color};
-        }}
-        QPushButton:pressed {{
-            background-color: {pressed_color};
-        }}
-        """
-        
+        return _generate_active_stylesheet(base_color, border_width, border_radius, padding, text_color)
+    
     def darken_color(self, hex_color, factor=0.1):
         """Darken a hex color by a factor (0.0 to 1.0)
         
@@ -459,44 +704,25 @@ class EmojiPicker(QMainWindow):
         Returns:
             Darkened hex color string
         """
-        # Remove '#' if present
-        hex_color = hex_color.lstrip('#')
-        
-        # Convert hex to RGB
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        
-        # Darken by factor
-        r = max(0, int(r * (1 - factor)))
-        g = max(0, int(g * (1 - factor)))
-        b = max(0, int(b * (1 - factor)))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _darken_color(hex_color, round(factor, 3))
     
     def update_selection_color_stylesheets(self):
         """Update all UI elements with the new custom colors"""
         # Update selected emoji button if any
         if self.selected_emoji_button:
-            self.selected_emoji_button.setStyleSheet(self.get_button_selected_stylesheet())
+            _apply_stylesheet(self.selected_emoji_button, self.get_button_selected_stylesheet())
         
-        # Update category buttons
-        if hasattr(self, 'category_buttons'):
-            for cat_name, cat_button in self.category_buttons.items():
-                if cat_name == self.current_category:
-                    cat_button.setStyleSheet(self.get_active_category_stylesheet())
+        # Update the active category button (only one uses the custom color)
+        if self.category_buttons:
+            cat_button = self.category_buttons.get(self.current_category)
+            if cat_button:
+                _apply_stylesheet(cat_button, self.get_active_category_stylesheet())
         
-        # Update subcategory buttons
-        if hasattr(self, 'subcategory_buttons_widget') and self.subcategory_buttons_widget:
-            for i in range(self.subcategory_buttons_widget.layout().count()):
-                widget = self.subcategory_buttons_widget.layout().itemAt(i).widget()
-                if isinstance(widget, QPushButton):
-                    # Check if this is the active button
-                    if hasattr(widget, 'objectName') and widget.objectName():
-                        subcategory_name = widget.objectName()
-                        if subcategory_name == self.current_subcategory:
-                            widget.setStyleSheet(self.get_active_button_stylesheet())
+        # Update the active subcategory button
+        if self.subcategory_buttons:
+            subcat_button = self.subcategory_buttons.get(self.current_subcategory)
+            if subcat_button:
+                _apply_stylesheet(subcat_button, self.get_active_button_stylesheet())
         
         # Update background color button hover style
         self.update_bg_color_button_style()
@@ -508,10 +734,15 @@ class EmojiPicker(QMainWindow):
             theme: Theme name ('Light', 'Medium', or 'Dark')
         """
         self.current_theme = theme
+        # Single composite stylesheet on the main window: the search field and
+        # size input are styled through their object names, so Qt parses and
+        # re-polishes once per theme change instead of once per widget
         self.setStyleSheet(
             ThemeManager.get_mainwindow_stylesheet(
                 theme, self.category_subcategory_color
             )
+            + ThemeManager.get_search_edit_stylesheet(theme, "QLineEdit#SearchEdit")
+            + ThemeManager.get_size_input_stylesheet(theme, "QLineEdit#SizeInput")
         )
         
         # Update background color button style and refresh emoji display
@@ -523,9 +754,8 @@ class EmojiPicker(QMainWindow):
         # Only works on Windows 10 (build 17763+) and Windows 11
         self.set_windows_titlebar_theme(theme)
         
-        # Update search field style
-        if hasattr(self, 'search_edit'):
-            self.search_edit.setStyleSheet(ThemeManager.get_search_edit_stylesheet(theme))
+        # Update search field placeholder
+        if self.search_edit is not None:
             # Set placeholder text color based on theme
             palette = self.search_edit.palette()
             if theme == ThemeManager.THEME_LIGHT:
@@ -534,19 +764,15 @@ class EmojiPicker(QMainWindow):
                 palette.setColor(QPalette.PlaceholderText, QColor("#888888"))
             self.search_edit.setPalette(palette)
         
-        # Update size input field style
-        if hasattr(self, 'size_input'):
-            self.size_input.setStyleSheet(ThemeManager.get_size_input_stylesheet(theme))
-        
         # Update category button icons (for extras SVG icons color inversion in Dark and Medium themes)
-        if hasattr(self, 'category_buttons'):
+        if self.category_buttons:
             self.update_category_icons_for_theme(theme)
         
         # Update all buttons with new theme
         self.update_all_button_styles()
         
         # Update Contrast button style to adapt tooltip to new theme
-        if hasattr(self, 'contrast_button'):
+        if self.contrast_button is not None:
             self.update_contrast_button_state()
     
     def cycle_theme(self):
@@ -554,22 +780,10 @@ class EmojiPicker(QMainWindow):
         
         This method is triggered by the T keyboard shortcut.
         """
-        # Define theme cycle order
-        theme_order = [ThemeManager.THEME_LIGHT, ThemeManager.THEME_MEDIUM, ThemeManager.THEME_DARK]
+        # Get next theme (an unknown current theme cycles as if it were Light)
+        next_theme = self.NEXT_THEME.get(self.current_theme, ThemeManager.THEME_MEDIUM)
         
-        # Find current theme index
-        try:
-            current_index = theme_order.index(self.current_theme)
-        except ValueError:
-            # If current theme is not in the list, default to Light
-            current_index = 0
-        
-        # Get next theme (cycle back to start if at the end)
-        next_index = (current_index + 1) % len(theme_order)
-        next_theme = theme_order[next_index]
-        
-        # Apply the new theme
-        self.current_theme = next_theme
+        # Apply the new theme (apply_theme also updates self.current_theme)
         self.apply_theme(next_theme)
         
         # Save theme preference
@@ -586,28 +800,39 @@ class EmojiPicker(QMainWindow):
         Returns:
             QIcon or None if loading failed
         """
-        if not os.path.exists(svg_path):
-            return None
+        cache_key = (svg_path, self.current_theme, size)
+        icon = self._svg_icon_cache.get(cache_key)
+        if icon is not None:
+            return icon
         
+        # A missing file makes open() raise, handled below
         try:
-            with open(svg_path, 'r', encoding='utf-8') as f:
-                svg_content = f.read()
+            # Work on the raw bytes: the substitution is pure ASCII, so there is
+            # no need for a UTF-8 decode/encode round-trip
+            with open(svg_path, 'rb') as f:
+                svg_bytes = f.read()
             
             # Invert colors for Dark and Medium themes (black -> white)
-            if self.current_theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM]:
-                svg_content = svg_content.replace('fill: #000000', 'fill: #ffffff')
-                svg_content = svg_content.replace('fill:#000000', 'fill:#ffffff')
+            if self.current_theme in ThemeManager.DARK_THEMES:
+                svg_bytes = svg_bytes.replace(b'fill: #000000', b'fill: #ffffff')
+                svg_bytes = svg_bytes.replace(b'fill:#000000', b'fill:#ffffff')
             
-            svg_bytes = svg_content.encode('utf-8')
             svg_renderer = QSvgRenderer(svg_bytes)
             
             if svg_renderer.isValid():
-                pixmap = QPixmap(size, size)
-                pixmap.fill(Qt.transparent)
-                painter = QPainter(pixmap)
+                # Render into a scratch image reused for each size, and only
+                # convert to a pixmap once the drawing is done
+                image = self._svg_render_images.get(size)
+                if image is None:
+                    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+                    self._svg_render_images[size] = image
+                image.fill(Qt.transparent)
+                painter = QPainter(image)
                 svg_renderer.render(painter)
                 painter.end()
-                return QIcon(pixmap)
+                icon = QIcon(QPixmap.fromImage(image))
+                self._svg_icon_cache[cache_key] = icon
+                return icon
         except Exception:
             pass
         
@@ -620,16 +845,10 @@ class EmojiPicker(QMainWindow):
             theme: Theme name ('Light', 'Medium', or 'Dark')
         """
         # Update extras SVG icons (Recent & Favorites, extras-openmoji, extras-unicode)
-        category_svg_icons = {
-            "Recent & Favorites": self.path_manager.get_misc_file("Recent_Favorites.svg"),
-            "extras-openmoji": self.path_manager.get_misc_file("extras_OpenMoji.svg"),
-            "extras-unicode": self.path_manager.get_misc_file("extras_Unicode.svg")
-        }
-        
-        for category, svg_path in category_svg_icons.items():
+        for category, svg_file in _CATEGORY_SVG_FILES.items():
             if category in self.category_buttons:
                 btn = self.category_buttons[category]
-                icon = self.load_svg_icon_with_theme(svg_path, 32)
+                icon = self.load_svg_icon_with_theme(self.path_manager.get_misc_file(svg_file), 32)
                 if icon:
                     btn.setIcon(icon)
                     btn.setIconSize(QSize(32, 32))
@@ -674,90 +893,64 @@ class EmojiPicker(QMainWindow):
             DWMWA_TEXT_COLOR = 36
             
             # Set to dark mode if theme is Dark or Medium, light mode for Light
-            use_dark_mode = 1 if theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM] else 0
+            use_dark_mode = 1 if theme in ThemeManager.DARK_THEMES else 0
+            
+            titlebar_color, text_color = self.TITLEBAR_COLORS.get(
+                (theme, has_focus), self.TITLEBAR_COLORS[(ThemeManager.THEME_LIGHT, has_focus)]
+            )
+            
+            # Nothing to do if this exact state was already applied to this
+            # native window (the handle changes when Qt recreates it)
+            state = (hwnd, use_dark_mode, titlebar_color, text_color)
+            if self._dwm_state == state:
+                return
             
             # Try the newer attribute first (Windows 10 20H1+)
+            applied = True
             try:
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd,
-                    DWMWA_USE_IMMERSIVE_DARK_MODE,
-                    ctypes.byref(ctypes.c_int(use_dark_mode)),
-                    ctypes.sizeof(ctypes.c_int)
-                )
+                set_dwm_attribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, use_dark_mode)
             except (OSError, AttributeError):
                 # Fall back to the older attribute (Windows 10 1809-2004)
                 try:
-                    ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                        hwnd,
-                        DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20H1,
-                        ctypes.byref(ctypes.c_int(use_dark_mode)),
-                        ctypes.sizeof(ctypes.c_int)
-                    )
+                    set_dwm_attribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE_BEFORE_20H1, use_dark_mode)
                 except (OSError, AttributeError):
-                    pass
+                    applied = False
             
-            # Set custom titlebar colors for Windows 11
-            try:
-                # Color format: 0x00BBGGRR (BGR order, not RGB)
-                if theme == ThemeManager.THEME_DARK:
-                    # Dark theme colors
-                    # Active (focused): #3c3c3c = RGB(60, 60, 60) = lighter
-                    # Inactive (unfocused): #202020 = RGB(32, 32, 32) = same as interface background
-                    if has_focus:
-                        titlebar_color = 0x003c3c3c  # Lighter when focused
-                    else:
-                        titlebar_color = 0x00202020  # Same as interface background when not focused
-                    
-                    # Force text color to white (0xFFFFFF) in dark mode
-                    text_color = 0x00FFFFFF  # White in BGR format
-                elif theme == ThemeManager.THEME_MEDIUM:
-                    # Medium theme colors
-                    # Active (focused): #707070 = RGB(112, 112, 112) = lighter medium
-                    # Inactive (unfocused): #5a5a5a = RGB(90, 90, 90) = same as interface background
-                    if has_focus:
-                        titlebar_color = 0x00707070  # Lighter when focused
-                    else:
-                        titlebar_color = 0x005a5a5a  # Same as interface background when not focused
-                    
-                    # Force text color to white (0xFFFFFF) in medium mode
-                    text_color = 0x00FFFFFF  # White in BGR format
-                else:
-                    # Light theme colors - Windows 11 official colors
-                    # Active (focused): #FFFFFF = RGB(255, 255, 255) = white
-                    # Inactive (unfocused): #F3F3F3 = RGB(243, 243, 243) = light gray
-                    if has_focus:
-                        titlebar_color = 0x00FFFFFF  # White when focused
-                    else:
-                        titlebar_color = 0x00F3F3F3  # Light gray when not focused
+            # Set custom titlebar colors (only supported on Windows 11)
+            if _IS_WIN11:
+                try:
+                    set_dwm_attribute(hwnd, DWMWA_CAPTION_COLOR, titlebar_color)
                     
-                    # Use default black text color in light mode (no need to set explicitly)
-                    text_color = 0x00000000  # Black in BGR format
-                
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd,
-                    DWMWA_CAPTION_COLOR,
-                    ctypes.byref(ctypes.c_int(titlebar_color)),
-                    ctypes.sizeof(ctypes.c_int)
-                )
-                
-                ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                    hwnd,
-                    DWMWA_TEXT_COLOR,
-                    ctypes.byref(ctypes.c_int(text_color)),
-                    ctypes.sizeof(ctypes.c_int)
-                )
-            except (OSError, AttributeError):
-                # Windows 11 API not available (Windows 10 or older)
-                pass
+                    set_dwm_attribute(hwnd, DWMWA_TEXT_COLOR, text_color)
+                except (OSError, AttributeError):
+                    applied = False
+            
+            # Only remember the state once DWM accepted every call (failing calls
+            # raise OSError), so a failed attempt is retried on the next update
+            if applied:
+                self._dwm_state = state
         except (OSError, AttributeError):
             # Silently fail if the API is not available
             pass
     
+    def _flush_titlebar_theme(self):
+        """Apply the titlebar theme for the focus state once a burst of activation changes settles"""
+        self._dwm_pending = False
+        self.set_windows_titlebar_theme(self.current_theme, self.isActiveWindow())
+    
     def changeEvent(self, event):
         """Handle window state changes (focus gain/loss)"""
         if event.type() == event.ActivationChange:
-            # Update titlebar color based on focus state (for both Dark and Light themes)
-            self.set_windows_titlebar_theme(self.current_theme, self.isActiveWindow())
+            # Update titlebar color based on focus state (for both Dark and Light themes).
+            # Qt may report the same active state twice, which needs no update.
+            # Activation changes come in bursts (dragging, focus flicker), so the
+            # update is deferred to the event loop and only applied once per burst
+            active = self.isActiveWindow()
+            if active != self._last_active:
+                self._last_active = active
+                if not self._dwm_pending:
+                    self._dwm_pending = True
+                    QTimer.singleShot(0, self._flush_titlebar_theme)
         super().changeEvent(event)
     
     def get_emoji_button_stylesheet(self):
@@ -794,25 +987,40 @@ class EmojiPicker(QMainWindow):
     
     def get_disabled_radio_stylesheet(self):
         """Get stylesheet for disabled radio buttons based on current theme"""
-        return ThemeManager.get_disabled_radio_stylesheet(self.current_theme)
+        stylesheet = self.DISABLED_RADIO_STYLESHEETS.get(self.current_theme)
+        if stylesheet is None:
+            stylesheet = ThemeManager.get_disabled_radio_stylesheet(self.current_theme)
+        return stylesheet
     
     def update_all_button_styles(self):
         """Update all button styles when theme changes"""
+        # Repaint once at the end instead of after every restyled button
+        # (re-enabling updates schedules the repaint)
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_all_button_styles()
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _update_all_button_styles(self):
+        """Restyle all buttons (see update_all_button_styles)"""
+        # Build each stylesheet once, then reuse it for every button below
+        active_cat = self.get_active_category_stylesheet()
+        inactive_cat = self.get_inactive_category_stylesheet()
+        active_sub = self.get_active_button_stylesheet()
+        inactive_sub = self.get_inactive_button_stylesheet()
+        emoji_style = self.get_emoji_button_stylesheet()
+        selected_style = self.get_button_selected_stylesheet()
+        
         # Update category buttons
-        if hasattr(self, 'category_buttons'):
-            for cat_name, cat_button in self.category_buttons.items():
-                if cat_name == self.current_category:
-                    cat_button.setStyleSheet(self.get_active_category_stylesheet())
-                else:
-                    cat_button.setStyleSheet(self.get_inactive_category_stylesheet())
+        current_category = self.current_category
+        for cat_name, cat_button in self.category_buttons.items():
+            _apply_stylesheet(cat_button, active_cat if cat_name == current_category else inactive_cat)
         
         # Update subcategory buttons
-        if hasattr(self, 'subcategory_buttons'):
-            for subcat_name, subcat_button in self.subcategory_buttons.items():
-                if subcat_name == self.current_subcategory:
-                    subcat_button.setStyleSheet(self.get_active_button_stylesheet())
-                else:
-                    subcat_button.setStyleSheet(self.get_inactive_button_stylesheet())
+        current_subcategory = self.current_subcategory
+        for subcat_name, subcat_button in self.subcategory_buttons.items():
+            _apply_stylesheet(subcat_button, active_sub if subcat_name == current_subcategory else inactive_sub)
         
         # Update Kaomoji tab buttons
         if hasattr(self, 'kaomoji_tab_buttons') and self.kaomoji_tab_buttons:
@@ -821,32 +1029,47 @@ class EmojiPicker(QMainWindow):
         # Update emoji buttons in grid
         if hasattr(self, 'emoji_scroll_area'):
             emoji_content = self.emoji_scroll_area.widget()
-            if emoji_content and emoji_content.layout():
-                for i in range(emoji_content.layout().count()):
-                    item = emoji_content.layout().itemAt(i)
-                    if item and item.widget():
-                        btn = item.widget()
-                        if isinstance(btn, QPushButton):
-                            if self.selected_emoji_button and btn == self.selected_emoji_button:
-                                btn.setStyleSheet(self.get_button_selected_stylesheet())
-                            else:
-                                btn.setStyleSheet(self.get_emoji_button_stylesheet())
+            layout = emoji_content.layout() if emoji_content else None
+            if layout:
+                selected_button = self.selected_emoji_button
+                for i in range(layout.count()):
+                    btn = layout.itemAt(i).widget()
+                    if isinstance(btn, QPushButton):
+                        _apply_stylesheet(btn, selected_style if btn is selected_button else emoji_style)
         
         # Update disabled radio buttons
-        if hasattr(self, 'color_radio'):
-            radio_buttons = [
-                self.color_radio, self.black_radio, self.png_radio,
-                self.svg_radio, self.ttf_radio, self.size_72_radio,
-                self.size_618_radio
-            ]
-            for radio_button in radio_buttons:
-                if not radio_button.isEnabled():
-                    radio_button.setStyleSheet(self.get_disabled_radio_stylesheet())
-                else:
-                    radio_button.setStyleSheet("")
+        if self._all_radios:
+            disabled_style = self.get_disabled_radio_stylesheet()
+            for radio_button in self._all_radios:
+                _apply_stylesheet(radio_button, "" if radio_button.isEnabled() else disabled_style)
     
     def apply_saved_ui_settings(self):
-        """Apply saved UI settings (color/black, format, package size, variation filter) after UI is initialized"""
+        """Apply saved UI settings (color/black, format, package size, variation filter) after UI is initialized
+        
+        Note:
+            Signals of the restored widgets are blocked while their state is set:
+            the saved values are already in effect, and the variation filter
+            handler would otherwise save the preference again and repopulate the
+            grid before the package is even initialized.
+        """
+        restored_widgets = self._all_radios + (self.variation_filter_combo,)
+        for widget in restored_widgets:
+            widget.blockSignals(True)
+        try:
+            self._restore_saved_ui_settings()
+        finally:
+            for widget in restored_widgets:
+                widget.blockSignals(False)
+        
+        # Color mode and format may have changed without emitting toggled
+        self._refresh_color_mode()
+        self._invalidate_render_context()
+        
+        # Update Contrast button state based on Color/Black mode
+        self.update_contrast_button_state()
+    
+    def _restore_saved_ui_settings(self):
+        """Set the widgets restored by apply_saved_ui_settings to their saved state"""
         # Apply saved color mode
         if hasattr(self, 'saved_color_mode'):
             if self.saved_color_mode == "black":
@@ -882,95 +1105,216 @@ class EmojiPicker(QMainWindow):
         # Apply saved emoji size
         if hasattr(self, 'emoji_size'):
             self.size_input.setText(str(self.emoji_size))
-        
-        # Update Contrast button state based on Color/Black mode
-        self.update_contrast_button_state()
-    
     
     def get_emoji_image_path(self, emoji):
         """Get the PNG/SVG file path for an emoji character"""
         if emoji in self.emoji_to_filename:
             filename = self.emoji_to_filename[emoji]
-            image_path = os.path.join(self.emoji_folder, filename)
             
             # Check if file exists in current folder
-            if os.path.exists(image_path):
-                return image_path
+            if filename in self._folder_entries(self.emoji_folder):
+                return self._emoji_folder_prefix + filename
             
             # Special handling for EmojiTwo: if file doesn't exist in size-specific folder,
             # try to find it in the default folder
             if self.current_emoji_package == "EmojiTwo":
-                import re
                 folder_name = os.path.basename(self.emoji_folder)
-                if re.match(r'^\d+$', folder_name):  # Folder name is just a number (size)
+                if folder_name.isdigit():  # Folder name is just a number (size)
                     # Determine the default folder path based on current color/black selection
                     # This ensures we load the correct variant (color or black)
-                    # Check if radio buttons exist (they might not during initialization)
-                    if hasattr(self, 'black_radio') and self.black_radio.isChecked():
+                    if self._color_mode == "black":
                         default_folder = self.path_manager.get_path("emojitwo_black_default_png")
                     else:
                         default_folder = self.path_manager.get_path("emojitwo_color_default_png")
                     
                     # Try to find the file in the default folder
-                    default_path = os.path.join(default_folder, filename)
-                    if os.path.exists(default_path):
-                        return default_path
+                    if filename in self._folder_entries(default_folder):
+                        return os.path.join(default_folder, filename)
         
         return None
     
-    def create_emoji_button(self, emoji, row, col):
-        """Create an emoji button and add it to the grid (utility method to avoid duplication)"""
-        # Create emoji button
-        btn = DoubleClickButton()
-        btn.setFixedSize(self.emoji_size, self.emoji_size)
-        btn.setMinimumSize(self.emoji_size, self.emoji_size)
-        btn.setMaximumSize(self.emoji_size, self.emoji_size)
+    def _folder_entries(self, folder):
+        """Get the names of the entries of a package folder, scanned once
+        
+        Args:
+            folder: Folder path
+        
+        Returns:
+            frozenset: Entry names (empty if the folder cannot be read)
+        """
+        entries = self._folder_index.get(folder)
+        if entries is None:
+            try:
+                with os.scandir(folder) as it:
+                    entries = frozenset(entry.name for entry in it)
+            except OSError:
+                entries = frozenset()
+            self._folder_index[folder] = entries
+        return entries
+    
+    def forget_folder_listing(self, folder):
+        """Drop the cached listing of a folder, so it is scanned again on next use
+        
+        Args:
+            folder: Folder path
+        """
+        self._folder_index.pop(folder, None)
+        self._folder_extension_index.pop(folder, None)
+    
+    def _folder_files_by_extension(self, folder):
+        """Get the file names of a package folder grouped by extension, built once
         
-        # Load PNG/SVG image for emoji
+        Args:
+            folder: Folder path
+        
+        Returns:
+            dict: Lowercase extension (e.g. ".png") -> sorted tuple of file names
+        """
+        groups = self._folder_extension_index.get(folder)
+        if groups is None:
+            grouped = {}
+            for name in self._folder_entries(folder):
+                grouped.setdefault(os.path.splitext(name)[1].lower(), []).append(name)
+            groups = {extension: tuple(sorted(names)) for extension, names in grouped.items()}
+            self._folder_extension_index[folder] = groups
+        return groups
+    
+    def create_emoji_button(self, emoji, row, col, shift_click=False, name=None):
+        """Create an emoji button and add it to the grid (utility method to avoid duplication)
+        
+        Args:
+            emoji: Emoji character
+            row: Grid row
+            col: Grid column
+            shift_click: Whether Shift+Click toggles the emoji in favorites
+            name: Emoji name for the tooltip, when the caller already looked it up
+        
+        Returns:
+            The created button
+        """
+        # Resolve everything the button shows first, then build it in one go
         icon = self.create_emoji_icon(emoji, self.emoji_size)
-        if icon:
-            btn.setIcon(icon)
-            btn.setIconSize(QSize(self.emoji_size, self.emoji_size))
+        is_selected = emoji == self.selected_emoji
+        if is_selected:
+            style = self.get_button_selected_stylesheet()
         else:
-            # For EmojiTwo, if emoji doesn't exist, just leave button empty
-            if self.current_emoji_package != "EmojiTwo":
-                # Fallback to text for other packages (font size proportional to emoji_size)
-                btn.setText(emoji)
-                # Calculate font size proportional to emoji_size (16pt for 48px = 0.333 ratio)
-                font_size = max(8, int(self.emoji_size * 0.333))
-                emoji_font = QFont("Segoe UI Emoji", font_size)
-                btn.setFont(emoji_font)
-        
-        # Apply appropriate stylesheet based on selection state
-        if emoji == self.selected_emoji:
-            btn.setStyleSheet(self.get_button_selected_stylesheet())
+            style = self.get_emoji_button_stylesheet()
+        
+        if name is None:
+            name = self.get_emoji_name(emoji)
+        
+        btn = self._build_emoji_button(emoji, icon, style, name, shift_click)
+        if is_selected:
             self.selected_emoji_button = btn
-        else:
-            btn.setStyleSheet(self.get_emoji_button_stylesheet())
         
-        btn.clicked.connect(
-            lambda checked=False, e=emoji, b=btn: self.on_emoji_click(e, b)
-        )
-        btn.doubleClicked.connect(
-            lambda checked=False, e=emoji, b=btn: self.on_emoji_double_click(e, b)
-        )
+        # Add to grid with explicit positioning
+        self.emoji_layout.addWidget(btn, row, col)
+        
+        return btn
+    
+    def _build_emoji_button(self, emoji, icon, style, tooltip, shift_click):
+        """Build an emoji grid button from its precomputed icon, stylesheet and tooltip
+        
+        Args:
+            emoji: Emoji character (stored as the button's 'emoji' property)
+            icon: QIcon for the emoji, or None to fall back to text
+            style: Stylesheet to apply
+            tooltip: Tooltip text
+            shift_click: Whether to connect the Shift+Click handler
+        
+        Returns:
+            DoubleClickButton: The button, not yet added to the grid
+        """
+        # Create emoji button (setFixedSize also sets the minimum and maximum size)
+        btn = DoubleClickButton()
+        button_size = QSize(self.emoji_size, self.emoji_size)
+        btn.setFixedSize(button_size)
+        
+        if icon:
+            btn.setIcon(icon)
+            btn.setIconSize(button_size)
+        elif self.current_emoji_package != "EmojiTwo":
+            # Fallback to text for other packages (font size proportional to emoji_size);
+            # for EmojiTwo, if emoji doesn't exist, just leave button empty
+            btn.setText(emoji)
+            btn.setFont(self._get_emoji_fallback_font(self.emoji_size))
+        
+        _apply_stylesheet(btn, style)
+        btn.setToolTip(tooltip)
+        
+        # The emoji is stored on the button and read back by shared handlers,
+        # so no per-button closures are needed (variations just update it)
+        btn.setProperty('emoji', emoji)
+        btn.clicked.connect(self._on_emoji_button_clicked)
+        btn.doubleClicked.connect(self._on_emoji_button_double_clicked)
+        if shift_click:
+            btn.shiftClicked.connect(self._on_emoji_button_shift_clicked)
         
         # Add context menu for compound emojis
         btn.setContextMenuPolicy(Qt.CustomContextMenu)
-        btn.customContextMenuRequested.connect(
-            lambda pos, e=emoji, button=btn: self.show_emoji_context_menu(
-                pos, e, button
-            )
-        )
+        btn.customContextMenuRequested.connect(self._on_emoji_button_context_menu)
         
-        # Add tooltip
-        emoji_name = self.get_emoji_name(emoji)
-        btn.setToolTip(emoji_name)
+        return btn
+    
+    def create_custom_emoji_button(self, filename, row, col):
+        """Create a Custom package emoji button and add it to the grid
         
-        # Add to grid with explicit positioning
+        Args:
+            filename: Image file name in the custom folder
+            row: Grid row
+            col: Grid column
+        """
+        button_size = QSize(self.emoji_size, self.emoji_size)
+        
+        # Create emoji button for custom file (setFixedSize also sets the minimum and maximum size)
+        btn = DoubleClickButton()
+        btn.setFixedSize(button_size)
+        
+        # Load image for custom emoji
+        image_path = self._emoji_folder_prefix + filename
+        icon = self.create_custom_emoji_icon(image_path, self.emoji_size)
+        if icon:
+            btn.setIcon(icon)
+            btn.setIconSize(button_size)
+        
+        # Set button styling
+        _apply_stylesheet(btn, self.get_emoji_button_stylesheet())
+        btn.setFocusPolicy(Qt.NoFocus)
+        
+        # Connect click handlers
+        btn.clicked.connect(lambda checked, f=filename, b=btn: self.on_custom_emoji_click(f, b))
+        btn.doubleClicked.connect(lambda f=filename, b=btn: self.on_custom_emoji_double_click(f, b))
+        btn.shiftClicked.connect(lambda f=filename, b=btn: self.on_custom_emoji_shift_click(f, b))
+        
+        # Add to grid
         self.emoji_layout.addWidget(btn, row, col)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _get_emoji_fallback_font(emoji_size):
+        """Get the font used for emojis shown as text, shared by all buttons of a size
         
-        return btn
+        Args:
+            emoji_size: Emoji button size in pixels
+        
+        Returns:
+            QFont: Segoe UI Emoji sized proportionally to the button (16pt for 48px = 0.333 ratio)
+        """
+        return QFont("Segoe UI Emoji", max(8, int(emoji_size * 0.333)))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_qfont(font_name, point_size):
+        """Get the font the Qt fallback renderers draw emojis with, shared per name and size
+        
+        Args:
+            font_name: Font family name
+            point_size: Font size in points
+        
+        Returns:
+            QFont: Shared font (callers only read it)
+        """
+        return QFont(font_name, point_size)
     
     def update_emoji_preview_display(self, icon, text):
         """Update the status widget with emoji preview
@@ -1050,8 +1394,7 @@ class EmojiPicker(QMainWindow):
             self.update_emoji_preview_display(button_icon, filename)
         else:
             # Create new icon if not provided
-            file_path = os.path.join(self.emoji_folder, filename)
-            file_ext = os.path.splitext(filename)[1].lower()
+            file_path = self._emoji_folder_prefix + filename
             preview_size = 24
             
             if os.path.exists(file_path):
@@ -1059,6 +1402,7 @@ class EmojiPicker(QMainWindow):
                 self.update_emoji_preview_display(icon, filename)
             else:
                 # Show format indicator if file doesn't exist
+                file_ext = os.path.splitext(filename)[1].lower()
                 self.status_emoji_label.clear()
                 self.status_emoji_label.hide()
                 self.status_text_label.setText(f"[{file_ext.upper().lstrip('.')}] {filename}")
@@ -1118,6 +1462,26 @@ class EmojiPicker(QMainWindow):
             pass  # No connections to disconnect
         signal.connect(new_handler)
     
+    def _on_emoji_button_clicked(self, checked=False):
+        """Dispatch a click on an emoji grid button to on_emoji_click"""
+        button = self.sender()
+        self.on_emoji_click(button.property('emoji'), button)
+    
+    def _on_emoji_button_double_clicked(self):
+        """Dispatch a double-click on an emoji grid button to on_emoji_double_click"""
+        button = self.sender()
+        self.on_emoji_double_click(button.property('emoji'), button)
+    
+    def _on_emoji_button_shift_clicked(self):
+        """Dispatch a Shift+Click on an emoji grid button to on_emoji_shift_click"""
+        button = self.sender()
+        self.on_emoji_shift_click(button.property('emoji'), button)
+    
+    def _on_emoji_button_context_menu(self, pos):
+        """Dispatch a context menu request on an emoji grid button to show_emoji_context_menu"""
+        button = self.sender()
+        self.show_emoji_context_menu(pos, button.property('emoji'), button)
+    
     def show_emoji_context_menu(self, pos, emoji, button):
         """Show context menu for emoji variations"""
         # Find the base emoji (first character) to get variations
@@ -1136,7 +1500,7 @@ class EmojiPicker(QMainWindow):
                 main_action.setIcon(main_icon)
             variation_data = {
                 'full_emoji': base_emoji,
-                'codes': [self.emoji_manager.emoji_to_unicode(base_emoji)]
+                'codes': [unicode_code]
             }
             main_action.triggered.connect(
                 lambda checked=False, btn=button: self.on_variation_click(
@@ -1180,14 +1544,8 @@ class EmojiPicker(QMainWindow):
             emoji_font = QFont("Segoe UI Emoji", 16)
             button.setFont(emoji_font)
         
-        # Update the button's click handler to use the variation
-        self.reconnect_signal(button.clicked, lambda checked=False, e=variation_emoji, b=button: self.on_emoji_click(e, b))
-        
-        # Update the button's double-click handler to use the variation
-        self.reconnect_signal(button.doubleClicked, lambda checked=False, e=variation_emoji, b=button: self.on_emoji_double_click(e, b))
-        
-        # Update the context menu handler to use the variation
-        self.reconnect_signal(button.customContextMenuRequested, lambda pos, e=variation_emoji, btn=button: self.show_emoji_context_menu(pos, e, btn))
+        # Make the button's click, double-click and context menu handlers use the variation
+        button.setProperty('emoji', variation_emoji)
         
         # Update tooltip
         emoji_name = self.get_emoji_name(variation_emoji)
@@ -1200,7 +1558,7 @@ class EmojiPicker(QMainWindow):
         # Update selected emoji reference
         self.selected_emoji = variation_emoji
         self.selected_emoji_button = button
-        button.setStyleSheet(self.get_button_selected_stylesheet())
+        _apply_stylesheet(button, self.get_button_selected_stylesheet())
     
     def create_emoji_icon(self, emoji, size, is_category_icon=False):
         """Create an icon for an emoji, handling PNG, SVG, and system font formats with caching
@@ -1210,32 +1568,22 @@ class EmojiPicker(QMainWindow):
             size: Target size for the icon
             is_category_icon: If True, don't apply Contrast button inversion (only for grid emojis)
         """
+        # Package type, color mode and font only change on package/setting switches,
+        # so they are resolved once and reused until then
+        context = self._render_context
+        if context is None or context[0] != self.current_emoji_package:
+            context = self._render_context = self._build_render_context()
+        _, package_type, color_mode, font_name, font_path, skia_render = context
+        
         # Create cache key based on emoji, size, and current folder/package
         # For file-based packages, use the folder path to differentiate between different sizes
         # For system fonts, use the package name
-        package_info = self.emoji_packages.get(self.current_emoji_package, {})
-        package_type = package_info.get("type", "files")
-        
-        # Special handling for Kaomoji package with real emojis - use system font
-        if self.current_emoji_package == "Kaomoji":
-            package_type = "system_font"
-        
-        # Special handling for OpenMoji TTF
-        if self.current_emoji_package == "OpenMoji" and self.ttf_radio.isChecked():
-            package_type = "system_font"
-        
-        # Special handling for Noto (TTF font package)
-        if self.current_emoji_package == "Noto":
-            package_type = "system_font"
-        
+        # Include color/black mode and contrast state in cache key to differentiate variants
+        # But only include contrast_enabled for grid emojis, not for category icons
+        contrast_key = False if is_category_icon else self.contrast_enabled
         if package_type == "system_font":
-            # Include color/black mode and contrast state in cache key to differentiate variants
-            # But only include contrast_enabled for grid emojis, not for category icons
-            color_mode = "color" if self.color_radio.isChecked() else "black"
-            contrast_key = False if is_category_icon else self.contrast_enabled
             cache_key = (emoji, size, self.current_emoji_package, color_mode, contrast_key)
         else:
-            contrast_key = False if is_category_icon else self.contrast_enabled
             cache_key = (emoji, size, self.emoji_folder, contrast_key)
         
         # Check if icon is already in cache
@@ -1244,101 +1592,241 @@ class EmojiPicker(QMainWindow):
             return cached_icon
         
         icon = None
+        invert = bool(self.contrast_enabled and color_mode == "black" and not is_category_icon)
+        
+        # When Contrast was just turned on, invert the icon already rendered without it
+        # instead of rendering the emoji again
+        if invert:
+            plain_icon = self.cache_manager.get(cache_key[:-1] + (False,))
+            if plain_icon:
+                icon = self.invert_icon_colors(plain_icon, size)
+                self.cache_manager.set(cache_key, icon)
+                return icon
+        # Whether the renderer already inverted the icon (Skia inverts the raw pixels)
+        inverted = False
+        # Key of the rendered icon in the disk cache, identifying the source file
+        # by path and modification time (None = not worth persisting)
+        disk_key = None
         
         # Handle system font rendering
         if package_type == "system_font":
-            # Determine which font to use
-            if self.current_emoji_package == "OpenMoji" and self.ttf_radio.isChecked():
-                # OpenMoji TTF: Color & Black have same family name, Qt cannot differentiate them
-                font_name = self.get_openmoji_ttf_font_name()
-                font_path = self.get_openmoji_ttf_font_path()
-            elif self.current_emoji_package == "Noto":
-                # Noto: Use Skia for both variants for consistency and to avoid Qt font conflicts
-                # Windows may have Noto Color Emoji as system font which takes priority over registered Noto Black
-                font_name = self.get_google_noto_ttf_font_name()
-                font_path = self.get_google_noto_ttf_font_path()
-            else:
-                font_name = package_info.get("font_name", "Segoe UI Emoji")
-                font_path = None
-            
             # Render emoji using Skia if available and we have a font path
             # (OpenMoji Color/Black, Noto Color, and monochrome fonts)
-            if SKIA_AVAILABLE and font_path and os.path.exists(font_path):
-                icon = self.render_emoji_with_skia(emoji, size, font_path)
+            if skia_render is not None:
+                font_mtime_ns = self._font_mtimes.get(font_path)
+                if font_mtime_ns is not None:
+                    disk_key = ("font", font_path, font_mtime_ns, emoji, size, color_mode, invert)
+                    icon = self._load_disk_cached_icon(disk_key)
+                    if icon is not None:
+                        self.cache_manager.set(cache_key, icon)
+                        return icon
+                icon = self.render_emoji_with_skia(emoji, size, skia_render, invert)
+                inverted = invert and icon is not None
             
             # Fallback to Qt rendering if Skia not available or rendering failed
+            # (cheap, and depends on the installed system fonts: not persisted)
             if not icon:
+                disk_key = None
                 # Determine appropriate font size based on emoji type
                 # Use 0.5 ratio for all system fonts to ensure emojis fit properly in their containers
-                font_size = int(size * 0.5)
-                
-                font = QFont(font_name, font_size)
+                font = self._get_qfont(font_name, int(size * 0.5))
                 
-                # Create pixmap and render emoji
-                pixmap = QPixmap(size, size)
-                pixmap.fill(Qt.transparent)
+                # Render emoji into the scratch pixmap
+                pixmap = self._get_scratch_pixmap(size)
                 painter = QPainter(pixmap)
                 painter.setFont(font)
                 painter.drawText(0, 0, size, size, Qt.AlignCenter, emoji)
                 painter.end()
                 
-                icon = QIcon(pixmap)
+                icon = QIcon(pixmap.copy())
         else:
             # Handle file-based rendering (PNG/SVG)
             image_path = self.get_emoji_image_path(emoji)
-            if not image_path or not os.path.exists(image_path):
+            if not image_path:
+                return None
+            try:
+                mtime_ns = os.stat(image_path).st_mtime_ns
+            except OSError:
                 return None
             
+            # Reuse the icon already rendered from this exact file, if any,
+            # in this session or a previous one
+            file_key = (image_path, mtime_ns, size, invert)
+            icon = self._file_icon_cache.get(file_key)
+            if icon is None:
+                disk_key = ("file",) + file_key
+                icon = self._load_disk_cached_icon(disk_key)
+                if icon is not None:
+                    self._file_icon_cache[file_key] = icon
+            if icon is not None:
+                self.cache_manager.set(cache_key, icon)
+                return icon
+            
             # Try Skia first for better performance and quality
+            is_svg = image_path.endswith('.svg')
             if SKIA_AVAILABLE and skia_renderer and skia_renderer.initialized:
-                if image_path.endswith('.svg'):
+                if is_svg:
                     icon = skia_renderer.render_svg_file(image_path, size)
                 else:
                     icon = skia_renderer.render_image_file(image_path, size)
             
             # Fallback to Qt if Skia is not available or failed
             if not icon:
-                if image_path.endswith('.svg'):
+                if is_svg:
                     # Handle SVG files with QSvgRenderer
                     svg_renderer = QSvgRenderer(image_path)
                     if svg_renderer.isValid():
-                        pixmap = QPixmap(size, size)
-                        pixmap.fill(Qt.transparent)
+                        pixmap = self._get_scratch_pixmap(size)
                         painter = QPainter(pixmap)
                         svg_renderer.render(painter)
                         painter.end()
-                        icon = QIcon(pixmap)
+                        icon = QIcon(pixmap.copy())
                 else:
                     # Handle PNG files with QPixmap - scale to exact size
                     source_pixmap = QPixmap(image_path)
                     if not source_pixmap.isNull():
-                        # Create a target pixmap of exact size
-                        pixmap = QPixmap(size, size)
-                        pixmap.fill(Qt.transparent)
-                        
                         # Scale source to fit within target size
                         scaled_source = source_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                         
-                        # Draw scaled source centered on target pixmap
-                        painter = QPainter(pixmap)
-                        x = (size - scaled_source.width()) // 2
-                        y = (size - scaled_source.height()) // 2
-                        painter.drawPixmap(x, y, scaled_source)
-                        painter.end()
-                        
-                        icon = QIcon(pixmap)
+                        if scaled_source.width() == size and scaled_source.height() == size:
+                            # Square source: already the exact size, nothing to center
+                            icon = QIcon(scaled_source)
+                        else:
+                            # Draw scaled source centered on the scratch pixmap of exact size
+                            pixmap = self._get_scratch_pixmap(size)
+                            painter = QPainter(pixmap)
+                            x = (size - scaled_source.width()) // 2
+                            y = (size - scaled_source.height()) // 2
+                            painter.drawPixmap(x, y, scaled_source)
+                            painter.end()
+                            
+                            icon = QIcon(pixmap.copy())
         
         # Apply color inversion if contrast mode is enabled and conditions are met
         # (Black mode + user explicitly enabled Contrast button)
         # Note: Category icons have their own automatic inversion in create_category_icon()
-        if icon and self.contrast_enabled and not self.color_radio.isChecked() and not is_category_icon:
+        if icon and invert and not inverted:
             icon = self.invert_icon_colors(icon, size)
         
-        # Store in cache before returning
-        if icon:
-            self.cache_manager.set(cache_key, icon)
+        # Store in cache before returning
+        if icon:
+            self.cache_manager.set(cache_key, icon)
+            if package_type != "system_font":
+                self._file_icon_cache[file_key] = icon
+            if disk_key is not None:
+                self._store_disk_cached_icon(disk_key, icon, size)
+        
+        return icon
+    
+    def _load_disk_cached_icon(self, disk_key):
+        """Load a previously rendered icon from QPixmapCache or the disk cache
+        
+        Args:
+            disk_key: Disk cache key (see create_emoji_icon)
+        
+        Returns:
+            QIcon or None if not cached
+        """
+        # Decoded pixmaps are kept in QPixmapCache, see _store_disk_cached_icon()
+        pixmap_key = repr(disk_key)
+        pixmap = QPixmapCache.find(pixmap_key)
+        if pixmap is not None and not pixmap.isNull():
+            return QIcon(pixmap)
+        
+        data = self.disk_cache_manager.get(disk_key)
+        if data is None:
+            return None
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data, 'PNG'):
+            return None
+        QPixmapCache.insert(pixmap_key, pixmap)
+        return QIcon(pixmap)
+    
+    def _store_disk_cached_icon(self, disk_key, icon, size):
+        """Persist a rendered icon in the disk cache as PNG (and keep its pixmap in QPixmapCache)
+        
+        Args:
+            disk_key: Disk cache key (see create_emoji_icon)
+            icon: Rendered QIcon
+            size: Icon size in pixels
+        """
+        pixmap = icon.pixmap(size, size)
+        QPixmapCache.insert(repr(disk_key), pixmap)
+        
+        # Skip the PNG encoding once the disk cache stopped accepting writes
+        if not self.disk_cache_manager.writable:
+            return
+        
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        saved = pixmap.save(buffer, 'PNG')
+        buffer.close()
+        if saved:
+            self.disk_cache_manager.set(disk_key, bytes(data))
+    
+    def _get_scratch_pixmap(self, size):
+        """Get the cleared scratch pixmap the Qt fallback renderers draw into
+        
+        Args:
+            size: Width and height of the pixmap
+        
+        Returns:
+            QPixmap: Transparent pixmap, reused between calls (callers hand out a copy)
+        """
+        pixmap = self._scratch_pixmaps.get(size)
+        if pixmap is None:
+            pixmap = self._scratch_pixmaps[size] = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        return pixmap
+    
+    def _build_render_context(self):
+        """Resolve how emojis of the current package are rendered
+        
+        Returns:
+            tuple: (package name, package type, color mode, font name, font path,
+                Skia render function) where package type is "system_font" for every
+                font-rendered package, font path is None unless a Skia-renderable
+                font file exists, and the render function (see _build_skia_render_fn)
+                is None unless font path is set and Skia is available
+        """
+        package_info = self.emoji_packages.get(self.current_emoji_package, {})
+        package_type = package_info.get("type", "files")
+        color_mode = self._color_mode
+        font_name = font_path = None
+        
+        # Kaomoji (real emojis), OpenMoji TTF and Noto (TTF font package) use system font rendering
+        if self.current_emoji_package == "Kaomoji":
+            package_type = "system_font"
+        if self.current_emoji_package == "OpenMoji" and self.ttf_radio.isChecked():
+            package_type = "system_font"
+        if self.current_emoji_package == "Noto":
+            package_type = "system_font"
+        
+        if package_type == "system_font":
+            # Determine which font to use
+            if self.current_emoji_package == "OpenMoji" and self.ttf_radio.isChecked():
+                # OpenMoji TTF: Color & Black have same family name, Qt cannot differentiate them
+                font_name = self.get_openmoji_ttf_font_name()
+                font_path = self.get_openmoji_ttf_font_path()
+            elif self.current_emoji_package == "Noto":
+                # Noto: Use Skia for both variants for consistency and to avoid Qt font conflicts
+                # Windows may have Noto Color Emoji as system font which takes priority over registered Noto Black
+                font_name = self.get_google_noto_ttf_font_name()
+                font_path = self.get_google_noto_ttf_font_path()
+            else:
+                font_name = package_info.get("font_name", "Segoe UI Emoji")
+            # (font paths come from _scan_all_font_paths, which only keeps existing files)
+        
+        skia_render = None
+        if font_path and SKIA_AVAILABLE and skia_renderer:
+            skia_render = self._build_skia_render_fn(font_path)
         
-        return icon
+        return (self.current_emoji_package, package_type, color_mode, font_name, font_path, skia_render)
+    
+    def _invalidate_render_context(self):
+        """Drop the cached render context (color mode or format changed)"""
+        self._render_context = None
     
     def invert_icon_colors(self, icon, size):
         """Invert colors of an icon (used for Black + Dark theme)
@@ -1353,55 +1841,80 @@ class EmojiPicker(QMainWindow):
         # Get pixmap from icon
         pixmap = icon.pixmap(size, size)
         
-        # Create inverted image
+        # Create inverted image (InvertRgb leaves the alpha channel untouched;
+        # Qt inverts whole 32-bit pixels with a mask, so there is no per-channel loop)
         image = pixmap.toImage()
-        image.invertPixels()
+        image.invertPixels(QImage.InvertRgb)
         
         # Convert back to icon
         inverted_pixmap = QPixmap.fromImage(image)
         return QIcon(inverted_pixmap)
     
-    def get_ttf_font_property(self, font_type, property_name, default_value="NOT_FOUND"):
-        """Generic method to get TTF font properties (name or path) with caching
+    def _refresh_color_mode(self, *args):
+        """Mirror the Color/Black radio buttons into self._color_mode"""
+        self._color_mode = "color" if self.color_radio.isChecked() else "black"
+    
+    def _recompute_font_props(self, *args):
+        """Resolve the OpenMoji and Noto TTF font names and paths for the current color mode
         
-        Args:
-            font_type: "openmoji" or "noto"
-            property_name: "font_name" or "font_path"
-            default_value: Default value if property not found
-            
-        Returns:
-            Font property value (name or path)
+        Note:
+            Called when the color mode changes and after font registration, so
+            the font getters used while rendering only read attributes.
         """
-        color_mode = "color" if self.color_radio.isChecked() else "black"
-        cache_key = f"{property_name}_{color_mode}"
-        cache_dict = self.openmoji_ttf_fonts if font_type == "openmoji" else self.google_noto_ttf_fonts
+        color_mode = self._color_mode
+        self._font_name_openmoji = "OpenMoji"
+        self._font_path_openmoji = self.find_openmoji_ttf_path(color_mode)
+        self._font_name_noto = self.get_noto_font_name(color_mode)
+        self._font_path_noto = self.find_noto_ttf_path(color_mode)
+        # Component icons depend on the color mode and the located fonts
+        self.cache_manager.component_icon_cache.clear()
+    
+    def _scan_all_font_paths(self):
+        """Locate the OpenMoji and Noto TTF fonts of both color modes, once per session
         
-        # Check cache
-        if cache_key in cache_dict:
-            cached_value = cache_dict[cache_key]
-            # For paths, validate existence
-            if property_name == "font_path" and cached_value != "NOT_FOUND":
-                return cached_value if os.path.exists(cached_value) else None
-            return None if cached_value == "NOT_FOUND" else cached_value
-        
-        # Compute value based on font type and property
-        if font_type == "openmoji":
-            if property_name == "font_name":
-                value = "OpenMoji"
-            else:  # font_path
-                value = self.find_openmoji_ttf_path(color_mode)
-        else:  # noto
-            if property_name == "font_name":
-                value = self.get_noto_font_name(color_mode)
-            else:  # font_path
-                value = self.find_noto_ttf_path(color_mode)
-        
-        # Cache and return
-        cache_dict[cache_key] = value if value else "NOT_FOUND"
-        return value
+        Note:
+            Fills self._package_font_index, so find_openmoji_ttf_path() and
+            find_noto_ttf_path() are dictionary lookups on Color/Black toggles.
+        """
+        index = self._package_font_index
+        mtimes = self._font_mtimes
+        index.clear()
+        mtimes.clear()
+        for color_mode in ("color", "black"):
+            for package, locate in (("OpenMoji", self._locate_openmoji_ttf_path),
+                                    ("Noto", self._locate_noto_ttf_path)):
+                font_path = locate(color_mode)
+                if font_path and font_path not in mtimes:
+                    try:
+                        mtimes[font_path] = os.stat(font_path).st_mtime_ns
+                    except OSError:
+                        font_path = None
+                index[package, color_mode] = font_path
+    
+    def refresh_fonts(self):
+        """Locate the package TTF fonts again, dropping the cached folder listings
+        
+        Note:
+            Font lookups (including fonts not found) are cached for the whole
+            session, this is the only place they are re-probed.
+        """
+        self._folder_index.clear()
+        self._folder_extension_index.clear()
+        self._scan_all_font_paths()
+        self._recompute_font_props()
+        self._invalidate_render_context()
     
     def find_openmoji_ttf_path(self, color_mode):
-        """Find OpenMoji TTF font file path"""
+        """Find OpenMoji TTF font file path (located by _scan_all_font_paths)"""
+        return self._package_font_index.get(("OpenMoji", color_mode))
+    
+    def _locate_openmoji_ttf_path(self, color_mode):
+        """Locate the OpenMoji TTF font file on disk
+        
+        Note:
+            Folders are listed through _folder_entries, so each one is
+            scanned once per session instead of stat'ed on every lookup.
+        """
         if color_mode == "color":
             # Try COLR v1, then COLR v0, then COLR v0 with SVG
             font_variants = [
@@ -1409,22 +1922,20 @@ class EmojiPicker(QMainWindow):
                 "OpenMoji-color-glyf_colr_0",
                 "OpenMoji-color-colr0_svg",
             ]
+            font_root = os.path.join(self.path_manager.packages_dir, "OpenMoji", "openmoji-font")
+            available_variants = self._folder_entries(font_root)
             for variant in font_variants:
-                candidate_path = os.path.join(self.path_manager.packages_dir, "OpenMoji", "openmoji-font", variant)
-                if os.path.exists(candidate_path):
-                    font_folder = candidate_path
+                if variant in available_variants:
+                    font_folder = os.path.join(font_root, variant)
                     break
             else:
                 font_folder = self.path_manager.get_path("openmoji_color_ttf_folder")
         else:
             font_folder = self.path_manager.get_path("openmoji_black_ttf_folder")
         
-        # Find TTF file in folder
-        if os.path.exists(font_folder):
-            for filename in os.listdir(font_folder):
-                if filename.endswith('.ttf'):
-                    return os.path.join(font_folder, filename)
-        return None
+        # Find TTF file in folder (sorted so the pick does not depend on directory order)
+        ttf_files = self._folder_files_by_extension(font_folder).get('.ttf')
+        return os.path.join(font_folder, ttf_files[0]) if ttf_files else None
     
     def get_noto_font_name(self, color_mode):
         """Get Noto font name (from registered fonts for Black, placeholder for Color)"""
@@ -1436,66 +1947,91 @@ class EmojiPicker(QMainWindow):
         return "Noto Color Emoji"
     
     def find_noto_ttf_path(self, color_mode):
-        """Find Noto TTF font file path"""
+        """Find Noto TTF font file path (located by _scan_all_font_paths)"""
+        return self._package_font_index.get(("Noto", color_mode))
+    
+    def _locate_noto_ttf_path(self, color_mode):
+        """Locate the Noto TTF font file on disk"""
         package_info = self.emoji_packages.get("Noto", {})
         font_path = package_info.get("color_font" if color_mode == "color" else "black_font")
         return font_path if font_path and os.path.exists(font_path) else None
     
     def get_openmoji_ttf_font_name(self):
         """Get the OpenMoji TTF font name (not used for rendering, only for fallback)"""
-        return self.get_ttf_font_property("openmoji", "font_name", "OpenMoji")
+        return self._font_name_openmoji
     
     def get_openmoji_ttf_font_path(self):
         """Get the OpenMoji TTF font file path"""
-        return self.get_ttf_font_property("openmoji", "font_path")
+        return self._font_path_openmoji
     
     def get_google_noto_ttf_font_name(self):
         """Get the Noto TTF font name from registered fonts cache (Black) or placeholder (Color)"""
-        return self.get_ttf_font_property("noto", "font_name", "Segoe UI Emoji")
+        return self._font_name_noto
     
     def get_google_noto_ttf_font_path(self):
         """Get the Noto TTF font file path"""
-        return self.get_ttf_font_property("noto", "font_path")
+        return self._font_path_noto
     
-    def render_emoji_with_skia(self, emoji, size, font_path):
-        """Render emoji using Skia for all TTF fonts (COLR and monochrome)"""
-        if not SKIA_AVAILABLE or not skia_renderer:
-            return None
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _classify_font_path(font_path):
+        """Classify a TTF font from its file path, once per path
+        
+        Args:
+            font_path: Path to the font file
+        
+        Returns:
+            tuple: (is_noto, is_color_font, is_black_font_by_name)
+        """
+        lowered = font_path.lower()
+        return "noto" in lowered, "color" in lowered, "black" in lowered
+    
+    def _build_skia_render_fn(self, font_path):
+        """Bind the Skia emoji renderer to a TTF font and the current color mode
+        
+        Args:
+            font_path: Path to the TTF font file
+        
+        Returns:
+            Callable(emoji, size=..., invert=...) rendering with the font
+        
+        Note:
+            Built with the render context, so the font type is only worked out
+            when the package or color mode changes, not for every emoji.
+        """
+        # Determine the font type from the path
+        is_noto, is_color_font, is_black_by_name = self._classify_font_path(font_path)
+        
+        # Determine if this is a black/monochrome font
+        # For Noto: check the color mode since filenames don't contain "black"
+        # For OpenMoji: check if "black" is in filename
+        if is_noto:
+            is_black_font = self._color_mode == "black"
+        else:
+            is_black_font = is_black_by_name
+        
+        # Monochrome fonts are rendered with a solid black color
+        if is_black_font and not is_color_font:
+            return functools.partial(
+                skia_renderer.render_emoji_to_pixmap,
+                font_path=font_path,
+                is_monochrome=True,
+                monochrome_color=(0, 0, 0, 255)  # Black
+            )
+        return functools.partial(skia_renderer.render_emoji_to_pixmap, font_path=font_path)
+    
+    def render_emoji_with_skia(self, emoji, size, render_fn, invert=False):
+        """Render emoji using Skia for all TTF fonts (COLR and monochrome)
         
+        Args:
+            emoji: Emoji character to render
+            size: Target size for the icon
+            render_fn: Renderer bound to the font, see _build_skia_render_fn()
+            invert: If True, return the icon with inverted colors (Contrast mode),
+                inverted on the rendered pixels instead of with invert_icon_colors()
+        """
         try:
-            # Determine the font type from the path
-            is_color_font = "color" in font_path.lower()
-            is_noto = "noto" in font_path.lower()
-            
-            # Determine if this is a black/monochrome font
-            # For Noto: check radio button state since filenames don't contain "black"
-            # For OpenMoji: check if "black" is in filename
-            if is_noto:
-                is_black_font = not self.color_radio.isChecked()
-            else:
-                is_black_font = "black" in font_path.lower()
-            
-            # Determine if this is a monochrome font
-            is_monochrome = is_black_font and not is_color_font
-            
-            # Render with Skia
-            if is_monochrome:
-                icon = skia_renderer.render_emoji_to_pixmap(
-                    emoji, 
-                    font_path, 
-                    size, 
-                    is_monochrome=True, 
-                    monochrome_color=(0, 0, 0, 255)  # Black
-                )
-                if icon:
-                    return icon
-            else:
-                icon = skia_renderer.render_emoji_to_pixmap(emoji, font_path, size)
-                if icon:
-                    return icon
-            
-            return None
-            
+            return render_fn(emoji, size=size, invert=invert) or None
         except Exception:
             return None
     
@@ -1508,10 +2044,11 @@ class EmojiPicker(QMainWindow):
             
         Returns:
             QIcon or None if rendering failed
-        """
-        if not os.path.exists(image_path):
-            return None
         
+        Note:
+            Missing files need no separate existence check: the loaders
+            report them as invalid/null.
+        """
         icon = None
         is_svg = image_path.endswith('.svg')
         
@@ -1524,12 +2061,12 @@ class EmojiPicker(QMainWindow):
             if is_svg:
                 svg_renderer = QSvgRenderer(image_path)
                 if svg_renderer.isValid():
-                    pixmap = QPixmap(size, size)
-                    pixmap.fill(Qt.transparent)
+                    # Render into the cleared scratch pixmap and hand out a copy
+                    pixmap = self._get_scratch_pixmap(size)
                     painter = QPainter(pixmap)
                     svg_renderer.render(painter)
                     painter.end()
-                    icon = QIcon(pixmap)
+                    icon = QIcon(pixmap.copy())
             else:
                 pixmap = QPixmap(image_path)
                 if not pixmap.isNull():
@@ -1547,55 +2084,91 @@ class EmojiPicker(QMainWindow):
             
         Returns:
             QIcon or None
+        
+        Note:
+            Icons are cached by the image file they are rendered from, so size
+            folders falling back to the same default file, and theme changes,
+            reuse the decoded icon (in cache_manager.component_icon_cache, emptied
+            with the other icon caches and on color mode/font changes).
         """
-        if self.black_radio.isChecked():
+        code = emoji_code.lower()
+        if self._color_mode == "black":
             # Use special icon from misc folder since EmojiTwo Black doesn't have this emoji
-            misc_icon_path = self.path_manager.get_misc_file("Emojitwo_component_1f3fd.png")
-            return self.render_image_to_icon(misc_icon_path, size)
+            emoji_path = self.path_manager.get_misc_file("Emojitwo_component_1f3fd.png")
         
         # Color mode - load from EmojiTwo Color folder
-        if self.png_radio.isChecked():
-            emoji_path = os.path.join(self.emoji_folder, f"{emoji_code.lower()}.png")
+        elif self.png_radio.isChecked():
+            filename = f"{code}.png"
+            emoji_path = self._emoji_folder_prefix + filename
             
             # Fallback to default folder if not found
-            if not os.path.exists(emoji_path):
+            if filename not in self._folder_entries(self.emoji_folder):
                 try:
                     default_folder = self.path_manager.get_path("emojitwo_color_default_png")
-                    emoji_path = os.path.join(default_folder, f"{emoji_code.lower()}.png")
+                    emoji_path = os.path.join(default_folder, filename)
                 except KeyError:
                     pass
-            
-            return self.render_image_to_icon(emoji_path, size)
         
         elif self.svg_radio.isChecked():
             try:
                 svg_folder = self.path_manager.get_path("emojitwo_color_svg")
-                emoji_path = os.path.join(svg_folder, f"{emoji_code.lower()}.svg")
-                return self.render_image_to_icon(emoji_path, size)
             except KeyError:
                 return None
+            emoji_path = os.path.join(svg_folder, f"{code}.svg")
         
-        return None
+        else:
+            return None
+        
+        # Failed renders are not cached, so they are retried on the next call
+        component_icons = self.cache_manager.component_icon_cache
+        cache_key = (emoji_path, size)
+        icon = component_icons.get(cache_key)
+        if icon is None:
+            icon = self.render_image_to_icon(emoji_path, size)
+            if icon is not None:
+                component_icons[cache_key] = icon
+        return icon
     
     def create_category_icon(self, emoji_code, size=32):
         """Create an icon for a category using emoji code with system font fallback"""
-        # Convert emoji code to emoji character
-        emoji = self.emoji_manager.unicode_to_emoji(emoji_code + ".png")  # unicode_to_emoji handles .png extension
+        # Convert emoji code to emoji character (once per code, the category codes are fixed)
+        emoji = self._category_emojis.get(emoji_code)
+        if emoji is None:
+            emoji = self._category_emojis[emoji_code] = self.emoji_manager.unicode_to_emoji(emoji_code)
         if not emoji:
             return None
         
         package_info = self.emoji_packages.get(self.current_emoji_package, {})
         package_type = package_info.get("type", "files")
         
-        # Create cache key that includes color/black variant and theme for automatic inversion
-        color_mode = "color" if self.color_radio.isChecked() else "black"
-        cache_key = (f"category_{emoji_code}", size, self.emoji_folder if package_type == "files" else self.current_emoji_package, color_mode if package_type != "files" else None, self.current_theme)
+        # Automatic color inversion for category icons when Dark/Medium theme + Black mode
+        # This is independent of the Contrast button (which only affects grid emojis)
+        color_mode = self._color_mode
+        invert = self.current_theme in ThemeManager.DARK_THEMES and color_mode == "black"
+        
+        # Create cache key that includes color/black variant and whether the icon is inverted
+        # (not the theme itself, so Dark and Medium share their inverted icons)
+        # (category icons have their own cache, so the emoji code needs no prefix)
+        if package_type == "files":
+            base_key = (emoji_code, size, self.emoji_folder, None)
+        else:
+            base_key = (emoji_code, size, self.current_emoji_package, color_mode)
+        cache_key = base_key + (invert,)
         
         # Check cache
-        cached_icon = self.cache_manager.get(cache_key)
+        category_icon_cache = self.cache_manager.category_icon_cache
+        cached_icon = category_icon_cache.get(cache_key)
         if cached_icon:
             return cached_icon
         
+        # On a theme flip, invert the icon already built for the other themes
+        plain_key = base_key + (False,)
+        if invert:
+            plain_icon = category_icon_cache.get(plain_key)
+            if plain_icon:
+                icon = category_icon_cache[cache_key] = self.invert_icon_colors(plain_icon, size)
+                return icon
+        
         # Special handling for EmojiTwo component category (1F3FD emoji)
         icon = None
         if self.current_emoji_package == "EmojiTwo" and emoji_code == "1F3FD":
@@ -1608,26 +2181,21 @@ class EmojiPicker(QMainWindow):
         # Final fallback: system font rendering
         if not icon:
             font_name = package_info.get("font_name", "Segoe UI Emoji") if package_type == "system_font" else "Segoe UI Emoji"
-            font_size = max(8, size // 2)
-            font = QFont(font_name, font_size)
+            font = self._get_qfont(font_name, max(8, size // 2))
             
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.transparent)
+            pixmap = self._get_scratch_pixmap(size)
             painter = QPainter(pixmap)
             painter.setFont(font)
             painter.drawText(0, 0, size, size, Qt.AlignCenter, emoji)
             painter.end()
             
-            icon = QIcon(pixmap)
+            icon = QIcon(pixmap.copy())
         
-        # Automatic color inversion for category icons when Dark/Medium theme + Black mode
-        # This is independent of the Contrast button (which only affects grid emojis)
-        if icon and self.current_theme in [ThemeManager.THEME_DARK, ThemeManager.THEME_MEDIUM] and not self.color_radio.isChecked():
-            icon = self.invert_icon_colors(icon, size)
-        
-        # Store in cache
+        # Store in cache (both variants when inverting, so flipping back is a cache hit)
         if icon:
-            self.cache_manager.set(cache_key, icon)
+            category_icon_cache[plain_key] = icon
+            if invert:
+                icon = category_icon_cache[cache_key] = self.invert_icon_colors(icon, size)
         
         return icon
     
@@ -1637,9 +2205,9 @@ class EmojiPicker(QMainWindow):
         self.setFixedSize(800, 1000)  # Increased height to accommodate all footer elements
         
         # Set window icon
-        icon_path = self.path_manager.get_misc_file("Kitty-Head.svg")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        window_icon = get_misc_icon(self.path_manager, "Kitty-Head.svg")
+        if window_icon is not None:
+            self.setWindowIcon(window_icon)
         
         # Set default font for the application
         default_font = QFont("Segoe UI", 10)
@@ -1661,17 +2229,11 @@ class EmojiPicker(QMainWindow):
         # Emoji package dropdown
         self.emoji_package_combo = QComboBox()
         # Get available package names from emoji_packages (already filtered by filter_unavailable_system_fonts)
-        package_names = list(self.emoji_packages.keys())
+        package_names = self.emoji_packages
         # Ensure consistent order: EmojiTwo, Noto, OpenMoji, Segoe UI Emoji (if available), Twemoji, Kaomoji, Custom
-        preferred_order = ["EmojiTwo", "Noto", "OpenMoji", "Segoe UI Emoji", "Twemoji", "Kaomoji", "Custom"]
-        ordered_package_names = []
-        for preferred_name in preferred_order:
-            if preferred_name in package_names:
-                ordered_package_names.append(preferred_name)
+        ordered_package_names = [name for name in _PREFERRED_PACKAGE_ORDER if name in package_names]
         # Add any remaining packages not in preferred order
-        for package_name in package_names:
-            if package_name not in ordered_package_names:
-                ordered_package_names.append(package_name)
+        ordered_package_names += [name for name in package_names if name not in _PREFERRED_PACKAGE_SET]
         
         self.emoji_package_combo.addItems(ordered_package_names)
         
@@ -1707,8 +2269,8 @@ class EmojiPicker(QMainWindow):
         search_font = QFont("Segoe UI", 10)
         self.search_edit.setFont(search_font)
         self.search_edit.textChanged.connect(self.on_search_change)
-        # Apply theme-specific stylesheet
-        self.search_edit.setStyleSheet(ThemeManager.get_search_edit_stylesheet(self.current_theme))
+        # Styled by the main window stylesheet (see apply_theme)
+        self.search_edit.setObjectName("SearchEdit")
         # Set placeholder text color based on theme
         palette = self.search_edit.palette()
         if self.current_theme == ThemeManager.THEME_LIGHT:
@@ -1743,6 +2305,10 @@ class EmojiPicker(QMainWindow):
         self.color_radio.setFont(radio_font)
         self.black_radio.setFont(radio_font)
         self.color_radio.setChecked(True)  # Default to Color
+        # Any check state change (including programmatic ones) affects icon rendering
+        self.color_radio.toggled.connect(self._refresh_color_mode)
+        self.color_radio.toggled.connect(self._invalidate_render_context)
+        self.color_radio.toggled.connect(self._recompute_font_props)
         
         # Open Custom Folder button
         self.open_custom_folder_button = QPushButton("Open custom folder")
@@ -1780,6 +2346,7 @@ class EmojiPicker(QMainWindow):
         self.svg_radio.setFont(radio_font)
         self.ttf_radio.setFont(radio_font)
         self.png_radio.setChecked(True)  # Default to PNG
+        self.ttf_radio.toggled.connect(self._invalidate_render_context)
         
         # Create button group for Size
         self.size_group = QButtonGroup()
@@ -1794,6 +2361,12 @@ class EmojiPicker(QMainWindow):
         self.format_group.addButton(self.ttf_radio, 2)
         self.format_group.buttonClicked.connect(self.on_format_radio_change)
         
+        self._all_radios = (
+            self.color_radio, self.black_radio, self.png_radio,
+            self.svg_radio, self.ttf_radio, self.size_72_radio,
+            self.size_618_radio
+        )
+        
         # Add radio buttons to layout - Color/Black, PNG/SVG/TTF, 72px/618px
         radio_layout.addWidget(self.color_radio)
         radio_layout.addSpacing(5)  # Small spacing between Color and Black
@@ -1842,6 +2415,11 @@ class EmojiPicker(QMainWindow):
         # Connect wheel event with Ctrl modifier to size adjustment handler
         self.emoji_scroll_area.wheelEventWithCtrl.connect(self.on_wheel_event_with_ctrl)
         
+        # Create the emoji buttons of rows scrolled (or resized) into view
+        scroll_bar = self.emoji_scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._materialize_visible_rows)
+        scroll_bar.rangeChanged.connect(self._materialize_visible_rows)
+        
         self.main_layout.addWidget(self.emoji_scroll_area)
         
         # Status widget with emoji preview (empty by default, filled when emoji is selected)
@@ -1893,9 +2471,8 @@ class EmojiPicker(QMainWindow):
         self.contrast_button.setToolTip("Invert emoji colors (useful in Black + Dark theme)")
         self.contrast_button.clicked.connect(self.on_contrast_toggle)
         # Load contrast icon SVG
-        contrast_icon_path = self.path_manager.get_misc_file("mono-contrast.svg")
-        if os.path.exists(contrast_icon_path):
-            contrast_icon = QIcon(contrast_icon_path)
+        contrast_icon = get_misc_icon(self.path_manager, "mono-contrast.svg")
+        if contrast_icon is not None:
             self.contrast_button.setIcon(contrast_icon)
             self.contrast_button.setIconSize(QSize(20, 20))
                 
@@ -1922,8 +2499,8 @@ class EmojiPicker(QMainWindow):
         self.size_input.setToolTip("Enter emoji size in pixels (from 1 to 618)")
         self.size_input.returnPressed.connect(self.on_size_input_change)
         self.size_input.editingFinished.connect(self.on_size_input_change)
-        # Apply theme-specific stylesheet for size input
-        self.size_input.setStyleSheet(ThemeManager.get_size_input_stylesheet(self.current_theme))
+        # Styled by the main window stylesheet (see apply_theme)
+        self.size_input.setObjectName("SizeInput")
         
         # Increase size button (+)
         self.increase_size_button = QPushButton("+")
@@ -2036,152 +2613,120 @@ class EmojiPicker(QMainWindow):
     
     def create_category_tabs(self, parent_layout):
         """Create category tab buttons"""
-        categories = ["Recent & Favorites", "activities", "animals-nature", "component", "flags", 
-                     "food-drink", "objects", "people-body", "smileys-emotion", 
-                     "symbols", "travel-places", "extras-openmoji", "extras-unicode"]
-        # SVG icons for special categories (Recent & Favorites, extras)
-        category_svg_icons = {
-            "Recent & Favorites": self.path_manager.get_misc_file("Recent_Favorites.svg"),
-            "extras-openmoji": self.path_manager.get_misc_file("extras_OpenMoji.svg"),
-            "extras-unicode": self.path_manager.get_misc_file("extras_Unicode.svg")
-        }
-        category_names = {
-            "Recent & Favorites": "Recent & Favorites",
-            "activities": "Activities",
-            "animals-nature": "Animals & Nature",
-            "component": "Component",
-            "flags": "Flags",
-            "food-drink": "Food & Drink",
-            "objects": "Objects",
-            "people-body": "People & Body",
-            "smileys-emotion": "Smileys & Emotion",
-            "symbols": "Symbols",
-            "travel-places": "Travel & Places",
-            "extras-openmoji": "Extras OpenMoji",
-            "extras-unicode": "Extras Unicode"
-        }
-        
         # Create container widget for category buttons
         self.category_buttons_container = QWidget()
         tabs_layout = QHBoxLayout(self.category_buttons_container)
         tabs_layout.setSpacing(0)  # No spacing between category buttons
         tabs_layout.setContentsMargins(0, 0, 0, 0)
-        self.category_buttons = {}  # Store category buttons for visual feedback
         
-        for category in categories:
+        # Both button sets live in this layout, built once and shown in turn
+        # (see _show_category_buttons); category_buttons is the visible one
+        self._standard_cat_buttons = {}
+        self._kaomoji_cat_buttons = {}
+        self.category_buttons = self._ensure_standard_buttons()  # Store category buttons for visual feedback
+        
+        parent_layout.addWidget(self.category_buttons_container)
+    
+    def _ensure_standard_buttons(self):
+        """Get the standard category tab buttons, creating them on first use
+        
+        Returns:
+            dict: Category key -> QPushButton, in display order
+        """
+        buttons = self._standard_cat_buttons
+        if buttons:
+            return buttons
+        
+        tabs_layout = self.category_buttons_container.layout()
+        for category, category_name in _STANDARD_CATEGORY_NAMES.items():
             btn = QPushButton()
             btn.setFixedSize(60, 40)
-            
-            # Load icon - use emoji for 10 dynamic categories, SVG for special ones
-            if category in category_svg_icons:
-                # Load static SVG icon for special categories
-                svg_path = category_svg_icons[category]
-                icon = self.load_svg_icon_with_theme(svg_path, 32)
-                if icon:
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(32, 32))
-            elif category in self.category_emoji_codes:
-                # Load dynamic emoji icon for 10 main categories
-                emoji_code = self.category_emoji_codes[category]
-                icon = self.create_category_icon(emoji_code, 32)
-                if icon:
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(32, 32))
+            btn.setIconSize(QSize(32, 32))
             
             # Style for inactive buttons
-            btn.setStyleSheet(self.get_inactive_category_stylesheet())
+            _apply_stylesheet(btn, self.get_inactive_category_stylesheet())
             
             btn.clicked.connect(lambda checked, cat=category: self.on_category_click(cat))
-            btn.setToolTip(category_names[category])  # Add tooltip with category name
+            btn.setToolTip(category_name)  # Add tooltip with category name
             tabs_layout.addWidget(btn)
-            self.category_buttons[category] = btn
+            buttons[category] = btn
         
-        parent_layout.addWidget(self.category_buttons_container)
+        self._update_standard_button_icons()
+        return buttons
     
-    def create_kaomoji_category_tabs(self):
-        """Create category tab buttons specifically for Kaomoji package"""
-        # Clear existing category buttons
-        for button in list(self.category_buttons.values()):
-            try:
-                if button is not None:
-                    button.deleteLater()
-            except RuntimeError:
-                pass
-        self.category_buttons.clear()
-        
-        # Kaomoji categories with their emoji icons (using Segoe UI Emoji)
-        # Use OrderedDict-like list to maintain order, with Recent & Favorites first
-        kaomoji_categories = [
-            ("recent_favorites", {"name": "Recent & Favorites", "emoji": "❤️", "use_svg": True}),
-            ("happy", {"name": "Happy", "emoji": "😊", "use_svg": False}),
-            ("sad", {"name": "Sad", "emoji": "😢", "use_svg": False}),
-            ("angry", {"name": "Angry", "emoji": "😠", "use_svg": False}),
-            ("surprised", {"name": "Surprised", "emoji": "😲", "use_svg": False}),
-            ("confused", {"name": "Confused", "emoji": "😕", "use_svg": False}),
-            ("sleepy", {"name": "Sleepy", "emoji": "😴", "use_svg": False}),
-            ("greetings", {"name": "Greetings", "emoji": "👋", "use_svg": False}),
-            ("animals", {"name": "Animals", "emoji": "🐾", "use_svg": False}),
-            ("actions", {"name": "Actions", "emoji": "🏃", "use_svg": False}),
-            ("objects", {"name": "Misc", "emoji": "🎵", "use_svg": False}),
-            ("special", {"name": "Special", "emoji": "⭐", "use_svg": False})
-        ]
-        
-        # Get existing layout or create error
-        tabs_layout = self.category_buttons_container.layout()
-        if tabs_layout is None:
-            print("[ERROR] category_buttons_container has no layout! This should not happen.", file=sys.stderr)
-            return
-        
-        # Clear existing layout content
-        while tabs_layout.count():
-            item = tabs_layout.takeAt(0)
-            if item.widget():
-                try:
-                    item.widget().deleteLater()
-                except RuntimeError:
-                    pass
+    def _update_standard_button_icons(self):
+        """Load the standard category tab icons for the current package and theme"""
+        for category, btn in self._standard_cat_buttons.items():
+            # Load icon - use emoji for 10 dynamic categories, SVG for special ones
+            if category in _CATEGORY_SVG_FILES:
+                # Load static SVG icon for special categories
+                svg_path = self.path_manager.get_misc_file(_CATEGORY_SVG_FILES[category])
+                icon = self.load_svg_icon_with_theme(svg_path, 32)
+            else:
+                # Load dynamic emoji icon for 10 main categories
+                icon = self.create_category_icon(self.category_emoji_codes[category], 32)
+            if icon:
+                btn.setIcon(icon)
+    
+    def _ensure_kaomoji_buttons(self):
+        """Get the Kaomoji category tab buttons, creating them on first use
         
-        # Get project root for SVG icons
-        recent_favorites_svg = self.path_manager.get_misc_file("Recent_Favorites.svg")
+        Returns:
+            dict: Category key -> QPushButton, in display order
+        """
+        buttons = self._kaomoji_cat_buttons
+        if buttons:
+            return buttons
         
-        # Add Kaomoji category buttons to existing layout
-        for category_key, category_info in kaomoji_categories:
+        tabs_layout = self.category_buttons_container.layout()
+        for category_key, category_name, emoji in _KAOMOJI_CATEGORIES:
             btn = QPushButton()
             btn.setFixedSize(60, 40)
+            btn.setIconSize(QSize(32, 32))
             
-            # Check if we should use SVG icon
-            if category_info.get("use_svg", False) and category_key == "recent_favorites":
-                # Use SVG icon for Recent & Favorites (same as other packages)
-                icon = self.load_svg_icon_with_theme(recent_favorites_svg, 32)
-                if icon:
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(32, 32))
-            else:
-                # Create icon from emoji using system font rendering
-                emoji_code = category_info["emoji"]
-                emoji_pixmap = QPixmap(32, 32)
-                emoji_pixmap.fill(Qt.transparent)
-                painter = QPainter(emoji_pixmap)
-                painter.setRenderHint(QPainter.Antialiasing)
-                painter.setRenderHint(QPainter.TextAntialiasing)
-                
-                # Use Segoe UI Emoji font with smaller size to prevent clipping
-                emoji_font = QFont("Segoe UI Emoji", 16)
-                painter.setFont(emoji_font)
-                painter.drawText(emoji_pixmap.rect(), Qt.AlignCenter, emoji_code)
-                painter.end()
-                
-                icon = QIcon(emoji_pixmap)
-                btn.setIcon(icon)
-                btn.setIconSize(QSize(32, 32))
+            # Recent & Favorites gets its themed SVG icon when the buttons are shown,
+            # the others an icon drawn from their emoji using system font rendering
+            if emoji is not None:
+                btn.setIcon(self._get_kaomoji_tab_icon(emoji))
             
             # Style for inactive buttons
-            btn.setStyleSheet(self.get_inactive_category_stylesheet())
+            _apply_stylesheet(btn, self.get_inactive_category_stylesheet())
             
             btn.clicked.connect(lambda checked, cat=category_key: self.on_kaomoji_category_click(cat))
-            btn.setToolTip(category_info["name"])
+            btn.setToolTip(category_name)
+            btn.hide()
             tabs_layout.addWidget(btn)
-            self.category_buttons[category_key] = btn
+            buttons[category_key] = btn
+        
+        return buttons
+    
+    def _show_category_buttons(self, buttons):
+        """Show one set of category tab buttons and hide the other
+        
+        Args:
+            buttons: Standard or Kaomoji category buttons (becomes category_buttons)
+        """
+        for other in (self._standard_cat_buttons, self._kaomoji_cat_buttons):
+            if other is not buttons:
+                for btn in other.values():
+                    btn.hide()
+        for btn in buttons.values():
+            btn.show()
+        self.category_buttons = buttons
+        
+        # The theme and active category may have changed while the buttons were hidden
+        self.update_category_button_styles(self.current_category)
+    
+    def create_kaomoji_category_tabs(self):
+        """Show the category tab buttons of the Kaomoji package"""
+        buttons = self._ensure_kaomoji_buttons()
+        
+        # Use SVG icon for Recent & Favorites (same as other packages, follows the theme)
+        icon = self.load_svg_icon_with_theme(self.path_manager.get_misc_file("Recent_Favorites.svg"), 32)
+        if icon:
+            buttons["recent_favorites"].setIcon(icon)
+        
+        self._show_category_buttons(buttons)
         
         # Show the container
         self.category_buttons_container.show()
@@ -2192,89 +2737,40 @@ class EmojiPicker(QMainWindow):
         else:
             self.clear_recent_button.hide()
     
-    def restore_standard_category_tabs(self):
-        """Restore standard emoji category tab buttons after Kaomoji"""
-        # Clear existing category buttons
-        for button in list(self.category_buttons.values()):
-            try:
-                if button is not None:
-                    button.deleteLater()
-            except RuntimeError:
-                pass
-        self.category_buttons.clear()
-        
-        # Get existing layout
-        tabs_layout = self.category_buttons_container.layout()
-        if tabs_layout is None:
-            print("[ERROR] category_buttons_container has no layout! This should not happen.", file=sys.stderr)
-            return
-        
-        # Clear existing layout content
-        while tabs_layout.count():
-            item = tabs_layout.takeAt(0)
-            if item.widget():
-                try:
-                    item.widget().deleteLater()
-                except RuntimeError:
-                    pass
+    def _get_kaomoji_tab_icon(self, emoji):
+        """Get the icon of a Kaomoji category tab, drawn once per emoji
         
-        # Standard categories
-        categories = ["Recent & Favorites", "activities", "animals-nature", "component", "flags", 
-                     "food-drink", "objects", "people-body", "smileys-emotion", 
-                     "symbols", "travel-places", "extras-openmoji", "extras-unicode"]
-        
-        # SVG icons for special categories
-        category_svg_icons = {
-            "Recent & Favorites": self.path_manager.get_misc_file("Recent_Favorites.svg"),
-            "extras-openmoji": self.path_manager.get_misc_file("extras_OpenMoji.svg"),
-            "extras-unicode": self.path_manager.get_misc_file("extras_Unicode.svg")
-        }
-        category_names = {
-            "Recent & Favorites": "Recent & Favorites",
-            "activities": "Activities",
-            "animals-nature": "Animals & Nature",
-            "component": "Component",
-            "flags": "Flags",
-            "food-drink": "Food & Drink",
-            "objects": "Objects",
-            "people-body": "People & Body",
-            "smileys-emotion": "Smileys & Emotion",
-            "symbols": "Symbols",
-            "travel-places": "Travel & Places",
-            "extras-openmoji": "Extras OpenMoji",
-            "extras-unicode": "Extras Unicode"
-        }
+        Args:
+            emoji: Emoji character shown on the tab
         
-        # Create standard category buttons
-        for category in categories:
-            btn = QPushButton()
-            btn.setFixedSize(60, 40)
-            
-            # Load icon - use emoji for 10 dynamic categories, SVG for special ones
-            if category in category_svg_icons:
-                svg_path = category_svg_icons[category]
-                icon = self.load_svg_icon_with_theme(svg_path, 32)
-                if icon:
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(32, 32))
-            elif category in self.category_emoji_codes:
-                emoji_code = self.category_emoji_codes[category]
-                icon = self.create_category_icon(emoji_code, 32)
-                if icon:
-                    btn.setIcon(icon)
-                    btn.setIconSize(QSize(32, 32))
+        Returns:
+            QIcon: Emoji drawn with Segoe UI Emoji (theme independent, so the
+                icons are reused every time the Kaomoji tabs are rebuilt)
+        """
+        icon = self._kaomoji_tab_icons.get(emoji)
+        if icon is None:
+            emoji_pixmap = QPixmap(32, 32)
+            emoji_pixmap.fill(Qt.transparent)
+            painter = QPainter(emoji_pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setRenderHint(QPainter.TextAntialiasing)
             
-            # Style for inactive buttons
-            btn.setStyleSheet(self.get_inactive_category_stylesheet())
+            # Use Segoe UI Emoji font with smaller size to prevent clipping
+            painter.setFont(self._get_qfont("Segoe UI Emoji", 16))
+            painter.drawText(emoji_pixmap.rect(), Qt.AlignCenter, emoji)
+            painter.end()
             
-            btn.clicked.connect(lambda checked, cat=category: self.on_category_click(cat))
-            btn.setToolTip(category_names[category])
-            tabs_layout.addWidget(btn)
-            self.category_buttons[category] = btn
+            icon = self._kaomoji_tab_icons[emoji] = QIcon(emoji_pixmap)
+        return icon
+    
+    def restore_standard_category_tabs(self):
+        """Restore standard emoji category tab buttons after Kaomoji"""
+        # Icons follow the current package and theme
+        self._ensure_standard_buttons()
+        self._update_standard_button_icons()
         
-        # Update category button styles to show current category
-        if hasattr(self, 'current_category') and self.current_category in self.category_buttons:
-            self.update_category_button_styles(self.current_category)
+        # Also updates the category button styles to show the current category
+        self._show_category_buttons(self._standard_cat_buttons)
         
         # Show the container
         self.category_buttons_container.show()
@@ -2369,9 +2865,9 @@ class EmojiPicker(QMainWindow):
         
         # Style based on current selection
         if self.current_subcategory == "recent":
-            recent_btn.setStyleSheet(self.get_active_button_stylesheet())
+            _apply_stylesheet(recent_btn, self.get_active_button_stylesheet())
         else:
-            recent_btn.setStyleSheet(self.get_inactive_button_stylesheet())
+            _apply_stylesheet(recent_btn, self.get_inactive_button_stylesheet())
         
         recent_btn.clicked.connect(lambda: self.on_subcategory_click(self.current_category, "recent"))
         self.subcategory_buttons["recent"] = recent_btn
@@ -2386,9 +2882,9 @@ class EmojiPicker(QMainWindow):
         
         # Style based on current selection
         if self.current_subcategory == "favorites":
-            favorites_btn.setStyleSheet(self.get_active_button_stylesheet())
+            _apply_stylesheet(favorites_btn, self.get_active_button_stylesheet())
         else:
-            favorites_btn.setStyleSheet(self.get_inactive_button_stylesheet())
+            _apply_stylesheet(favorites_btn, self.get_inactive_button_stylesheet())
         
         favorites_btn.clicked.connect(lambda: self.on_subcategory_click(self.current_category, "favorites"))
         self.subcategory_buttons["favorites"] = favorites_btn
@@ -2403,9 +2899,9 @@ class EmojiPicker(QMainWindow):
         
         # Style based on current selection
         if self.current_subcategory == "frequently_used":
-            frequently_used_btn.setStyleSheet(self.get_active_button_stylesheet())
+            _apply_stylesheet(frequently_used_btn, self.get_active_button_stylesheet())
         else:
-            frequently_used_btn.setStyleSheet(self.get_inactive_button_stylesheet())
+            _apply_stylesheet(frequently_used_btn, self.get_inactive_button_stylesheet())
         
         frequently_used_btn.clicked.connect(lambda: self.on_subcategory_click(self.current_category, "frequently_used"))
         self.subcategory_buttons["frequently_used"] = frequently_used_btn
@@ -2579,12 +3075,12 @@ class EmojiPicker(QMainWindow):
                 
                 # Special styling for "All" button
                 if info["subcat_name"] is None:
-                    btn.setStyleSheet(self.get_active_button_stylesheet())
+                    _apply_stylesheet(btn, self.get_active_button_stylesheet())
                     btn.clicked.connect(lambda checked=False, cat=category: self.on_subcategory_click(cat, None))
                     btn.setToolTip("Show all emojis in this category")
                     self.subcategory_buttons["All"] = btn
                 else:
-                    btn.setStyleSheet(self.get_inactive_button_stylesheet())
+                    _apply_stylesheet(btn, self.get_inactive_button_stylesheet())
                     subcat_name = info["subcat_name"]
                     btn.clicked.connect(lambda checked=False, cat=category, sub=subcat_name: self.on_subcategory_click(cat, sub))
                     btn.setToolTip(f"Filter by {info['text']}")
@@ -2611,7 +3107,7 @@ class EmojiPicker(QMainWindow):
         for item_name, btn in buttons_dict.items():
             # Use special case logic if provided, otherwise simple equality check
             is_active = special_case(item_name, active_item) if special_case else (item_name == active_item)
-            btn.setStyleSheet(active_style if is_active else inactive_style)
+            _apply_stylesheet(btn, active_style if is_active else inactive_style)
     
     def update_subcategory_button_styles(self, active_subcategory):
         """Update visual styles for subcategory buttons"""
@@ -2751,9 +3247,9 @@ class EmojiPicker(QMainWindow):
                 btn.setCursor(Qt.PointingHandCursor)
                 
                 if self.current_category == info["category_key"] and self.current_subcategory == info["subcat_key"]:
-                    btn.setStyleSheet(self.get_active_button_stylesheet())
+                    _apply_stylesheet(btn, self.get_active_button_stylesheet())
                 else:
-                    btn.setStyleSheet(self.get_inactive_button_stylesheet())
+                    _apply_stylesheet(btn, self.get_inactive_button_stylesheet())
                 
                 category_key = info["category_key"]
                 subcat_key = info["subcat_key"]
@@ -2883,9 +3379,9 @@ class EmojiPicker(QMainWindow):
                 
                 # Set initial style
                 if self.current_category == info["category_key"] and self.current_subcategory == info["subcat_key"]:
-                    btn.setStyleSheet(self.get_active_button_stylesheet())
+                    _apply_stylesheet(btn, self.get_active_button_stylesheet())
                 else:
-                    btn.setStyleSheet(self.get_inactive_button_stylesheet())
+                    _apply_stylesheet(btn, self.get_inactive_button_stylesheet())
                 
                 # Connect click handler
                 category_key = info["category_key"]
@@ -2992,7 +3488,7 @@ class EmojiPicker(QMainWindow):
         for tab_key, btn in self.kaomoji_tab_buttons.items():
             cat_key, sub_key = tab_key.split('_', 1)
             is_active = (cat_key == self.current_category and sub_key == self.current_subcategory)
-            btn.setStyleSheet(active_style if is_active else inactive_style)
+            _apply_stylesheet(btn, active_style if is_active else inactive_style)
     
     def get_recent_favorites_tab_to_display(self):
         """Get the tab to display for Recent & Favorites category
@@ -3167,47 +3663,20 @@ class EmojiPicker(QMainWindow):
                 else:
                     file_extension = '.png'
                 
-                # Get all files with the selected extension
-                custom_files = []
-                for filename in os.listdir(self.emoji_folder):
-                    if filename.lower().endswith(file_extension):
-                        custom_files.append(filename)
-                
-                # Sort files for consistent display
-                custom_files.sort()
+                # Get all files with the selected extension (already sorted for consistent
+                # display; the folder is scanned again by the Refresh button)
+                custom_files = self._folder_files_by_extension(self.emoji_folder).get(file_extension, ())
                 
-                # Create emoji buttons for each file
+                # Queue emoji buttons for each file, created once their row gets near the viewport
                 self.calculate_emojis_per_row()
                 row = 0
                 col = 0
                 
                 for filename in custom_files:
                     self.current_emojis.append(filename)
-                    
-                    # Create emoji button for custom file
-                    btn = DoubleClickButton()
-                    btn.setFixedSize(self.emoji_size, self.emoji_size)
-                    btn.setMinimumSize(self.emoji_size, self.emoji_size)
-                    btn.setMaximumSize(self.emoji_size, self.emoji_size)
-                    
-                    # Load image for custom emoji
-                    image_path = os.path.join(self.emoji_folder, filename)
-                    icon = self.create_custom_emoji_icon(image_path, self.emoji_size)
-                    if icon:
-                        btn.setIcon(icon)
-                        btn.setIconSize(QSize(self.emoji_size, self.emoji_size))
-                    
-                    # Set button styling
-                    btn.setStyleSheet(self.get_emoji_button_stylesheet())
-                    btn.setFocusPolicy(Qt.NoFocus)
-                    
-                    # Connect click handlers
-                    btn.clicked.connect(lambda checked, f=filename, b=btn: self.on_custom_emoji_click(f, b))
-                    btn.doubleClicked.connect(lambda f=filename, b=btn: self.on_custom_emoji_double_click(f, b))
-                    btn.shiftClicked.connect(lambda f=filename, b=btn: self.on_custom_emoji_shift_click(f, b))
-                    
-                    # Add to grid
-                    self.emoji_layout.addWidget(btn, row, col)
+                    self._pending_emoji_buttons.append(
+                        (row, self.create_custom_emoji_button, (filename, row, col))
+                    )
                     
                     # Move to next position
                     col += 1
@@ -3215,8 +3684,9 @@ class EmojiPicker(QMainWindow):
                         col = 0
                         row += 1
             
-            # Update widget size
+            # Update widget size and create the buttons of the rows in view
             self.update_emoji_widget_size()
+            self._materialize_visible_rows()
             self.update_action_buttons_state()
             
             # Update displayed emojis counter for Custom category
@@ -3255,10 +3725,12 @@ class EmojiPicker(QMainWindow):
             for item in kaomojis:
                 # Check if this item is an emoji or a kaomoji
                 if not self.is_kaomoji_text(item):
-                    # This is a real emoji, use standard emoji button (48x48)
+                    # This is a real emoji, use standard emoji button (48x48),
+                    # created once its row gets near the viewport
                     self.current_emojis.append(item)
-                    btn = self.create_emoji_button(item, row, col)
-                    btn.shiftClicked.connect(lambda e=item, b=btn: self.on_emoji_shift_click(e, b))
+                    self._pending_emoji_buttons.append(
+                        (row, self.create_emoji_button, (item, row, col, True, None))
+                    )
                     
                     # Move to next position (emoji takes 1 column)
                     col += 1
@@ -3270,6 +3742,10 @@ class EmojiPicker(QMainWindow):
                 # This is a kaomoji text, create kaomoji button with fixed size tiers
                 self.current_emojis.append(item)
                 
+                # Kaomoji buttons are created right away (their width decides the wrapping),
+                # so create the pending emoji buttons before them to keep the rows filled in order
+                self._materialize_emoji_buttons(row)
+                
                 # Create kaomoji button using utility method
                 btn, colspan = self.create_kaomoji_button(item, row, col)
                 
@@ -3287,8 +3763,9 @@ class EmojiPicker(QMainWindow):
                     col = 0
                     row += 1
             
-            # Update widget size
+            # Update widget size and create the buttons of the rows in view
             self.update_emoji_widget_size()
+            self._materialize_visible_rows()
             self.update_action_buttons_state()
             
             # Update displayed emojis counter
@@ -3351,6 +3828,10 @@ class EmojiPicker(QMainWindow):
             
             # Check if this is a kaomoji text (display as kaomoji in all packages)
             if self.is_kaomoji_text(emoji):
+                # Kaomoji buttons are created right away (their width decides the wrapping),
+                # so create the pending emoji buttons before them to keep the rows filled in order
+                self._materialize_emoji_buttons(row)
+                
                 # This is a kaomoji text, create kaomoji button with fixed size tiers (works in all packages)
                 btn, colspan = self.create_kaomoji_button(emoji, row, col)
                 
@@ -3368,11 +3849,11 @@ class EmojiPicker(QMainWindow):
                     col = 0
                     row += 1
             else:
-                # Create emoji button using utility method
-                btn = self.create_emoji_button(emoji, row, col)
-                
-                # Add shift click handler (not in create_emoji_button to avoid duplication in search)
-                btn.shiftClicked.connect(lambda e=emoji, b=btn: self.on_emoji_shift_click(e, b))
+                # Queue the emoji button, it is created once its row gets near the viewport
+                # (with a shift click handler, unlike in search)
+                self._pending_emoji_buttons.append(
+                    (row, self.create_emoji_button, (emoji, row, col, True, None))
+                )
                 
                 # Move to next position (regular emoji, 1 column)
                 col += 1
@@ -3383,6 +3864,9 @@ class EmojiPicker(QMainWindow):
         # Update the widget size to accommodate all emojis
         self.update_emoji_widget_size()
         
+        # Create the buttons of the rows in view
+        self._materialize_visible_rows()
+        
         # Update action buttons state based on emoji presence
         self.update_action_buttons_state()
     
@@ -3417,12 +3901,15 @@ class EmojiPicker(QMainWindow):
                 elif self.variation_filter == "without_variations" and has_variations:
                     continue  # Skip emojis with variations
                 
-                emoji_name = self.get_emoji_name(emoji).lower()
-                if search_text in emoji_name or search_text in emoji or search_text in emoji_code.lower():
+                emoji_name = self.get_emoji_name(emoji)
+                if search_text in emoji_name.lower() or search_text in emoji or search_text in emoji_code.lower():
                     self.current_emojis.append(emoji)
                     
-                    # Create emoji button using utility method
-                    self.create_emoji_button(emoji, row, col)
+                    # Queue the emoji button, it is created once its row gets near the viewport
+                    # (with the name already looked up for matching, reused as its tooltip)
+                    self._pending_emoji_buttons.append(
+                        (row, self.create_emoji_button, (emoji, row, col, False, emoji_name))
+                    )
                     
                     # Move to next position
                     col += 1
@@ -3433,6 +3920,9 @@ class EmojiPicker(QMainWindow):
         # Update the widget size to accommodate all emojis
         self.update_emoji_widget_size()
         
+        # Create the buttons of the rows in view
+        self._materialize_visible_rows()
+        
         # Update action buttons state based on emoji presence
         self.update_action_buttons_state()
         
@@ -3444,6 +3934,11 @@ class EmojiPicker(QMainWindow):
         # Reset selected button reference as all buttons will be destroyed
         self.selected_emoji_button = None
         
+        # Drop the buttons of the previous grid that were never created
+        self._pending_emoji_buttons = []
+        self._pending_emoji_index = 0
+        self._prefetch_timer.stop()
+        
         for i in reversed(range(self.emoji_layout.count())):
             child = self.emoji_layout.itemAt(i).widget()
             if child:
@@ -3452,6 +3947,61 @@ class EmojiPicker(QMainWindow):
                 except RuntimeError:
                     pass  # Widget already deleted
     
+    def _materialize_emoji_buttons(self, last_row):
+        """Create the pending emoji buttons up to a grid row
+        
+        Args:
+            last_row: Last grid row whose buttons must exist
+        """
+        pending = self._pending_emoji_buttons
+        index = self._pending_emoji_index
+        while index < len(pending) and pending[index][0] <= last_row:
+            _, build, args = pending[index]
+            build(*args)
+            index += 1
+        self._pending_emoji_index = index
+    
+    def _materialize_visible_rows(self, *args):
+        """Create the pending emoji buttons of the rows in the viewport plus a small overscan
+        
+        Note:
+            Connected to the vertical scroll bar's valueChanged and rangeChanged.
+            Rows are always created from the top, so the filled rows of the grid
+            stay contiguous and the layout places them at their final position.
+            The widget size is computed from current_emojis, so the scroll range
+            already covers the rows that are not created yet.
+        """
+        if self._pending_emoji_index >= len(self._pending_emoji_buttons):
+            return
+        
+        self._materialize_emoji_buttons(self._last_visible_row() + _GRID_OVERSCAN_ROWS)
+        
+        # Keep creating the next rows while the application is idle
+        if self._pending_emoji_index < len(self._pending_emoji_buttons):
+            self._prefetch_timer.start()
+    
+    def _last_visible_row(self):
+        """Get the grid row at the bottom of the scroll viewport"""
+        row_height = self.emoji_size + 1  # Button size + grid spacing
+        bottom = self.emoji_scroll_area.verticalScrollBar().value() + self.emoji_scroll_area.viewport().height()
+        return bottom // row_height
+    
+    def _prefetch_emoji_row(self):
+        """Create the next pending row of emoji buttons ahead of the viewport
+        
+        Note:
+            Runs from a zero-interval timer, so rows are rendered one at a time
+            between user events instead of blocking the UI. Stops once the
+            grid is complete or _GRID_PREFETCH_ROWS rows below the viewport exist;
+            scrolling restarts it (see _materialize_visible_rows).
+        """
+        pending = self._pending_emoji_buttons
+        index = self._pending_emoji_index
+        if index >= len(pending) or pending[index][0] > self._last_visible_row() + _GRID_PREFETCH_ROWS:
+            self._prefetch_timer.stop()
+            return
+        self._materialize_emoji_buttons(pending[index][0])
+    
     def update_emoji_widget_size(self):
         """Update the emoji widget size to accommodate all emojis"""
         # Calculate the required size based on the number of emojis
@@ -3522,11 +4072,8 @@ class EmojiPicker(QMainWindow):
             # Clear icon cache for the previous package
             self.cache_manager.clear()
             
-            # Also clear OpenMoji TTF font cache
-            self.openmoji_ttf_fonts.clear()
-            
-            # Also clear Noto TTF font cache
-            self.google_noto_ttf_fonts.clear()
+            # Also resolve the TTF fonts again for the current color mode
+            self._recompute_font_props()
             
             # Update radio buttons state based on package type
             self.update_radio_buttons_for_package()
@@ -3540,7 +4087,7 @@ class EmojiPicker(QMainWindow):
                 # Restore standard category tabs (in case coming from Kaomoji)
                 self.restore_standard_category_tabs()
                 # Reset to default category if coming from Kaomoji
-                if not hasattr(self, 'current_category') or self.current_category not in ["Recent & Favorites", "activities", "animals-nature", "component", "flags", "food-drink", "objects", "people-body", "smileys-emotion", "symbols", "travel-places", "extras-openmoji", "extras-unicode"]:
+                if not hasattr(self, 'current_category') or self.current_category not in _STANDARD_CATEGORY_NAMES:
                     self.current_category = "Recent & Favorites"
                 
                 # Apply user's preferred default tab when on Recent & Favorites
@@ -3701,10 +4248,9 @@ class EmojiPicker(QMainWindow):
         
         button_height = self.emoji_size
         
+        # setFixedSize() also sets the minimum and maximum size
         btn.setFixedSize(button_width, button_height)
-        btn.setMinimumSize(button_width, button_height)
-        btn.setMaximumSize(button_width, button_height)
-        btn.setStyleSheet(self.get_emoji_button_stylesheet())
+        _apply_stylesheet(btn, self.get_emoji_button_stylesheet())
         btn.setFocusPolicy(Qt.NoFocus)
         
         # Add tooltip with kaomoji
@@ -3779,10 +4325,10 @@ class EmojiPicker(QMainWindow):
         
         # Reset previously selected button to normal style
         if self.selected_emoji_button and self.selected_emoji_button != button:
-            self.selected_emoji_button.setStyleSheet(self.get_emoji_button_stylesheet())
+            _apply_stylesheet(self.selected_emoji_button, self.get_emoji_button_stylesheet())
         
         # Set new selected button to selected style
-        button.setStyleSheet(self.get_button_selected_stylesheet())
+        _apply_stylesheet(button, self.get_button_selected_stylesheet())
         self.selected_emoji_button = button
         self.selected_emoji = emoji
         
@@ -3837,21 +4383,29 @@ class EmojiPicker(QMainWindow):
         """Save recent emojis to JSON file"""
         self.data_manager.save_data('recent', self.recent_emojis)
     
-    def update_emoji_folder(self):
-        """Update emoji folder based on current radio button selections"""
+    def update_emoji_folder(self, refresh=True):
+        """Update emoji folder based on current radio button selections
+        
+        Args:
+            refresh: Whether to refresh the display for TTF and Custom (False when
+                the caller populates the grid itself once everything is set up)
+        """
         # Check if TTF is selected - TTF doesn't use folders
         if self.ttf_radio.isChecked():
             # For TTF format, just clear cache and refresh display
             self.cache_manager.clear()
-            self.refresh_emoji_display()
+            if refresh:
+                self.refresh_emoji_display()
             return
         
         # Handle Custom package - uses the custom folder directly
         if self.current_emoji_package == "Custom":
             # For Custom, emoji_folder is already set to the custom folder
-            # Just clear cache and recreate mapping
+            # Just clear cache and rescan it (the user may have added files)
             self.cache_manager.clear()
-            self.refresh_emoji_display()
+            self.forget_folder_listing(self.emoji_folder)
+            if refresh:
+                self.refresh_emoji_display()
             return
         
         # Handle Twemoji package which has different folder structure (no color/black variants)
@@ -3894,12 +4448,16 @@ class EmojiPicker(QMainWindow):
         
         # Check if the path key exists using path_manager
         try:
-            old_folder = self.emoji_folder
             self.emoji_folder = self.path_manager.get_path(folder_key)
             
-            # Clear cache entries for old folder to free memory
-            if old_folder != self.emoji_folder:
-                self.cache_manager.clear(lambda k: k[2] == old_folder)
+            # Rescan the folder on first lookup, as its files may have changed.
+            # Icons of other folders stay cached: their keys include the folder,
+            # so switching back (e.g. 72 px <-> 618 px) reuses them, and the
+            # cache size is bounded anyway
+            self.forget_folder_listing(self.emoji_folder)
+            if self.current_emoji_package == "EmojiTwo":
+                # Fallback folder of get_emoji_image_path for missing size files
+                self.forget_folder_listing(self.path_manager.get_path(f"emojitwo_{color_mode}_default_png"))
             
             # Recreate emoji mapping with new folder
             self.emoji_to_filename, self.compound_emoji_variations = self.emoji_manager.create_emoji_mapping(self.emoji_folder)
@@ -3967,11 +4525,7 @@ class EmojiPicker(QMainWindow):
     
     def on_color_black_change(self, button):
         """Handle color/black radio button change"""
-        # Clear OpenMoji TTF font cache to force reloading the correct variant
-        self.openmoji_ttf_fonts.clear()
-        
-        # Also clear Noto TTF font cache to force reloading the correct variant
-        self.google_noto_ttf_fonts.clear()
+        # TTF font names and paths are resolved again by color_radio.toggled
         
         # Clear icon cache to force regeneration of category button icons with new color/black variant
         self.cache_manager.clear()
@@ -4085,7 +4639,7 @@ class EmojiPicker(QMainWindow):
             button.setEnabled(enabled)
             if checked is not None:
                 button.setChecked(checked)
-            button.setStyleSheet(self.get_disabled_radio_stylesheet() if style == "disabled" else "")
+            _apply_stylesheet(button, self.get_disabled_radio_stylesheet() if style == "disabled" else "")
     
     
     def update_radio_buttons_for_package(self):
@@ -4311,8 +4865,8 @@ class EmojiPicker(QMainWindow):
             )
         else:
             self.contrast_button.setStyleSheet(tooltip_style)
-        # Clear cache to force reload of emojis with new color inversion
-        self.cache_manager.clear()
+        # No cache clearing needed: the contrast state is part of the icon cache key,
+        # so toggling back reuses the icons rendered before
         # Refresh display with inverted colors
         self.refresh_emoji_display()
     
@@ -4431,11 +4985,12 @@ class EmojiPicker(QMainWindow):
                 clipboard = QApplication.clipboard()
                 pixmap = None
                 
-                # Load image based on file type
-                if file_ext == '.png' and os.path.exists(file_path):
+                # Load image based on file type (missing files give a null pixmap
+                # or an invalid renderer)
+                if file_ext == '.png':
                     # Load PNG directly
                     pixmap = QPixmap(file_path)
-                elif file_ext == '.svg' and os.path.exists(file_path):
+                elif file_ext == '.svg':
                     # Render SVG to pixmap
                     svg_renderer = QSvgRenderer(file_path)
                     if svg_renderer.isValid():
@@ -4527,9 +5082,27 @@ class EmojiPicker(QMainWindow):
             self.add_favorite_button.setFixedSize(130, 30)
             self.reconnect_signal(self.add_favorite_button.clicked, self.add_to_favorites)
     
+    def _get_reusable_dialog(self, dialog, dialog_class):
+        """Get a dialog built on an earlier open, or build it
+        
+        Args:
+            dialog: Dialog built before, or None
+            dialog_class: Dialog class, taking the main window as parent
+        
+        Returns:
+            The dialog to show, rebuilt only if the theme or accent color
+            changed since it was built (both are applied at construction)
+        """
+        if (dialog is None or dialog.current_theme != self.current_theme
+                or dialog.category_subcategory_color != self.category_subcategory_color):
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = dialog_class(self)
+        return dialog
+    
     def show_hotkeys_dialog(self):
-        """Show Hotkeys dialog"""
-        dialog = HotkeysDialog(self)
+        """Show Hotkeys dialog (built on first open, then reused)"""
+        dialog = self._hotkeys_dialog = self._get_reusable_dialog(self._hotkeys_dialog, HotkeysDialog)
         dialog.exec_()
     
     def show_settings_dialog(self):
@@ -4540,8 +5113,8 @@ class EmojiPicker(QMainWindow):
             self.data_manager.save_data('save_preferences', self.save_preferences)
     
     def show_about_dialog(self):
-        """Show About dialog"""
-        dialog = AboutDialog(self)
+        """Show About dialog (built on first open, then reused)"""
+        dialog = self._about_dialog = self._get_reusable_dialog(self._about_dialog, AboutDialog)
         dialog.exec_()
     
     def wheelEvent(self, event):
@@ -4567,6 +5140,8 @@ class EmojiPicker(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         self.save_recent_emojis()
+        # Keep the icon disk cache within its size limit
+        self.disk_cache_manager.prune()
         event.accept()
     
     
@@ -4581,19 +5156,12 @@ class EmojiPicker(QMainWindow):
         if not os.path.exists(custom_folder):
             return
         
-        # Check for available file formats in the custom folder
-        try:
-            for filename in os.listdir(custom_folder):
-                filename_lower = filename.lower()
-                if filename_lower.endswith('.png'):
-                    self.custom_emoji_formats_available["png"] = True
-                elif filename_lower.endswith('.svg'):
-                    self.custom_emoji_formats_available["svg"] = True
-                elif filename_lower.endswith('.ttf'):
-                    self.custom_emoji_formats_available["ttf"] = True
-        except Exception:
-            # If error reading folder, just keep defaults (all False)
-            pass
+        # Check for available file formats in the custom folder, scanned again as the
+        # user may have added files (a folder that cannot be read has no files)
+        self.forget_folder_listing(custom_folder)
+        files_by_extension = self._folder_files_by_extension(custom_folder)
+        for file_format in self.custom_emoji_formats_available:
+            self.custom_emoji_formats_available[file_format] = f".{file_format}" in files_by_extension
     
     def update_category_visibility(self, visible):
         """Show or hide category and subcategory buttons based on package type
@@ -4639,6 +5207,10 @@ class EmojiPicker(QMainWindow):
     
     def refresh_custom_emojis(self):
         """Refresh custom emojis folder and detect new formats"""
+        # Rescan the folders and look for the package fonts again (including the
+        # ones not found so far)
+        self.refresh_fonts()
+        
         # Re-detect available formats in custom folder (in case user added new files)
         self.detect_custom_emoji_formats()
         
@@ -4674,9 +5246,7 @@ class EmojiPicker(QMainWindow):
         
         icon = None
         
-        if not os.path.exists(image_path):
-            return None
-        
+        # Missing files are reported by the loaders (invalid renderer / null pixmap)
         file_ext = os.path.splitext(image_path)[1].lower()
         
         # Handle different file types
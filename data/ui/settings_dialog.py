@@ -15,9 +15,9 @@ import platform
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
                              QCheckBox, QLabel, QApplication, QComboBox, QStyle, QStyleOptionButton, QFrame)
 from PyQt5.QtCore import Qt, QRect
-from PyQt5.QtGui import QFont, QIcon, QColor, QPainter, QPen
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen
 from managers import ThemeManager, PathManager
-from ui.base_dialog import ThemedColorDialog, ThemedDialogMixin
+from ui.base_dialog import ThemedColorDialog, ThemedDialogMixin, get_misc_icon
 
 
 class CheckBoxWithCheckmark(QCheckBox):
@@ -106,9 +106,9 @@ class SettingsDialog(ThemedDialogMixin, QDialog):
         self.setFixedSize(900, 620)
         
         # Set window icon
-        icon_path = self.path_manager.get_misc_file("Kitty-Head.svg")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        window_icon = get_misc_icon(self.path_manager, "Kitty-Head.svg")
+        if window_icon is not None:
+            self.setWindowIcon(window_icon)
         
         # Get current theme and store initial theme for cancel operation
         self.current_theme = 'Light'